@@ -1,33 +1,36 @@
 """CLI interface for MEO using Typer"""
 
+import os
+import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
 from meo import __version__
-from meo.core.config import (
-    load_config,
-    create_config,
-    config_exists,
-    get_config_path,
-    ConfigNotFoundError,
-    ConfigInvalidError,
-)
-from meo.presets import BUILTIN_PRESETS
+
+# Rich, config, presets and core modules are imported inside the commands
+# that use them so `meo --version` and `meo --help` stay cheap.
 
 app = typer.Typer(
     name="meo",
     help="Markdown Edit Orchestrator - TUI tool for structured markdown editing",
     invoke_without_command=True,
 )
-console = Console()
+
+
+@lru_cache(maxsize=1)
+def _console():
+    """Get the shared Rich console (created on first use)"""
+    from rich.console import Console
+
+    return Console()
 
 
 def version_callback(value: bool):
     if value:
-        console.print(f"meo version {__version__}")
+        _console().print(f"meo version {__version__}")
         raise typer.Exit()
 
 
@@ -50,10 +53,52 @@ def main(
     _run_file_picker()
 
 
+_file_picker_app_cls = None
+
+
+def _get_file_picker_app_cls():
+    """Get the file picker App class, defining it (and importing Textual) on first use"""
+    global _file_picker_app_cls
+    if _file_picker_app_cls is None:
+        from textual.app import App
+        from meo.tui.screens.file_picker import FilePickerScreen
+
+        class FilePickerApp(App):
+            """Minimal app hosting the file picker screen"""
+
+            CSS = """
+            Screen {
+                background: $surface;
+            }
+            #header {
+                padding: 1 2;
+            }
+            #help {
+                padding: 0 2;
+                color: $text-muted;
+            }
+            #file-list {
+                margin: 1 2;
+                height: 1fr;
+            }
+            """
+
+            def __init__(self, config):
+                super().__init__()
+                self._config = config
+
+            def on_mount(self):
+                self.push_screen(FilePickerScreen(self._config))
+
+        _file_picker_app_cls = FilePickerApp
+    return _file_picker_app_cls
+
+
 def _run_file_picker():
     """Load config and launch file picker TUI"""
-    from textual.app import App
-    from meo.tui.screens.file_picker import FilePickerScreen
+    from meo.core.config import load_config, ConfigNotFoundError, ConfigInvalidError
+
+    console = _console()
 
     # Load config
     try:
@@ -72,34 +117,12 @@ def _run_file_picker():
         raise typer.Exit(1)
 
     # Check for markdown files
-    files = config.get_markdown_files()
-    if not files:
+    if not config.has_markdown_files():
         console.print(f"[yellow]No .md files found in:[/yellow] {config.folder}")
         raise typer.Exit(1)
 
-    # Create and run a minimal app with file picker
-    class FilePickerApp(App):
-        CSS = """
-        Screen {
-            background: $surface;
-        }
-        #header {
-            padding: 1 2;
-        }
-        #help {
-            padding: 0 2;
-            color: $text-muted;
-        }
-        #file-list {
-            margin: 1 2;
-            height: 1fr;
-        }
-        """
-
-        def on_mount(self):
-            self.push_screen(FilePickerScreen(config))
-
-    app_instance = FilePickerApp()
+    # Textual is only imported once we know the picker will actually open
+    app_instance = _get_file_picker_app_cls()(config)
     selected_file = app_instance.run()
 
     if selected_file:
@@ -113,18 +136,16 @@ def _run_meo_app(source_file: Path):
     """Launch the main MEO TUI app for editing"""
     from meo.tui.app import MeoApp
     from meo.models.project import ProjectState
-    from meo.core.sidecar import load_sidecar
-    import hashlib
+    from meo.core.sidecar import load_sidecar, set_source_fingerprint
+
+    console = _console()
 
     # Load or create project state
     state = load_sidecar(source_file)
     if state is None:
         # Create new state
-        content = source_file.read_text()
-        state = ProjectState(
-            source_file=str(source_file),
-            source_hash=hashlib.md5(content.encode()).hexdigest(),
-        )
+        state = ProjectState(source_file=str(source_file))
+        set_source_fingerprint(source_file, state)
 
     # Run the app
     app = MeoApp(source_file, state)
@@ -137,6 +158,10 @@ def _run_meo_app(source_file: Path):
 @app.command()
 def init():
     """Create .meo/config.yaml configuration file"""
+    from meo.core.config import create_config, config_exists, get_config_path
+
+    console = _console()
+
     if config_exists():
         if not typer.confirm("Config file already exists. Overwrite?"):
             raise typer.Exit(0)
@@ -181,14 +206,12 @@ def init():
         raise typer.Exit(1)
 
 
-# Presets subcommands
-presets_app = typer.Typer(help="Manage direction presets")
-app.add_typer(presets_app, name="presets")
-
-
-@presets_app.command("list")
+# Presets subcommands (group is attached in register_subcommands)
 def presets_list():
     """List available direction presets"""
+    from rich.table import Table
+    from meo.presets import BUILTIN_PRESETS
+
     table = Table(title="Direction Presets")
     table.add_column("ID", style="cyan")
     table.add_column("Name", style="green")
@@ -197,15 +220,18 @@ def presets_list():
     for preset in BUILTIN_PRESETS:
         table.add_row(preset.id, preset.name, preset.description)
 
-    console.print(table)
+    _console().print(table)
 
 
 @app.command("sessions")
 def sessions_list():
     """List all editing sessions"""
-    from meo.core.session import list_sessions, load_session
+    from rich.table import Table
+    from meo.core.session import list_session_summaries
 
-    sessions = list_sessions()
+    console = _console()
+
+    sessions = list_session_summaries()
     if not sessions:
         console.print("[yellow]No sessions found[/yellow]")
         return
@@ -216,21 +242,49 @@ def sessions_list():
     table.add_column("Status")
     table.add_column("Progress")
 
-    for sid in sessions:
-        session = load_session(sid)
-        if session:
-            total = len(session.chunks)
-            applied = len(session.applied_chunks)
-            skipped = len(session.skipped_chunks)
-            progress = f"{applied + skipped}/{total} ({applied} applied, {skipped} skipped)"
-            source_name = Path(session.source_file).name
-            table.add_row(sid, source_name, session.status, progress)
+    for summary in sessions:
+        applied = summary.applied
+        skipped = summary.skipped
+        progress = f"{applied + skipped}/{summary.total} ({applied} applied, {skipped} skipped)"
+        source_name = Path(summary.source_file).name
+        table.add_row(summary.id, source_name, summary.status, progress)
 
     console.print(table)
 
 
+_registered_groups: set[str] = set()
+
+
+def register_subcommands(names: Optional[set[str]] = None) -> None:
+    """Attach sub-Typer command groups to the app.
+
+    Args:
+        names: Groups to attach (e.g. {"presets"}), or None for all of them
+    """
+    if (names is None or "presets" in names) and "presets" not in _registered_groups:
+        presets_app = typer.Typer(help="Manage direction presets")
+        presets_app.command("list")(presets_list)
+        app.add_typer(presets_app, name="presets")
+        _registered_groups.add("presets")
+
+
+def _sniff_subcommand(args: list[str]) -> Optional[str]:
+    """Return the first positional argument (the invoked subcommand), if any"""
+    for arg in args:
+        if not arg.startswith("-"):
+            return arg
+    return None
+
+
 def main():
     """Entry point for CLI"""
+    args = sys.argv[1:]
+    if "--help" in args or os.environ.get("_MEO_COMPLETE"):
+        # Help output and shell completion need the full command tree
+        register_subcommands()
+    else:
+        subcommand = _sniff_subcommand(args)
+        register_subcommands({subcommand} if subcommand else set())
     app()
 
 
@@ -1,8 +1,6 @@
 """Core functionality for MEO"""
 
-from meo.core.config import load_config, save_config, create_config, config_exists
-from meo.core.sidecar import load_sidecar, save_sidecar
-from meo.core.output_generator import generate_output
+from meo.core.lazy_exports import lazy_exports
 
 __all__ = [
     "load_config",
@@ -13,3 +11,15 @@ __all__ = [
     "save_sidecar",
     "generate_output",
 ]
+
+# Resolved on first access, so importing one core submodule doesn't pull in
+# YAML, Pydantic models and the output generator
+__getattr__, __dir__ = lazy_exports(globals(), {
+    "load_config": ("meo.core.config", "load_config"),
+    "save_config": ("meo.core.config", "save_config"),
+    "create_config": ("meo.core.config", "create_config"),
+    "config_exists": ("meo.core.config", "config_exists"),
+    "load_sidecar": ("meo.core.sidecar", "load_sidecar"),
+    "save_sidecar": ("meo.core.sidecar", "save_sidecar"),
+    "generate_output": ("meo.core.output_generator", "generate_output"),
+})
@@ -1,13 +1,28 @@
 """Streaming AI Edit - call Claude CLI with real-time output"""
 
 import asyncio
+import codecs
+import mmap
+import os
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable
 
+from meo.core.chunk_parser import find_response_start
 from meo.core.session import get_session_path
 
 
+# Max bytes per read from Claude's stdout; reads return as soon as any data is available
+STREAM_READ_SIZE = 64 * 1024
+
+CLAUDE_COMMAND = (
+    "claude", "--print",
+    "Follow the instructions in this document exactly. "
+    "Output ONLY the edited text, nothing else.",
+)
+
+
 @dataclass
 class StreamProgress:
     """Progress update during AI generation"""
@@ -15,15 +30,64 @@ class StreamProgress:
     total_chunks: int
     chunk_id: str
     status: str  # "starting", "streaming", "complete", "error"
-    text: str  # Current streamed text
+    text: str  # The chunk's whole output; only set when it's complete or failed
+    completed_chunks: int = 0  # Chunks finished so far (may finish out of order)
+    delta: str = ""  # Text received since the previous update for this chunk
+
+
+_CHUNK_NUM_RE = re.compile(r"\d+")
+_NON_SPACE_RE = re.compile(r"\S")
+_NON_SPACE_BYTES_RE = re.compile(rb"\S")
 
 
 def has_response(content: str) -> bool:
     """Check if chunk file already has a response after ---"""
-    if "---" not in content:
-        return False
-    after_marker = content.split("---", 1)[1]
-    return bool(after_marker.strip())
+    start = find_response_start(content)
+    # Stop at the first non-space character instead of copying and
+    # stripping the whole response
+    return start != -1 and _NON_SPACE_RE.search(content, start) is not None
+
+
+def _has_response_fast(data: bytes) -> bool:
+    """has_response() on the raw file bytes, without decoding the file"""
+    start = find_response_start(data)
+    return start != -1 and _NON_SPACE_BYTES_RE.search(data, start) is not None
+
+
+def _chunk_sort_key(name: str) -> tuple[int, int, str]:
+    """Sort chunk files numerically (chunk_2 before chunk_10), then by name"""
+    match = _CHUNK_NUM_RE.search(name)
+    if match is None:
+        return (1, 0, name)
+    return (0, int(match.group()), name)
+
+
+def list_chunk_files(chunks_dir: Path) -> list[Path]:
+    """List the chunk .md files in a session's chunks directory, in chunk order"""
+    with os.scandir(chunks_dir) as it:
+        names = [e.name for e in it if e.name.endswith(".md") and e.is_file()]
+    names.sort(key=_chunk_sort_key)
+    return [chunks_dir / name for name in names]
+
+
+def _chunk_file_pending(chunk_path: Path) -> bool:
+    """Check whether a chunk file still needs a response.
+
+    The file is memory-mapped and searched as bytes, so it's never copied
+    into a string and decoded.
+    """
+    with chunk_path.open("rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return True
+        with mm:
+            return not _has_response_fast(mm)
+
+
+def scan_pending(chunks_dir: Path) -> list[Path]:
+    """List the chunk files in a session that don't have a response yet"""
+    return [f for f in list_chunk_files(chunks_dir) if _chunk_file_pending(f)]
 
 
 async def stream_ai_edit_on_chunk(
@@ -39,45 +103,60 @@ async def stream_ai_edit_on_chunk(
     Returns:
         True if successful, False otherwise
     """
-    content = chunk_path.read_text()
+    # Work on raw bytes: the resume check needs no decoding and the
+    # content is sent to Claude as bytes anyway
+    content = chunk_path.read_bytes()
 
     # Skip if already has response
-    if has_response(content):
+    if _has_response_fast(content):
         return True
 
     # Create async subprocess
     process = await asyncio.create_subprocess_exec(
-        "claude", "--print",
-        "Follow the instructions in this document exactly. "
-        "Output ONLY the edited text, nothing else.",
+        *CLAUDE_COMMAND,
         stdin=asyncio.subprocess.PIPE,
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE,
     )
 
-    # Write input and close stdin
-    process.stdin.write(content.encode())
-    await process.stdin.drain()
-    process.stdin.close()
-
-    # Stream output
-    full_output = []
-    while True:
-        chunk = await process.stdout.read(100)
-        if not chunk:
-            break
-        text = chunk.decode('utf-8', errors='replace')
-        full_output.append(text)
-        on_output(text)
-
-    await process.wait()
+    try:
+        # Write input and close stdin
+        process.stdin.write(content)
+        await process.stdin.drain()
+        process.stdin.close()
+
+        # Stream output. The incremental decoder keeps multi-byte characters
+        # that straddle two reads intact instead of replacing them.
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        full_output = []
+        while True:
+            chunk = await process.stdout.read(STREAM_READ_SIZE)
+            if not chunk:
+                break
+            text = decoder.decode(chunk)
+            if text:
+                full_output.append(text)
+                on_output(text)
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            full_output.append(tail)
+            on_output(tail)
+
+        await process.wait()
+    except asyncio.CancelledError:
+        # Cancelling this task doesn't stop Claude - kill it rather than
+        # leave it running on its own
+        if process.returncode is None:
+            process.kill()
+        await process.wait()
+        raise
 
     if process.returncode == 0:
         result_text = ''.join(full_output).strip()
         if result_text:
-            # Append response after ---
-            with open(chunk_path, "a") as f:
-                f.write("\n" + result_text + "\n")
+            # Append response after --- (single binary write, no text layer)
+            with chunk_path.open("ab") as f:
+                f.write(b"\n" + result_text.encode() + b"\n")
             return True
 
     return False
@@ -85,50 +164,80 @@ async def stream_ai_edit_on_chunk(
 
 async def stream_ai_edit_on_session(
     session_id: str,
-    progress_callback: Callable[[StreamProgress], None]
+    progress_callback: Callable[[StreamProgress], None],
+    concurrency: int = 4,
 ) -> None:
     """Run Claude CLI on all chunks in a session with streaming progress.
 
+    Chunks are independent, so up to `concurrency` Claude processes run at
+    once. Progress updates for different chunks may interleave.
+
     Args:
         session_id: Session ID
         progress_callback: Called with progress updates
+        concurrency: Maximum number of chunks processed at the same time
     """
     session_path = get_session_path(session_id)
     chunks_dir = session_path / "chunks"
-    chunk_files = sorted(chunks_dir.glob("*.md"))
+    chunk_files = list_chunk_files(chunks_dir)
     total = len(chunk_files)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
 
-    for i, chunk_file in enumerate(chunk_files):
+    # On resume, chunks that already have a response are counted as done
+    # up front instead of being opened and decoded again by each worker
+    work = [(i, f) for i, f in enumerate(chunk_files) if _chunk_file_pending(f)]
+    completed = total - len(work)
+
+    async def process_chunk(i: int, chunk_file: Path) -> None:
+        nonlocal completed
         chunk_id = chunk_file.stem
-        current_text = ""
+        parts: list[str] = []
 
         def on_output(text: str) -> None:
-            nonlocal current_text
-            current_text += text
+            # Only the new text is sent: rebuilding the whole output for
+            # every read would be quadratic in its length
+            parts.append(text)
             progress_callback(StreamProgress(
                 chunk_index=i,
                 total_chunks=total,
                 chunk_id=chunk_id,
                 status="streaming",
-                text=current_text,
+                text="",
+                completed_chunks=completed,
+                delta=text,
             ))
 
-        # Notify starting
-        progress_callback(StreamProgress(
-            chunk_index=i,
-            total_chunks=total,
-            chunk_id=chunk_id,
-            status="starting",
-            text="",
-        ))
+        async with semaphore:
+            # Notify starting
+            progress_callback(StreamProgress(
+                chunk_index=i,
+                total_chunks=total,
+                chunk_id=chunk_id,
+                status="starting",
+                text="",
+                completed_chunks=completed,
+            ))
 
-        success = await stream_ai_edit_on_chunk(chunk_file, on_output)
+            success = await stream_ai_edit_on_chunk(chunk_file, on_output)
 
         # Notify complete
+        completed += 1
         progress_callback(StreamProgress(
             chunk_index=i,
             total_chunks=total,
             chunk_id=chunk_id,
             status="complete" if success else "error",
-            text=current_text,
+            text="".join(parts),
+            completed_chunks=completed,
         ))
+
+    tasks = [asyncio.ensure_future(process_chunk(i, chunk_file)) for i, chunk_file in work]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        # If one chunk fails hard, cancel the others: each kills its Claude
+        # process on the way out
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
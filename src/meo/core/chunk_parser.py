@@ -1,14 +1,20 @@
 """Chunk file parser - extract AI responses and metadata from chunk files"""
 
-import re
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple, Union
 
+from meo.core.text_replacer import normalize_newlines
 
-@dataclass
+
+@dataclass(frozen=True)
 class ChunkData:
-    """Parsed data from a chunk file"""
+    """Parsed data from a chunk file.
+
+    Frozen, so that normalized_original can't go stale: an edited chunk is
+    a dataclasses.replace() copy, which starts with an empty cache.
+    """
     chunk_id: str
     category: str
     direction: Optional[str]
@@ -16,6 +22,23 @@ class ChunkData:
     ai_response: Optional[str]
     has_response: bool
 
+    @cached_property
+    def normalized_original(self) -> str:
+        """original_text with LF line endings, as matched against documents"""
+        return normalize_newlines(self.original_text)
+
+
+CATEGORY_MARKER = "**Category:**"
+DIRECTION_MARKER = "**Direction:**"
+TEXT_SECTION = "## Text to Edit"
+RESPONSE_SECTION = "## Your Response"
+CODE_FENCE = "```"
+RESPONSE_MARKER = "---"
+
+# The markers find_response_start() searches for, as text and as bytes
+_STR_MARKERS = (TEXT_SECTION, CODE_FENCE, "\n", RESPONSE_SECTION, RESPONSE_MARKER)
+_BYTES_MARKERS = tuple(m.encode("utf-8") for m in _STR_MARKERS)
+
 
 def parse_chunk_file(chunk_path: Path) -> ChunkData:
     """Parse a chunk file and extract all components.
@@ -30,31 +53,122 @@ def parse_chunk_file(chunk_path: Path) -> ChunkData:
         FileNotFoundError: If chunk file doesn't exist
         ValueError: If chunk file is malformed
     """
-    content = chunk_path.read_text()
+    content = chunk_path.read_bytes().decode("utf-8")
     chunk_id = chunk_path.stem  # e.g., "chunk_001" from "chunk_001.md"
 
-    # Extract category
-    category = extract_category(content)
-
-    # Extract direction
-    direction = extract_direction(content)
+    # Single forward pass: each section is searched for from where the
+    # previous one ended, so the file is scanned once rather than per field.
+    # Metadata lines are only looked for above the text section.
+    text_at = content.find(TEXT_SECTION)
+    header_end = text_at if text_at != -1 else len(content)
 
-    # Extract original text
-    original_text = extract_original_text(content)
-
-    # Extract AI response
-    ai_response = extract_ai_response(content)
+    category, pos = _find_field(content, CATEGORY_MARKER, 0, header_end)
+    direction, pos = _find_field(content, DIRECTION_MARKER, pos, header_end)
+    original_text, pos = _find_text_block(content, text_at)
+    ai_response = _find_response(content, pos)
 
     return ChunkData(
         chunk_id=chunk_id,
-        category=category,
+        category=category or "Unknown",
         direction=direction,
         original_text=original_text,
         ai_response=ai_response,
-        has_response=ai_response is not None and ai_response.strip() != "",
+        has_response=ai_response is not None,
     )
 
 
+def _find_field(content: str, marker: str, pos: int, end: int) -> Tuple[Optional[str], int]:
+    """Find the rest of the line after `marker` in content[pos:end].
+
+    Returns:
+        (value or None, position after the line - `pos` if not found)
+    """
+    i = content.find(marker, pos, end)
+    if i == -1:
+        return None, pos
+    start = i + len(marker)
+    line_end = content.find("\n", start)
+    if line_end == -1:
+        line_end = len(content)
+    return content[start:line_end].strip() or None, line_end
+
+
+def _find_text_block(content: str, section: int) -> Tuple[str, int]:
+    """Find the fenced block following the text section header at `section`.
+
+    Returns:
+        (stripped block text or "", position after the closing fence)
+    """
+    if section == -1:
+        return "", 0
+    span = _text_block_span(content, section, _STR_MARKERS)
+    if span is None:
+        return "", section
+    start, end = span
+    return content[start:end].strip(), end + len(CODE_FENCE)
+
+
+def _text_block_span(content, section: int, markers: tuple) -> Optional[Tuple[int, int]]:
+    """Find the fenced block following the text section header at `section`.
+
+    Returns:
+        (start of the block, start of its closing fence), or None if the
+        block isn't complete
+    """
+    text_section, fence, newline = markers[:3]
+    opening = content.find(fence, section + len(text_section))
+    if opening == -1:
+        return None
+    # The block starts on the line after the opening fence
+    start = content.find(newline, opening + len(fence))
+    if start == -1:
+        return None
+    end = content.find(fence, start + 1)
+    if end == -1:
+        return None
+    return start + 1, end
+
+
+def find_response_start(content: Union[str, bytes]) -> int:
+    """Find where the response starts in a chunk file's content.
+
+    That's after the '---' marker in the first response section following
+    the text to edit, as parse_chunk_file() reads it. The markers are ASCII,
+    so undecoded bytes (or an mmap of the file) can be searched too.
+
+    Returns:
+        The position after the marker, or -1 if there's no marker
+    """
+    markers = _STR_MARKERS if isinstance(content, str) else _BYTES_MARKERS
+    text_section, fence, _, response_section, response_marker = markers
+
+    pos = content.find(text_section)
+    if pos == -1:
+        pos = 0
+    else:
+        span = _text_block_span(content, pos, markers)
+        if span is not None:
+            pos = span[1] + len(fence)
+
+    section = content.find(response_section, pos)
+    if section == -1:
+        return -1
+    marker = content.find(response_marker, section + len(response_section))
+    return -1 if marker == -1 else marker + len(response_marker)
+
+
+def _find_response(content: str, pos: int) -> Optional[str]:
+    """Find the text after '---' in the first response section at or after `pos`"""
+    section = content.find(RESPONSE_SECTION, pos)
+    if section == -1:
+        return None
+    marker = content.find(RESPONSE_MARKER, section + len(RESPONSE_SECTION))
+    if marker == -1:
+        return None
+    response = content[marker + len(RESPONSE_MARKER):].strip()
+    return response or None
+
+
 def extract_category(content: str) -> str:
     """Extract the category from chunk content.
 
@@ -63,10 +177,7 @@ def extract_category(content: str) -> str:
     Returns:
         Category string, or "Unknown" if not found
     """
-    match = re.search(r"\*\*Category:\*\*\s*(.+?)(?:\n|$)", content)
-    if match:
-        return match.group(1).strip()
-    return "Unknown"
+    return _find_field(content, CATEGORY_MARKER, 0, len(content))[0] or "Unknown"
 
 
 def extract_direction(content: str) -> Optional[str]:
@@ -77,10 +188,7 @@ def extract_direction(content: str) -> Optional[str]:
     Returns:
         Direction name, or None if not found
     """
-    match = re.search(r"\*\*Direction:\*\*\s*(.+?)(?:\n|$)", content)
-    if match:
-        return match.group(1).strip()
-    return None
+    return _find_field(content, DIRECTION_MARKER, 0, len(content))[0]
 
 
 def extract_original_text(content: str) -> str:
@@ -91,15 +199,7 @@ def extract_original_text(content: str) -> str:
     Returns:
         Original text, or empty string if not found
     """
-    # Find the "## Text to Edit" section
-    section_match = re.search(
-        r"## Text to Edit\s*\n\s*```\s*\n(.*?)```",
-        content,
-        re.DOTALL
-    )
-    if section_match:
-        return section_match.group(1).strip()
-    return ""
+    return _find_text_block(content, content.find(TEXT_SECTION))[0]
 
 
 def extract_ai_response(content: str) -> Optional[str]:
@@ -111,14 +211,4 @@ def extract_ai_response(content: str) -> Optional[str]:
     Returns:
         The AI response text (trimmed), or None if no response found
     """
-    # Find the "## Your Response" section and the --- marker
-    section_match = re.search(
-        r"## Your Response.*?---\s*\n(.*)",
-        content,
-        re.DOTALL
-    )
-    if section_match:
-        response = section_match.group(1).strip()
-        if response:
-            return response
-    return None
+    return _find_response(content, 0)
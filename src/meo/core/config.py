@@ -1,17 +1,23 @@
 """Config loading and saving for MEO"""
 
+import os
 from pathlib import Path
+from typing import Optional, Tuple
 
 import yaml
 from pydantic import ValidationError
 
 from meo.models.config import MeoConfig
+from meo.core.yaml_io import SafeDumper, SafeLoader
 
 
 # Config lives in .meo/config.yaml in current working directory
 CONFIG_DIR = Path(".meo")
 CONFIG_FILE = CONFIG_DIR / "config.yaml"
 
+# Last config loaded or saved, keyed on the file's (path, mtime_ns, size)
+_cache: Optional[Tuple[Tuple[str, int, int], MeoConfig]] = None
+
 
 class ConfigNotFoundError(Exception):
     """Raised when config file doesn't exist"""
@@ -42,15 +48,33 @@ def load_config() -> MeoConfig:
         ConfigNotFoundError: If config file doesn't exist
         ConfigInvalidError: If config file is invalid
     """
-    if not CONFIG_FILE.exists():
+    global _cache
+    try:
+        key = _config_file_key()
+    except FileNotFoundError:
         raise ConfigNotFoundError(
             f"Config file not found at {CONFIG_FILE}\n"
             f"Run 'meo init' to create one."
         )
 
+    # Only re-parse after the file changes. Callers get their own copy, so
+    # changes they make don't show up in later loads.
+    if _cache is None or _cache[0] != key:
+        _cache = (key, _parse_config_file(key[0]))
+    return _cache[1].model_copy(deep=True)
+
+
+def _config_file_key() -> Tuple[str, int, int]:
+    """Identify the current config file contents by path, mtime and size"""
+    stat = CONFIG_FILE.stat()
+    return os.path.abspath(CONFIG_FILE), stat.st_mtime_ns, stat.st_size
+
+
+def _parse_config_file(path: str) -> MeoConfig:
+    """Parse and validate the config file"""
     try:
-        with open(CONFIG_FILE, "r") as f:
-            data = yaml.safe_load(f)
+        with open(path, "r") as f:
+            data = yaml.load(f, Loader=SafeLoader)
 
         if data is None:
             raise ConfigInvalidError(f"Config file is empty: {CONFIG_FILE}")
@@ -70,7 +94,12 @@ def save_config(config: MeoConfig) -> Path:
     data = config.model_dump()
 
     with open(CONFIG_FILE, "w") as f:
-        yaml.dump(data, f, default_flow_style=False)
+        yaml.dump(data, f, Dumper=SafeDumper, default_flow_style=False)
+
+    # Cache what was just written so the next load_config() needn't parse it.
+    # Also covers a rewrite landing in the same mtime tick as the last load.
+    global _cache
+    _cache = (_config_file_key(), config.model_copy(deep=True))
 
     return CONFIG_FILE
 
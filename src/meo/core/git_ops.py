@@ -1,14 +1,25 @@
 """Git operations for session management"""
 
+import difflib
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 
-def run_git(session_path: Path, *args: str) -> subprocess.CompletedProcess:
-    """Run a git command in the session directory"""
+# Commit identity for session repos, passed with -c so no global (or
+# per-repo) git config is needed
+GIT_IDENTITY = {"user.email": "meo@local", "user.name": "MEO"}
+
+
+def run_git(
+    session_path: Path, *args: str, config: Optional[Dict[str, str]] = None
+) -> subprocess.CompletedProcess:
+    """Run a git command in the session directory, with optional -c overrides"""
+    overrides = []
+    for key, value in (config or {}).items():
+        overrides += ["-c", f"{key}={value}"]
     return subprocess.run(
-        ["git", *args],
+        ["git", *overrides, *args],
         cwd=session_path,
         capture_output=True,
         text=True,
@@ -31,18 +42,14 @@ def init_session_repo(session_path: Path, source_file: Path) -> None:
     # Initialize git repo
     run_git(session_path, "init")
 
-    # Configure git for this repo (avoid needing global config)
-    run_git(session_path, "config", "user.email", "meo@local")
-    run_git(session_path, "config", "user.name", "MEO")
-
-    # Copy source file
-    content = source_file.read_text()
-    (session_path / "original.md").write_text(content)
-    (session_path / "working.md").write_text(content)
+    # Copy source file (as bytes - no need to decode just to copy)
+    content = source_file.read_bytes()
+    (session_path / "original.md").write_bytes(content)
+    (session_path / "working.md").write_bytes(content)
 
     # Initial commit
     run_git(session_path, "add", ".")
-    run_git(session_path, "commit", "-m", "Session start")
+    run_git(session_path, "commit", "-m", "Session start", config=GIT_IDENTITY)
 
 
 def commit_chunk_response(session_path: Path, chunk_id: str, message: Optional[str] = None) -> None:
@@ -54,8 +61,8 @@ def commit_chunk_response(session_path: Path, chunk_id: str, message: Optional[s
         message: Optional custom commit message
     """
     commit_msg = message or f"Applied {chunk_id}"
-    run_git(session_path, "add", "working.md")
-    run_git(session_path, "commit", "-m", commit_msg)
+    # Committing the tracked path directly stages it too - one git process
+    run_git(session_path, "commit", "-m", commit_msg, "--", "working.md", config=GIT_IDENTITY)
 
 
 def get_chunk_diff(session_path: Path) -> str:
@@ -81,7 +88,7 @@ def get_working_diff(session_path: Path) -> str:
 def rollback_chunk(session_path: Path) -> None:
     """Rollback the last commit (undo last chunk application)."""
     run_git(session_path, "checkout", "HEAD~1", "--", "working.md")
-    run_git(session_path, "commit", "-m", "Rollback last chunk")
+    run_git(session_path, "commit", "-m", "Rollback last chunk", config=GIT_IDENTITY)
 
 
 def get_commit_count(session_path: Path) -> int:
@@ -101,10 +108,12 @@ def has_uncommitted_changes(session_path: Path) -> bool:
 
 def get_original_vs_working_diff(session_path: Path) -> str:
     """Get diff between original.md and working.md"""
-    result = subprocess.run(
-        ["diff", "-u", "original.md", "working.md"],
-        cwd=session_path,
-        capture_output=True,
-        text=True,
+    original = (session_path / "original.md").read_text().splitlines(keepends=True)
+    working = (session_path / "working.md").read_text().splitlines(keepends=True)
+    lines = difflib.unified_diff(original, working, "original.md", "working.md")
+    # Like diff -u, mark a last line without a newline rather than running
+    # it into the next line
+    return "".join(
+        line if line.endswith("\n") else line + "\n\\ No newline at end of file\n"
+        for line in lines
     )
-    return result.stdout
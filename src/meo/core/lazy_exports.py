@@ -0,0 +1,37 @@
+"""Package re-exports resolved on first access (PEP 562)"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    namespace: Dict[str, Any],
+    exports: Dict[str, Tuple[str, str]],
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build a package's module-level __getattr__ and __dir__.
+
+    Each export is imported from its module the first time it's accessed,
+    then stored in the package so later lookups don't come back here.
+
+    Args:
+        namespace: The package's globals()
+        exports: Exported name -> (module name, attribute name)
+
+    Returns:
+        (__getattr__, __dir__) for the package
+    """
+    def __getattr__(name: str) -> Any:
+        try:
+            module_name, attr = exports[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {namespace['__name__']!r} has no attribute {name!r}"
+            ) from None
+        value = getattr(importlib.import_module(module_name), attr)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
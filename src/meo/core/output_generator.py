@@ -1,5 +1,6 @@
 """Output generator - creates AI-consumable markdown from project state"""
 
+import io
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -9,117 +10,136 @@ from meo.models.chunk import Chunk, ChunkCategory
 from meo.presets import get_preset_by_id
 
 
-def generate_output(state: ProjectState, source_file: Optional[Path] = None) -> str:
-    """Generate the AI-consumable markdown output"""
-    lines = []
+_HEADER_TMPL = """\
+# Markdown Edit Instructions
+
+**Source Document:** {source}
+**Generated:** {generated}
+**Total Tasks:** {total}
+
+---
+
+"""
+
+_AI_INSTRUCTIONS = """\
+## Instructions for AI
+
+You will be given a series of editing tasks. Each task:
+1. Specifies text to edit
+2. Provides the category of edit
+3. Gives specific editing instructions
+
+Complete each task in order. For each task, output ONLY the replacement text.
+
+Use this format for your response:
+
+```
+### Response: [task_id]
+[your edited text here]
+```
+
+---
+
+"""
+
+_TASK_SEPARATOR = "\n\n---\n\n"
+
+_RESPONSE_TEMPLATE_HEADER = """\
+## Response Template
+
+Copy and fill in this template:
 
-    # Header
-    lines.append("# Markdown Edit Instructions")
-    lines.append("")
-    lines.append(f"**Source Document:** {state.source_file}")
-    lines.append(f"**Generated:** {datetime.now().isoformat()}")
+```markdown
+"""
 
+_RESPONSE_ENTRY_TMPL = "### Response: {chunk_id}\n[edited text here]\n\n"
+
+
+# Task layout; the category-dependent parts are filled in per category below
+_TASK_TMPL = """\
+## Task {{task_num}}: {{chunk_id}}
+
+**Category:** {category}
+{{direction_line}}
+### Context Visibility
+You CANNOT see the rest of the document. Work only with the provided text.
+
+### {text_label}
+```
+{{original_text}}
+```
+
+### Instructions{{instructions}}"""
+
+_CATEGORY_DISPLAY = {
+    ChunkCategory.REPLACE: "Replace",
+    ChunkCategory.TWEAK: "Tweak",
+}
+
+# One pre-formatted task template per category
+_TASK_TEMPLATES = {
+    category: _TASK_TMPL.format(
+        category=_CATEGORY_DISPLAY.get(category, category.value),
+        text_label="Text to Replace" if category == ChunkCategory.REPLACE else "Text to Tweak",
+    )
+    for category in ChunkCategory
+}
+
+_DEFAULT_INSTRUCTIONS = {
+    ChunkCategory.REPLACE: "Edit or rewrite this text as appropriate.",
+    ChunkCategory.TWEAK: "Make minor adjustments to improve this text.",
+}
+
+
+def generate_output(state: ProjectState, source_file: Optional[Path] = None) -> str:
+    """Generate the AI-consumable markdown output"""
+    out = io.StringIO()
     actionable_chunks = state.get_chunks_in_execution_order()
-    lines.append(f"**Total Tasks:** {len(actionable_chunks)}")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-
-    # Instructions for AI
-    lines.append("## Instructions for AI")
-    lines.append("")
-    lines.append("You will be given a series of editing tasks. Each task:")
-    lines.append("1. Specifies text to edit")
-    lines.append("2. Provides the category of edit")
-    lines.append("3. Gives specific editing instructions")
-    lines.append("")
-    lines.append("Complete each task in order. For each task, output ONLY the replacement text.")
-    lines.append("")
-    lines.append("Use this format for your response:")
-    lines.append("")
-    lines.append("```")
-    lines.append("### Response: [task_id]")
-    lines.append("[your edited text here]")
-    lines.append("```")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+
+    out.write(_HEADER_TMPL.format(
+        source=state.source_file,
+        generated=datetime.now().isoformat(),
+        total=len(actionable_chunks),
+    ))
+    out.write(_AI_INSTRUCTIONS)
 
     # Generate each task
     for i, chunk in enumerate(actionable_chunks, 1):
-        lines.extend(_generate_task(chunk, i))
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+        out.write(_generate_task(chunk, i))
+        out.write(_TASK_SEPARATOR)
 
     # Response template
-    lines.append("## Response Template")
-    lines.append("")
-    lines.append("Copy and fill in this template:")
-    lines.append("")
-    lines.append("```markdown")
+    out.write(_RESPONSE_TEMPLATE_HEADER)
     for chunk in actionable_chunks:
-        lines.append(f"### Response: {chunk.id}")
-        lines.append("[edited text here]")
-        lines.append("")
-    lines.append("```")
+        out.write(_RESPONSE_ENTRY_TMPL.format(chunk_id=chunk.id))
+    out.write("```")
 
-    return "\n".join(lines)
+    return out.getvalue()
 
 
-def _generate_task(chunk: Chunk, task_num: int) -> list[str]:
+def _generate_task(chunk: Chunk, task_num: int) -> str:
     """Generate the markdown for a single task"""
-    lines = []
-
-    lines.append(f"## Task {task_num}: {chunk.id}")
-    lines.append("")
-
-    # Category
-    category_display = {
-        ChunkCategory.REPLACE: "Replace",
-        ChunkCategory.TWEAK: "Tweak",
-    }
-    lines.append(f"**Category:** {category_display.get(chunk.category, chunk.category.value)}")
-
-    # Direction
-    if chunk.direction_preset:
-        preset = get_preset_by_id(chunk.direction_preset)
-        if preset:
-            lines.append(f"**Direction:** {preset.name}")
-    lines.append("")
-
-    # Context visibility (MVP: always isolated)
-    lines.append("### Context Visibility")
-    lines.append("You CANNOT see the rest of the document. Work only with the provided text.")
-    lines.append("")
-
-    # Text to edit
-    text_label = "Text to Replace" if chunk.category == ChunkCategory.REPLACE else "Text to Tweak"
-
-    lines.append(f"### {text_label}")
-    lines.append("```")
-    lines.append(chunk.original_text)
-    lines.append("```")
-    lines.append("")
+    preset = get_preset_by_id(chunk.direction_preset) if chunk.direction_preset else None
+    direction_line = f"**Direction:** {preset.name}\n" if preset else ""
 
     # Instructions
-    lines.append("### Instructions")
-    if chunk.direction_preset:
-        preset = get_preset_by_id(chunk.direction_preset)
-        if preset:
-            lines.append(preset.render(chunk.annotation))
-        elif chunk.annotation:
-            lines.append(chunk.annotation)
+    if preset:
+        instructions = preset.render(chunk.annotation)
     elif chunk.annotation:
-        lines.append(chunk.annotation)
+        instructions = chunk.annotation
+    elif chunk.direction_preset:
+        instructions = None  # Unknown preset and nothing else to go on
     else:
         # Default instructions by category
-        if chunk.category == ChunkCategory.REPLACE:
-            lines.append("Edit or rewrite this text as appropriate.")
-        elif chunk.category == ChunkCategory.TWEAK:
-            lines.append("Make minor adjustments to improve this text.")
-
-    return lines
+        instructions = _DEFAULT_INSTRUCTIONS.get(chunk.category)
+
+    return _TASK_TEMPLATES[chunk.category].format(
+        task_num=task_num,
+        chunk_id=chunk.id,
+        direction_line=direction_line,
+        original_text=chunk.original_text,
+        instructions=f"\n{instructions}" if instructions is not None else "",
+    )
 
 
 def save_output(state: ProjectState, source_file: Path, output_path: Optional[Path] = None) -> Path:
@@ -1,8 +1,14 @@
 """Session management - create and manage editing sessions"""
 
+import io
+import json
+import os
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
@@ -11,6 +17,132 @@ from meo.models.project import ProjectState
 from meo.models.chunk import Chunk, ChunkCategory, LockType
 from meo.core.git_ops import init_session_repo
 from meo.presets import get_preset_by_id
+from meo.core.yaml_io import SafeLoader
+
+
+SESSION_FILE = "session.json"
+LEGACY_SESSION_FILE = "session.yaml"  # Written by versions before session.json
+
+# Fixed blocks of the atomic chunk files
+_CATEGORY_DISPLAY = {
+    ChunkCategory.REPLACE: "Replace",
+    ChunkCategory.TWEAK: "Tweak",
+}
+
+# Locked chunks without a lock type are shown as context
+_LOCK_TYPE_LABEL = {
+    LockType.EXAMPLE: "Example",
+    LockType.REFERENCE: "Reference",
+    LockType.CONTEXT: "Context",
+}
+
+_SEPARATOR = "═" * 50
+
+_TASK_HEADER_TMPL = """\
+# Edit Task: {chunk_id}
+
+**Category:** {category}
+
+## Instructions
+
+"""
+
+_DOCUMENT_STRUCTURE = """\
+## Document Structure
+
+Locked chunks shown in document order. Your text appears where marked.
+
+- **Example**: Match the style, tone, and format of this text
+- **Reference**: Use the information/facts from this text
+- **Context**: Surrounding content for awareness only
+
+"""
+
+_TARGET_MARKER = f"""\
+{_SEPARATOR}
+**⬇ YOUR TEXT TO EDIT APPEARS BELOW ⬇**
+{_SEPARATOR}
+
+"""
+
+_RESPONSE_SECTION = """\
+## Your Response
+
+Write ONLY the edited text below. Do not include explanations or the original text.
+
+---
+"""
+
+# (mtime_ns, size) of each session file as this process last wrote it
+_written: dict[str, tuple[int, int]] = {}
+
+# Append-only JSONL index of session summaries, kept in the sessions dir.
+# Later lines for the same session supersede earlier ones.
+MANIFEST_FILE = "manifest.jsonl"
+
+# Summary this process last added to the manifest, per session file
+_manifested: dict[str, "SessionSummary"] = {}
+
+
+@dataclass
+class SessionSummary:
+    """Manifest entry - what `meo sessions` shows for a session"""
+    id: str
+    source_file: str
+    status: str
+    total: int
+    applied: int
+    skipped: int
+
+    @classmethod
+    def from_session(cls, session: Session) -> "SessionSummary":
+        return cls(
+            id=session.id,
+            source_file=session.source_file,
+            status=session.status,
+            total=len(session.chunks),
+            applied=len(session.applied_chunks),
+            skipped=len(session.skipped_chunks),
+        )
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> "SessionSummary":
+        """Summarize a session from its saved (JSON) form"""
+        return cls(
+            id=data["id"],
+            source_file=data["source_file"],
+            status=data["status"],
+            total=len(data["chunks"]),
+            applied=len(data["applied_chunks"]),
+            skipped=len(data["skipped_chunks"]),
+        )
+
+
+@dataclass
+class LockedChunks:
+    """A state's locked chunks in document order, indexed by row"""
+    chunks: List[Chunk]
+    start_rows: List[int]
+    end_rows: List[int]
+
+    @classmethod
+    def from_state(cls, state: ProjectState) -> "LockedChunks":
+        chunks = sorted(
+            (c for c in state.chunks if c.category == ChunkCategory.LOCK),
+            key=lambda c: (c.range.start.row, c.range.start.col),
+        )
+        return cls(
+            chunks=chunks,
+            start_rows=[c.range.start.row for c in chunks],
+            # Chunks can't overlap, so end rows are in order too
+            end_rows=[c.range.end.row for c in chunks],
+        )
+
+    def split(self, row: int) -> Tuple[List[Chunk], List[Chunk]]:
+        """Get the locked chunks ending before `row` and those starting after it"""
+        before = self.chunks[:bisect_left(self.end_rows, row)]
+        after = self.chunks[bisect_right(self.start_rows, row):]
+        return before, after
 
 
 def get_sessions_dir() -> Path:
@@ -61,20 +193,28 @@ def create_session(source_file: Path, state: ProjectState) -> Session:
 
     # Generate atomic files ONLY for non-locked chunks
     # Locked chunks are bundled as context into these files
-    for chunk in actionable_chunks:
-        generate_atomic_file(chunk, session_path, state)
-
-    # Save session metadata
-    save_session(session, session_path)
-
-    # Update status
+    # Files are independent, so their writes are overlapped on a thread pool
+    locked = LockedChunks.from_state(state)
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(
+            lambda chunk: generate_atomic_file(chunk, session_path, state, locked),
+            actionable_chunks,
+        ))
+
+    # Save session metadata - all chunk files exist, so it's ready for editing
     session.status = "editing"
     save_session(session, session_path)
 
     return session
 
 
-def generate_atomic_file(chunk: Chunk, session_path: Path, state: ProjectState) -> Path:
+def generate_atomic_file(
+    chunk: Chunk,
+    session_path: Path,
+    state: ProjectState,
+    locked: Optional[LockedChunks] = None,
+) -> Path:
     """Generate a single atomic file for a non-locked chunk.
 
     Note: This function is only called for REPLACE/TWEAK chunks.
@@ -84,162 +224,213 @@ def generate_atomic_file(chunk: Chunk, session_path: Path, state: ProjectState)
         chunk: The chunk to generate a file for (must be non-locked)
         session_path: Path to the session directory
         state: Full project state (for gathering locked chunks as context)
+        locked: Locked chunks of `state`, when generating files for many
+            chunks of the same state
 
     Returns:
         Path to the generated file
     """
-    chunks_dir = session_path / "chunks"
-    chunks_dir.mkdir(exist_ok=True)
-
-    file_path = chunks_dir / f"{chunk.id}.md"
+    # The chunks dir is created by init_session_repo()
+    file_path = session_path / "chunks" / f"{chunk.id}.md"
 
     # Build the atomic file content
-    lines = []
+    out = io.StringIO()
 
-    # Header
-    lines.append(f"# Edit Task: {chunk.id}")
-    lines.append("")
-
-    # Category
-    category_display = {
-        ChunkCategory.REPLACE: "Replace",
-        ChunkCategory.TWEAK: "Tweak",
-    }
-    lines.append(f"**Category:** {category_display.get(chunk.category, chunk.category.value)}")
-    lines.append("")
+    # Header and category
+    out.write(_TASK_HEADER_TMPL.format(
+        chunk_id=chunk.id,
+        category=_CATEGORY_DISPLAY.get(chunk.category, chunk.category.value),
+    ))
 
     # Instructions
-    lines.append("## Instructions")
-    lines.append("")
-
     if chunk.direction_preset:
         preset = get_preset_by_id(chunk.direction_preset)
         if preset:
-            lines.append(f"**Direction:** {preset.name}")
-            lines.append("")
-            lines.append(preset.render(chunk.annotation))
+            out.write(f"**Direction:** {preset.name}\n\n{preset.render(chunk.annotation)}\n")
         elif chunk.annotation:
-            lines.append(f"**User's guidance:** {chunk.annotation}")
+            out.write(f"**User's guidance:** {chunk.annotation}\n")
     elif chunk.annotation:
-        lines.append(f"**User's guidance:** {chunk.annotation}")
+        out.write(f"**User's guidance:** {chunk.annotation}\n")
     else:
         # Default instructions by category
         if chunk.category == ChunkCategory.REPLACE:
-            lines.append("Edit or rewrite this text as appropriate.")
+            out.write("Edit or rewrite this text as appropriate.\n")
         elif chunk.category == ChunkCategory.TWEAK:
-            lines.append("Make minor adjustments to improve this text.")
+            out.write("Make minor adjustments to improve this text.\n")
 
-    lines.append("")
+    out.write("\n")
 
     # Context section - bundle locked chunks showing document structure
-    locked_chunks = [c for c in state.chunks if c.category == ChunkCategory.LOCK]
-    locked_chunks.sort(key=lambda c: (c.range.start.row, c.range.start.col))
+    if locked is None:
+        locked = LockedChunks.from_state(state)
 
-    if locked_chunks:
+    if locked.chunks:
         # Split into before/after relative to target chunk
-        target_row = chunk.range.start.row
-        before_chunks = [lc for lc in locked_chunks if lc.range.end.row < target_row]
-        after_chunks = [lc for lc in locked_chunks if lc.range.start.row > target_row]
-
-        lines.append("## Document Structure")
-        lines.append("")
-        lines.append("Locked chunks shown in document order. Your text appears where marked.")
-        lines.append("")
-        lines.append("- **Example**: Match the style, tone, and format of this text")
-        lines.append("- **Reference**: Use the information/facts from this text")
-        lines.append("- **Context**: Surrounding content for awareness only")
-        lines.append("")
-
-        lock_type_label = {
-            LockType.EXAMPLE: "Example",
-            LockType.REFERENCE: "Reference",
-            LockType.CONTEXT: "Context",
-        }
-
-        # Chunks BEFORE target
+        before_chunks, after_chunks = locked.split(chunk.range.start.row)
+
+        out.write(_DOCUMENT_STRUCTURE)
+
+        # Chunks BEFORE target, marker for target position, chunks AFTER target
         for lc in before_chunks:
-            label = lock_type_label.get(lc.lock_type, "Context") if lc.lock_type else "Context"
-            lines.append(f"### {lc.id} [{label}]")
-            if lc.annotation:
-                lines.append(f"**User's guidance:** {lc.annotation}")
-            lines.append("```")
-            lines.append(lc.original_text)
-            lines.append("```")
-            lines.append("")
-
-        # Marker for target position
-        lines.append("═" * 50)
-        lines.append("**⬇ YOUR TEXT TO EDIT APPEARS BELOW ⬇**")
-        lines.append("═" * 50)
-        lines.append("")
-
-        # Chunks AFTER target
+            _write_locked_chunk(out, lc)
+        out.write(_TARGET_MARKER)
         for lc in after_chunks:
-            label = lock_type_label.get(lc.lock_type, "Context") if lc.lock_type else "Context"
-            lines.append(f"### {lc.id} [{label}]")
-            if lc.annotation:
-                lines.append(f"**User's guidance:** {lc.annotation}")
-            lines.append("```")
-            lines.append(lc.original_text)
-            lines.append("```")
-            lines.append("")
-
-    # Text to edit
-    lines.append("## Text to Edit")
-    lines.append("")
-    lines.append("```")
-    lines.append(chunk.original_text)
-    lines.append("```")
-    lines.append("")
-
-    # Response section
-    lines.append("## Your Response")
-    lines.append("")
-    lines.append("Write ONLY the edited text below. Do not include explanations or the original text.")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-
-    content = "\n".join(lines)
-    file_path.write_text(content)
+            _write_locked_chunk(out, lc)
+
+    # Text to edit and response section
+    out.write(f"## Text to Edit\n\n```\n{chunk.original_text}\n```\n\n")
+    out.write(_RESPONSE_SECTION)
+
+    file_path.write_bytes(out.getvalue().encode("utf-8"))
 
     return file_path
 
 
+def _write_locked_chunk(out: io.StringIO, lc: Chunk) -> None:
+    """Write a locked chunk's context block"""
+    label = _LOCK_TYPE_LABEL.get(lc.lock_type, "Context")
+    out.write(f"### {lc.id} [{label}]\n")
+    if lc.annotation:
+        out.write(f"**User's guidance:** {lc.annotation}\n")
+    out.write(f"```\n{lc.original_text}\n```\n\n")
+
+
 def save_session(session: Session, session_path: Path) -> None:
-    """Save session metadata to YAML file"""
-    session_file = session_path / "session.yaml"
+    """Save session metadata to JSON file and record it in the manifest"""
     data = session.model_dump(mode="json")
-    with open(session_file, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+    _write_session_data(session_path, data, SessionSummary.from_session(session))
 
 
-def load_session(session_id: str) -> Optional[Session]:
-    """Load a session from its ID"""
-    session_path = get_session_path(session_id)
-    session_file = session_path / "session.yaml"
+def save_session_delta(session_path: Path, patch: Dict[str, Any]) -> None:
+    """Update some fields of a saved session, leaving the rest as saved.
+
+    For frequent small updates (e.g. review decisions): the saved JSON is
+    patched rather than the whole Session re-serialized.
+
+    Args:
+        session_path: Path to the session directory
+        patch: Session fields to update, in their JSON form
+    """
+    session_file = session_path / SESSION_FILE
+    data = json.loads(session_file.read_bytes())
+    data.update(patch)
+    _write_session_data(session_path, data, SessionSummary.from_data(data))
+
+
+def _write_session_data(session_path: Path, data: Dict[str, Any], summary: SessionSummary) -> None:
+    """Write a session's JSON data and record its summary in the manifest"""
+    session_file = session_path / SESSION_FILE
+    # Written beside it, then renamed over it, so a reader never sees half a file
+    tmp_file = session_file.with_name(SESSION_FILE + ".tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    os.replace(tmp_file, session_file)
+    st = os.stat(session_file)
+    _written[str(session_file)] = (st.st_mtime_ns, st.st_size)
+
+    # Saves that leave the summary as it was add no line
+    key = os.path.abspath(session_file)
+    if _manifested.get(key) != summary:
+        manifest_file = session_path.parent / MANIFEST_FILE
+        with open(manifest_file, "a") as f:
+            f.write(json.dumps(asdict(summary)) + "\n")
+        _manifested[key] = summary
+
+
+def load_session(session_id: str, trusted: bool = False) -> Optional[Session]:
+    """Load a session from its ID
 
-    if not session_file.exists():
+    Args:
+        session_id: Session ID
+        trusted: Skip validation if the session file is unchanged since this
+            process last saved it. Any other file is validated as usual.
+    """
+    session_path = get_session_path(session_id)
+    session_file = session_path / SESSION_FILE
+
+    if session_file.exists():
+        raw = session_file.read_bytes()
+        st = os.stat(session_file)
+        if trusted and _written.get(str(session_file)) == (st.st_mtime_ns, st.st_size):
+            data = json.loads(raw)
+            return Session.model_construct(**{
+                **data,
+                "created_at": datetime.fromisoformat(data["created_at"]),
+            })
+        return Session.model_validate_json(raw)
+
+    # One-time migration of session metadata written as YAML
+    legacy_file = session_path / LEGACY_SESSION_FILE
+    if not legacy_file.exists():
         return None
 
-    with open(session_file, "r") as f:
-        data = yaml.safe_load(f)
+    with open(legacy_file, "r") as f:
+        data = yaml.load(f, Loader=SafeLoader)
 
-    return Session.model_validate(data)
+    session = Session.model_validate(data)
+    save_session(session, session_path)
+    legacy_file.unlink()
+    return session
 
 
 def list_sessions() -> List[str]:
-    """List all session IDs"""
-    sessions_dir = get_sessions_dir()
-    if not sessions_dir.exists():
+    """List all session IDs
+
+    Every directory in the sessions dir is a session. Whether its metadata
+    exists yet (e.g. mid-creation) is left to load_session(), so listing
+    needs no per-session stat calls.
+    """
+    try:
+        with os.scandir(get_sessions_dir()) as it:
+            return [e.name for e in it if e.is_dir()]
+    except FileNotFoundError:
         return []
 
-    return [d.name for d in sessions_dir.iterdir() if d.is_dir() and (d / "session.yaml").exists()]
+
+def list_session_summaries() -> List[SessionSummary]:
+    """Get summaries of all sessions from the manifest.
+
+    Sessions missing from the manifest (e.g. created before it existed) are
+    loaded from their session file, and the manifest is rewritten whenever
+    it is out of step with the session directories or has superseded lines.
+    """
+    session_ids = list_sessions()
+    if not session_ids:
+        return []
+
+    manifest_file = get_sessions_dir() / MANIFEST_FILE
+    entries: dict[str, SessionSummary] = {}
+    line_count = 0
+    if manifest_file.exists():
+        with open(manifest_file, "r") as f:
+            for line in f:
+                line_count += 1
+                try:
+                    summary = SessionSummary(**json.loads(line))
+                except (json.JSONDecodeError, TypeError):
+                    continue  # Torn or malformed line; rebuilt below
+                entries[summary.id] = summary
+
+    for sid in session_ids:
+        if sid not in entries:
+            session = load_session(sid)
+            if session:
+                entries[sid] = SessionSummary.from_session(session)
+
+    summaries = [entries[sid] for sid in session_ids if sid in entries]
+
+    if line_count != len(summaries) or len(entries) != len(summaries):
+        with open(manifest_file, "w") as f:
+            for summary in summaries:
+                f.write(json.dumps(asdict(summary)) + "\n")
+
+    return summaries
 
 
 def update_session_status(session_id: str, status: str) -> None:
     """Update a session's status"""
-    session = load_session(session_id)
+    session = load_session(session_id, trusted=True)
     if session:
         session.status = status
         session_path = get_session_path(session_id)
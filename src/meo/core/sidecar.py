@@ -1,65 +1,192 @@
-"""Sidecar file I/O - YAML storage for project state"""
+"""Sidecar file I/O - JSON storage for project state"""
 
 import hashlib
+import json
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import yaml
 from pydantic import ValidationError
 
+from meo.models.chunk import Chunk, ChunkCategory, Location, LockType, TextRange
 from meo.models.project import ProjectState
+from meo.core.yaml_io import SafeLoader
+
+
+SIDECAR_VERSION = ProjectState.model_fields["version"].default
+
+# (mtime_ns, size) of each sidecar as this process last wrote it
+_written: dict[str, tuple[int, int]] = {}
 
 
 def get_sidecar_path(source_file: Path) -> Path:
     """Get the sidecar file path for a source file"""
-    return source_file.with_suffix(source_file.suffix + ".meo.yaml")
+    return source_file.with_suffix(source_file.suffix + ".meo.json")
 
 
-def compute_file_hash(file_path: Path) -> str:
-    """Compute SHA256 hash of file contents"""
-    return hashlib.sha256(file_path.read_bytes()).hexdigest()[:16]
+def get_legacy_sidecar_path(source_file: Path) -> Path:
+    """Get the YAML sidecar path used before sidecars were stored as JSON"""
+    return source_file.with_suffix(source_file.suffix + ".meo.yaml")
 
 
-def load_sidecar(source_file: Path) -> Optional[ProjectState]:
-    """Load project state from sidecar file, or None if doesn't exist"""
+def sidecar_exists(source_file: Path) -> bool:
+    """Check whether a source file has a sidecar in either format"""
+    return get_sidecar_path(source_file).exists() or get_legacy_sidecar_path(source_file).exists()
+
+
+# Algorithm for new source fingerprints (change detection only, not security)
+HASH_ALGO = "blake2b"
+
+
+def compute_file_hash(file_path: Path, algo: str = HASH_ALGO) -> str:
+    """Compute a fingerprint of file contents with the given hashlib algorithm"""
+    if algo == "blake2b":
+        digest = hashlib.blake2b(digest_size=16)
+    else:
+        digest = hashlib.new(algo)
+    # Unbuffered: blocks go straight from the OS into the hash
+    with file_path.open("rb", buffering=0) as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, lambda: digest).hexdigest()
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _construct_chunk(data: dict[str, Any]) -> Chunk:
+    """Build a Chunk from its model_dump(mode="json") without validation"""
+    rng = data["range"]
+    lock_type = data.get("lock_type")
+    return Chunk.model_construct(**{
+        **data,
+        "range": TextRange.model_construct(
+            start=Location.model_construct(**rng["start"]),
+            end=Location.model_construct(**rng["end"]),
+        ),
+        "category": ChunkCategory(data["category"]),
+        "lock_type": LockType(lock_type) if lock_type is not None else None,
+    })
+
+
+def _construct_project_state(data: dict[str, Any]) -> ProjectState:
+    """Build a ProjectState from its model_dump(mode="json") without validation"""
+    last_generated_at = data.get("last_generated_at")
+    return ProjectState.model_construct(**{
+        **data,
+        "created_at": datetime.fromisoformat(data["created_at"]),
+        "modified_at": datetime.fromisoformat(data["modified_at"]),
+        "last_generated_at": (
+            datetime.fromisoformat(last_generated_at) if last_generated_at else None
+        ),
+        "chunks": [_construct_chunk(c) for c in data.get("chunks", [])],
+    })
+
+
+def load_sidecar(source_file: Path, trusted: bool = False) -> Optional[ProjectState]:
+    """Load project state from sidecar file, or None if doesn't exist
+
+    Args:
+        source_file: Path to the source markdown file
+        trusted: Skip validation if the sidecar is unchanged since this
+            process last saved it. Any other file is validated as usual.
+    """
     sidecar_path = get_sidecar_path(source_file)
-    if not sidecar_path.exists():
-        return None
+    legacy_path = get_legacy_sidecar_path(source_file)
 
     try:
-        with open(sidecar_path, "r") as f:
-            data = yaml.safe_load(f)
-        return ProjectState.model_validate(data)
-    except (yaml.YAMLError, ValidationError) as e:
+        if sidecar_path.exists():
+            raw = sidecar_path.read_bytes()
+            data = None
+            if trusted and _is_own_write(sidecar_path):
+                data = json.loads(raw)
+                if data.get("version") != SIDECAR_VERSION:
+                    data = None
+            if data is not None:
+                state = _construct_project_state(data)
+            else:
+                # Parsed and validated in one pass by pydantic-core
+                state = ProjectState.model_validate_json(raw)
+        elif legacy_path.exists():
+            with open(legacy_path, "r") as f:
+                data = yaml.load(f, Loader=SafeLoader)
+            state = ProjectState.model_validate(data)
+        else:
+            return None
+    except (ValueError, yaml.YAMLError, ValidationError) as e:
         raise ValueError(f"Invalid sidecar file: {e}")
 
+    # One-time migration of a YAML sidecar to JSON
+    if not sidecar_path.exists():
+        _write_sidecar(sidecar_path, state)
+        legacy_path.unlink()
+
+    # Upgrade fingerprints written with an older algorithm, but only while
+    # the source still matches them (otherwise the change must stay visible)
+    if state.hash_algo != HASH_ALGO and state.source_hash and source_file.exists():
+        if compute_file_hash(source_file, state.hash_algo) == state.source_hash:
+            set_source_fingerprint(source_file, state)
+
+    return state
+
 
 def save_sidecar(source_file: Path, state: ProjectState) -> Path:
     """Save project state to sidecar file"""
     sidecar_path = get_sidecar_path(source_file)
     state.modified_at = datetime.now()
 
-    # Convert to dict with datetime serialization
-    data = state.model_dump(mode="json")
+    _write_sidecar(sidecar_path, state)
+    return sidecar_path
 
-    with open(sidecar_path, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
 
-    return sidecar_path
+def _write_sidecar(sidecar_path: Path, state: ProjectState) -> None:
+    """Write project state as JSON"""
+    # Serialized by pydantic-core straight to JSON, with no intermediate dict
+    sidecar_path.write_text(state.model_dump_json(indent=2) + "\n", encoding="utf-8")
+    st = os.stat(sidecar_path)
+    _written[str(sidecar_path)] = (st.st_mtime_ns, st.st_size)
+
+
+def _is_own_write(sidecar_path: Path) -> bool:
+    """Check that a sidecar hasn't been touched since this process wrote it"""
+    st = os.stat(sidecar_path)
+    return _written.get(str(sidecar_path)) == (st.st_mtime_ns, st.st_size)
+
+
+def set_source_fingerprint(source_file: Path, state: ProjectState) -> None:
+    """Hash the source file into `state`, along with its current mtime and size"""
+    # Stat before hashing, so a write during hashing shows up as a new mtime
+    stat = source_file.stat()
+    state.source_hash = compute_file_hash(source_file)
+    state.hash_algo = HASH_ALGO
+    state.source_mtime_ns = stat.st_mtime_ns
+    state.source_size = stat.st_size
 
 
 def create_new_project(source_file: Path) -> ProjectState:
     """Create a new project state for a source file"""
-    return ProjectState(
+    state = ProjectState(
         source_file=source_file.name,
-        source_hash=compute_file_hash(source_file),
         created_at=datetime.now(),
         modified_at=datetime.now(),
     )
+    set_source_fingerprint(source_file, state)
+    return state
 
 
 def check_source_changed(source_file: Path, state: ProjectState) -> bool:
     """Check if source file has changed since sidecar was created"""
-    current_hash = compute_file_hash(source_file)
-    return current_hash != state.source_hash
+    # Same mtime and size as when it was hashed: unchanged, skip the hash
+    stat = source_file.stat()
+    if state.source_mtime_ns == stat.st_mtime_ns and state.source_size == stat.st_size:
+        return False
+
+    current_hash = compute_file_hash(source_file, state.hash_algo)
+    if current_hash != state.source_hash:
+        return True
+
+    # Touched but not changed - remember the new stat to skip the hash next time
+    state.source_mtime_ns = stat.st_mtime_ns
+    state.source_size = stat.st_size
+    return False
@@ -1,7 +1,23 @@
 """Text replacement utilities for applying AI responses to working files"""
 
+import mmap
+import os
+import shutil
+from bisect import bisect_left, insort
+from operator import itemgetter
 from pathlib import Path
-from typing import Tuple
+from typing import List, Optional, Sequence, Tuple
+
+
+# Files at least this large are searched through mmap rather than read in
+MMAP_THRESHOLD = 256 * 1024
+
+
+def normalize_newlines(text: str) -> str:
+    """Convert CRLF line endings to LF, without copying text that has none"""
+    if '\r' not in text:
+        return text
+    return text.replace('\r\n', '\n')
 
 
 def apply_chunk_to_working(
@@ -23,18 +39,52 @@ def apply_chunk_to_working(
     Returns:
         True if replacement successful, False if original text not found
     """
-    working_file = session_path / "working.md"
+    return apply_chunk_to_file(session_path / "working.md", original_text, replacement_text)
 
-    if not working_file.exists():
-        return False
 
-    content = working_file.read_text()
+def apply_chunk_to_working_content(
+    session_path: Path,
+    content: str,
+    original_text: str,
+    replacement_text: str
+) -> Optional[str]:
+    """Replace original_text with replacement_text in working.md, given its content.
+
+    For callers that keep working.md's text in memory: the replacement is
+    made in `content` and written out, so the file isn't read, then read
+    back. Leaves working.md as apply_chunk_to_working() would.
+
+    Args:
+        session_path: Path to session directory
+        content: working.md's current text, as read in text mode
+        original_text: The original text to find and replace
+        replacement_text: The AI response to insert
+
+    Returns:
+        The new content, or None if original text not found (working.md is
+        left as is)
+    """
     new_content, success = find_and_replace_text(content, original_text, replacement_text)
+    if not success:
+        return None
+    _replace_file(session_path / "working.md", new_content.encode("utf-8"))
+    return new_content
 
-    if success:
-        working_file.write_text(new_content)
 
-    return success
+def apply_chunks_batch(
+    session_path: Path,
+    replacements: Sequence[Tuple[str, str]]
+) -> List[bool]:
+    """Apply several chunk replacements to working.md in one read and write.
+
+    Args:
+        session_path: Path to session directory
+        replacements: (original_text, replacement_text) pairs
+
+    Returns:
+        Whether each pair was applied, in the same order
+    """
+    return apply_chunks_to_file(session_path / "working.md", replacements)
 
 
 def find_and_replace_text(
@@ -59,21 +109,28 @@ def find_and_replace_text(
         return content, False
 
     # Normalize line endings for comparison
-    normalized_content = content.replace('\r\n', '\n')
-    normalized_original = original.replace('\r\n', '\n')
-
-    if normalized_original not in normalized_content:
-        # Try stripping whitespace as fallback
+    normalized_content = normalize_newlines(content)
+    normalized_original = normalize_newlines(original)
+
+    # One search, then splice around the first occurrence. str.find (like
+    # mmap.find below) is CPython's fastsearch: a Horspool-style skip loop
+    # that switches to two-way search for long needles, so long paragraph
+    # needles already get sublinear scans without a custom search.
+    idx = normalized_content.find(normalized_original)
+    if idx == -1:
+        # Try stripping whitespace as fallback - unless there is none to strip,
+        # when the same search would just miss again
         stripped_original = normalized_original.strip()
-        if stripped_original and stripped_original in normalized_content:
-            # Find and replace the stripped version
-            new_content = normalized_content.replace(stripped_original, replacement.strip(), 1)
-            return new_content, True
-        return content, False
+        if not stripped_original or len(stripped_original) == len(normalized_original):
+            return content, False
+        normalized_original = stripped_original
+        replacement = replacement.strip()
+        idx = normalized_content.find(normalized_original)
+        if idx == -1:
+            return content, False
 
-    # Replace first occurrence
-    new_content = normalized_content.replace(normalized_original, replacement, 1)
-    return new_content, True
+    end = idx + len(normalized_original)
+    return normalized_content[:idx] + replacement + normalized_content[end:], True
 
 
 def apply_chunk_to_file(
@@ -96,15 +153,171 @@ def apply_chunk_to_file(
     if not file_path.exists():
         return False
 
-    content = file_path.read_text()
+    applied = _apply_to_bytes(file_path, original_text, replacement_text)
+    if applied is not None:
+        return applied
+
+    content = _read_text(file_path)
     new_content, success = find_and_replace_text(content, original_text, replacement_text)
 
     if success:
-        file_path.write_text(new_content)
+        _write_in_place(file_path, 0, new_content.encode("utf-8"))
 
     return success
 
 
+def apply_chunks_to_file(
+    file_path: Path,
+    replacements: Sequence[Tuple[str, str]]
+) -> List[bool]:
+    """Apply several replacements to a file, reading and writing it once.
+
+    Each original is matched like find_and_replace_text() does, but in the
+    file as it was before the batch and skipping text that an earlier pair
+    already matched. Chunks never overlap, so this gives the same result as
+    applying them one at a time.
+
+    Args:
+        file_path: Path to the file to modify
+        replacements: (original_text, replacement_text) pairs
+
+    Returns:
+        Whether each pair was applied, in the same order
+    """
+    if not file_path.exists():
+        return [False] * len(replacements)
+
+    content = normalize_newlines(_read_text(file_path))
+
+    # (start, end, replacement) of each match, sorted by start
+    spans: List[Tuple[int, int, str]] = []
+    applied = []
+    for original, replacement in replacements:
+        span = _find_free_span(content, spans, original, replacement)
+        if span is not None:
+            insort(spans, span, key=itemgetter(0))
+        applied.append(span is not None)
+
+    if spans:
+        parts = []
+        pos = 0
+        for start, end, replacement in spans:
+            parts.append(content[pos:start])
+            parts.append(replacement)
+            pos = end
+        parts.append(content[pos:])
+        _write_in_place(file_path, 0, "".join(parts).encode("utf-8"))
+
+    return applied
+
+
+def _find_free_span(
+    content: str,
+    spans: List[Tuple[int, int, str]],
+    original: str,
+    replacement: str
+) -> Optional[Tuple[int, int, str]]:
+    """Find the first match of original that doesn't overlap any of spans"""
+    original = normalize_newlines(original)
+    if not original:
+        return None
+
+    # Exact match first, then the stripped whitespace fallback
+    candidates = [(original, replacement)]
+    stripped = original.strip()
+    if stripped and len(stripped) != len(original):
+        candidates.append((stripped, replacement.strip()))
+
+    for needle, text in candidates:
+        idx = content.find(needle)
+        while idx != -1:
+            end = idx + len(needle)
+            i = bisect_left(spans, idx, key=itemgetter(0))
+            if (i == 0 or spans[i - 1][1] <= idx) and (i == len(spans) or spans[i][0] >= end):
+                return idx, end, text
+            idx = content.find(needle, idx + 1)
+    return None
+
+
+def _apply_to_bytes(file_path: Path, original: str, replacement: str) -> Optional[bool]:
+    """Replace the first exact match in a file without decoding it.
+
+    The file is searched as UTF-8 bytes (through mmap when large) and only
+    the replacement is encoded; the bytes after the match are copied as is,
+    and the ones before it aren't rewritten.
+
+    Returns:
+        True if replaced, False if not found, or None when the text path is
+        needed instead (CRLF line endings, or no exact match for an original
+        with outer whitespace, so the whitespace fallback applies)
+    """
+    if not original or '\r' in original:
+        return None
+    needle = original.encode("utf-8")
+
+    # Unbuffered: read() sizes one read from fstat, with no buffer copy
+    with open(file_path, "rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size and size >= MMAP_THRESHOLD:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            data = f.read()
+
+    try:
+        if data.find(b"\r") != -1:
+            return None
+        idx = data.find(needle)
+        if idx == -1:
+            # Only the whitespace fallback could still match
+            stripped = original.strip()
+            return None if stripped and len(stripped) != len(original) else False
+        # Copied out before the file is written over; the bytes before the
+        # match are left where they are
+        tail = data[idx + len(needle):]
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
+    _write_in_place(file_path, idx, replacement.encode("utf-8"), tail)
+    return True
+
+
+def _read_text(file_path: Path) -> str:
+    """Read a whole file as UTF-8, the encoding replacements are written in"""
+    with open(file_path, "rb", buffering=0) as f:
+        text = f.read().decode("utf-8")
+    # Universal newlines, as text-mode reads give
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _write_in_place(file_path: Path, offset: int, *parts) -> None:
+    """Write parts over file_path from offset on, dropping anything after them.
+
+    The file itself is kept, so symlinks, hard links, ownership and extended
+    attributes survive, as needed for the user's own files.
+    """
+    with open(file_path, "r+b") as out:
+        out.seek(offset)
+        for part in parts:
+            out.write(part)
+        out.truncate()
+
+
+def _replace_file(file_path: Path, *parts) -> None:
+    """Write parts to a file beside file_path, then rename it over file_path.
+
+    Only for files the session owns, like working.md: the rename replaces a
+    symlink rather than following it, and loses hard links and ownership.
+    """
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    with open(tmp_path, "wb") as out:
+        for part in parts:
+            out.write(part)
+    shutil.copymode(file_path, tmp_path)
+    os.replace(tmp_path, file_path)
+
+
 def validate_text_exists(content: str, expected_text: str) -> bool:
     """Check if expected text exists in content.
 
@@ -118,7 +331,9 @@ def validate_text_exists(content: str, expected_text: str) -> bool:
     if not expected_text:
         return False
 
-    normalized_content = content.replace('\r\n', '\n')
-    normalized_expected = expected_text.replace('\r\n', '\n')
+    # normalize_newlines() hands back text without a CR as is, so LF-only
+    # inputs get a single `in` search with no copies
+    normalized_content = normalize_newlines(content)
+    normalized_expected = normalize_newlines(expected_text)
 
     return normalized_expected in normalized_content
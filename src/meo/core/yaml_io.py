@@ -0,0 +1,8 @@
+"""YAML loader/dumper selection - libyaml when available"""
+
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
+
+__all__ = ["SafeLoader", "SafeDumper"]
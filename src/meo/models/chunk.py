@@ -1,8 +1,9 @@
 """Chunk model - represents a marked section of text for editing"""
 
 from enum import Enum
-from typing import Optional
-from pydantic import BaseModel, Field
+from functools import cached_property
+from typing import Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ChunkCategory(str, Enum):
@@ -21,36 +22,35 @@ class LockType(str, Enum):
 
 class Location(BaseModel):
     """Zero-indexed position in document"""
+    model_config = ConfigDict(frozen=True)
+
     row: int
     col: int
 
 
 class TextRange(BaseModel):
     """A range of text in the document"""
+    # Immutable, so the cached bounds can't go stale
+    model_config = ConfigDict(frozen=True)
+
     start: Location
     end: Location
 
+    @cached_property
+    def bounds(self) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """(row, col) of start and end, which compare in document order"""
+        return (self.start.row, self.start.col), (self.end.row, self.end.col)
+
     def contains(self, row: int, col: int) -> bool:
         """Check if a position is within this range"""
-        if row < self.start.row or row > self.end.row:
-            return False
-        if row == self.start.row and col < self.start.col:
-            return False
-        if row == self.end.row and col > self.end.col:
-            return False
-        return True
+        start, end = self.bounds
+        return start <= (row, col) <= end
 
     def overlaps(self, other: "TextRange") -> bool:
         """Check if this range overlaps with another"""
-        if self.end.row < other.start.row:
-            return False
-        if self.start.row > other.end.row:
-            return False
-        if self.end.row == other.start.row and self.end.col < other.start.col:
-            return False
-        if self.start.row == other.end.row and self.start.col > other.end.col:
-            return False
-        return True
+        start, end = self.bounds
+        other_start, other_end = other.bounds
+        return start <= other_end and other_start <= end
 
 
 class Chunk(BaseModel):
@@ -1,9 +1,14 @@
 """Config model for MEO"""
 
+import os
 from pathlib import Path
 from pydantic import BaseModel, field_validator
 
 
+# Last get_markdown_files() listing of each folder, with the folder's mtime_ns
+_markdown_files_cache: dict[str, tuple[int, list[Path]]] = {}
+
+
 class MeoConfig(BaseModel):
     """Configuration for MEO - stored in .meo/config.yaml"""
 
@@ -23,9 +28,31 @@ class MeoConfig(BaseModel):
         """Get folder as Path object"""
         return Path(self.folder)
 
-    def get_markdown_files(self) -> list[Path]:
-        """Get all .md files in the configured folder (non-recursive)"""
-        folder = self.folder_path
-        if not folder.exists():
+    def get_markdown_files(self, rescan: bool = False) -> list[Path]:
+        """Get all .md files in the configured folder (non-recursive)
+
+        Args:
+            rescan: List the folder even if its mtime is unchanged
+        """
+        try:
+            mtime_ns = os.stat(self.folder).st_mtime_ns
+        except FileNotFoundError:
             return []
-        return sorted(folder.glob("*.md"))
+
+        # Adding, removing or renaming a file updates the folder's mtime
+        cached = _markdown_files_cache.get(self.folder)
+        if cached is not None and cached[0] == mtime_ns and not rescan:
+            return list(cached[1])
+
+        with os.scandir(self.folder) as it:
+            files = sorted(Path(e.path) for e in it if e.name.endswith(".md") and e.is_file())
+        _markdown_files_cache[self.folder] = (mtime_ns, files)
+        return list(files)
+
+    def has_markdown_files(self) -> bool:
+        """Check whether the folder contains any .md file, stopping at the first one"""
+        folder = self.folder_path
+        if not folder.is_dir():
+            return False
+        with os.scandir(folder) as it:
+            return any(e.name.endswith(".md") and e.is_file() for e in it)
@@ -1,7 +1,7 @@
 """Direction model - editing instruction presets"""
 
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 
 class DirectionPreset(BaseModel):
@@ -11,12 +11,17 @@ class DirectionPreset(BaseModel):
     description: str
     prompt_template: str
 
+    # prompt_template followed by the annotation heading, built once
+    _annotated_prefix: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context) -> None:
+        self._annotated_prefix = self.prompt_template + "\n\n**User's additional guidance:** "
+
     def render(self, annotation: Optional[str] = None) -> str:
         """Render the full instruction with optional annotation"""
-        result = self.prompt_template
         if annotation:
-            result += f"\n\n**User's additional guidance:** {annotation}"
-        return result
+            return self._annotated_prefix + annotation
+        return self.prompt_template
 
 
 class Direction(BaseModel):
@@ -1,11 +1,26 @@
-"""Project state model - stored in sidecar YAML file"""
+"""Project state model - stored in sidecar JSON file"""
 
+from bisect import bisect_left
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from typing import List, Optional, Tuple
+from pydantic import BaseModel, Field, PrivateAttr
 
-from meo.models.chunk import Chunk
+from meo.models.chunk import Chunk, TextRange
+
+# (start, end, chunk_id) of a chunk's range, with (row, col) positions
+_RangeEntry = Tuple[Tuple[int, int], Tuple[int, int], str]
+
+
+def _chunk_num(chunk_id: str) -> int:
+    """Get the number of a chunk_NNN ID, or 0 for any other ID"""
+    if chunk_id.startswith("chunk_"):
+        try:
+            return int(chunk_id.split("_")[1])
+        except (IndexError, ValueError):
+            pass
+    return 0
 
 
 class ProjectState(BaseModel):
@@ -13,6 +28,12 @@ class ProjectState(BaseModel):
     version: str = "1.0"
     source_file: str
     source_hash: str = ""
+    # Sidecars written before this field existed used MD5
+    hash_algo: str = "md5"
+    # Source file's mtime/size when source_hash was computed, so an
+    # untouched file can be recognised without rehashing it
+    source_mtime_ns: Optional[int] = None
+    source_size: Optional[int] = None
     created_at: datetime = Field(default_factory=datetime.now)
     modified_at: datetime = Field(default_factory=datetime.now)
 
@@ -22,45 +43,117 @@ class ProjectState(BaseModel):
     output_file: Optional[str] = None
     last_generated_at: Optional[datetime] = None
 
+    # Chunk ranges sorted by start, for overlap checks, and the chunks list
+    # they were built from
+    _sorted_ranges: List[_RangeEntry] = PrivateAttr(default_factory=list)
+    _ranges_chunks: Optional[List[Chunk]] = PrivateAttr(default=None)
+    # Highest chunk_NNN number added so far, and the chunks length it was
+    # last brought up to date with
+    _max_chunk_num: int = PrivateAttr(default=0)
+    _counted_chunks: int = PrivateAttr(default=0)
+    # get_chunks_needing_direction() result, with the chunks list and length
+    # it was computed from
+    _direction_cache: Optional[Tuple[List[Chunk], int, List[Chunk]]] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context) -> None:
+        self._count_chunks()
+
+    def _count_chunks(self) -> None:
+        """Raise _max_chunk_num to cover chunks added by changing `chunks` directly"""
+        seen = max((_chunk_num(c.id) for c in self.chunks), default=0)
+        self._max_chunk_num = max(self._max_chunk_num, seen)
+        self._counted_chunks = len(self.chunks)
+
     def get_chunks_needing_direction(self) -> List[Chunk]:
-        """Get chunks that need direction assignment"""
-        return [c for c in self.chunks if c.needs_direction]
+        """Get chunks that need direction assignment
+
+        The result is cached until chunks are added or removed (including by
+        changing or replacing `chunks` directly), so it must not be modified.
+        """
+        cache = self._direction_cache
+        if cache is not None and cache[0] is self.chunks and cache[1] == len(self.chunks):
+            return cache[2]
+        needing = [c for c in self.chunks if c.needs_direction]
+        self._direction_cache = (self.chunks, len(self.chunks), needing)
+        return needing
+
+    def invalidate_direction_cache(self) -> None:
+        """Forget get_chunks_needing_direction()'s result, e.g. after changing a
+        chunk's category in place"""
+        self._direction_cache = None
 
     def get_chunks_in_execution_order(self) -> List[Chunk]:
         """Get chunks sorted by execution order"""
+        # Not cached: the UI assigns chunk fields in place, which a cache here
+        # couldn't see, and this only runs once per generated output
         actionable = [c for c in self.chunks if c.needs_direction]
         return sorted(actionable, key=lambda c: c.execution_order or 999)
 
     def next_chunk_id(self) -> str:
-        """Generate next chunk ID"""
-        existing_nums = []
-        for chunk in self.chunks:
-            if chunk.id.startswith("chunk_"):
-                try:
-                    num = int(chunk.id.split("_")[1])
-                    existing_nums.append(num)
-                except (IndexError, ValueError):
-                    pass
-        next_num = max(existing_nums, default=0) + 1
-        return f"chunk_{next_num:03d}"
+        """Generate next chunk ID
+
+        The ID is only taken once a chunk with it is added, so calling this
+        again before then gives the same ID. A removed chunk's ID isn't given
+        out again until the state is reloaded, which starts counting from the
+        chunks that are left.
+        """
+        if self._counted_chunks != len(self.chunks):
+            self._count_chunks()
+        return f"chunk_{self._max_chunk_num + 1:03d}"
+
+    def _range_index(self) -> List[_RangeEntry]:
+        """Get the sorted chunk ranges, rebuilding them if chunks was changed directly
+
+        Like get_chunks_needing_direction(), chunks being added or removed, or
+        `chunks` being replaced, is noticed; changing a chunk in place isn't.
+        """
+        if self._ranges_chunks is not self.chunks or len(self._sorted_ranges) != len(self.chunks):
+            self._sorted_ranges = sorted((*c.range.bounds, c.id) for c in self.chunks)
+            self._ranges_chunks = self.chunks
+        return self._sorted_ranges
+
+    def find_overlap(self, text_range: TextRange) -> Optional[str]:
+        """Get the ID of a chunk overlapping text_range, if any
+
+        Chunks never overlap each other, so only the chunks starting just
+        before and at/after text_range need checking.
+        """
+        index = self._range_index()
+        start, end = text_range.bounds
+        i = bisect_left(index, start, key=itemgetter(0))
+        if i > 0 and index[i - 1][1] >= start:
+            return index[i - 1][2]
+        if i < len(index) and index[i][0] <= end:
+            return index[i][2]
+        return None
 
     def add_chunk(self, chunk: Chunk) -> None:
         """Add a chunk, checking for overlaps"""
-        for existing in self.chunks:
-            if chunk.range.overlaps(existing.range):
-                raise ValueError(f"Chunk overlaps with {existing.id}")
+        overlap = self.find_overlap(chunk.range)
+        if overlap is not None:
+            raise ValueError(f"Chunk overlaps with {overlap}")
+        start, end = chunk.range.bounds
+        index = self._range_index()
+        index.insert(bisect_left(index, start, key=itemgetter(0)), (start, end, chunk.id))
         self.chunks.append(chunk)
+        self.invalidate_direction_cache()
+        self._max_chunk_num = max(self._max_chunk_num, _chunk_num(chunk.id))
+        self._counted_chunks = len(self.chunks)
         self.modified_at = datetime.now()
 
     def remove_chunk(self, chunk_id: str) -> bool:
         """Remove a chunk by ID"""
         for i, chunk in enumerate(self.chunks):
             if chunk.id == chunk_id:
+                index = self._range_index()
                 self.chunks.pop(i)
+                self._sorted_ranges = [r for r in index if r[2] != chunk_id]
+                self._counted_chunks = len(self.chunks)
+                self.invalidate_direction_cache()
                 self.modified_at = datetime.now()
                 return True
         return False
 
     def get_sidecar_path(self, source_path: Path) -> Path:
         """Get the sidecar file path for a source file"""
-        return source_path.with_suffix(source_path.suffix + ".meo.yaml")
+        return source_path.with_suffix(source_path.suffix + ".meo.json")
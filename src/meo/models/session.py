@@ -35,10 +35,10 @@ class Session(BaseModel):
 
     def get_pending_chunks(self) -> List[str]:
         """Get chunks that haven't been applied or skipped"""
-        return [
-            c for c in self.chunks
-            if c not in self.applied_chunks and c not in self.skipped_chunks
-        ]
+        # One set lookup per chunk, rather than scanning both lists for each
+        reviewed = set(self.applied_chunks)
+        reviewed.update(self.skipped_chunks)
+        return [c for c in self.chunks if c not in reviewed]
 
     def mark_chunk_applied(self, chunk_id: str) -> None:
         """Mark a chunk as applied"""
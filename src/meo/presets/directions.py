@@ -1,6 +1,6 @@
 """Built-in direction presets for editing - split by action type"""
 
-from typing import Optional
+from typing import Dict, Optional
 from meo.models.direction import DirectionPreset
 
 
@@ -84,12 +84,14 @@ TWEAK_PRESETS = [
 BUILTIN_PRESETS = REPLACE_PRESETS + TWEAK_PRESETS
 
 
+# Presets by ID. Both lists have an identical "custom" preset; as when
+# searching the lists in order, the replace one is kept.
+_PRESETS_BY_ID: Dict[str, DirectionPreset] = {}
+for _preset in BUILTIN_PRESETS:
+    _PRESETS_BY_ID.setdefault(_preset.id, _preset)
+del _preset
+
+
 def get_preset_by_id(preset_id: str) -> Optional[DirectionPreset]:
     """Get a preset by its ID (searches both lists)"""
-    for preset in REPLACE_PRESETS:
-        if preset.id == preset_id:
-            return preset
-    for preset in TWEAK_PRESETS:
-        if preset.id == preset_id:
-            return preset
-    return None
+    return _PRESETS_BY_ID.get(preset_id)
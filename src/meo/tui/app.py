@@ -1,5 +1,6 @@
 """Main Textual application for MEO"""
 
+from functools import cached_property
 from pathlib import Path
 
 from textual.app import App
@@ -7,15 +8,16 @@ from textual.binding import Binding
 
 from meo.models.project import ProjectState
 from meo.core.sidecar import save_sidecar
-from meo.core.output_generator import save_output
 from meo.tui.screens.selection import SelectionScreen
-from meo.tui.screens.directions import DirectionsScreen
 
 
 class MeoApp(App):
     """Main MEO TUI application"""
 
     TITLE = "MEO - Markdown Edit Orchestrator"
+    # Parsed once per app instance and cached on its Stylesheet. Textual has
+    # no public way to share parsed rules between instances, and one app
+    # runs per process, so it stays a plain string.
     CSS = """
     Screen {
         background: $surface;
@@ -217,7 +219,15 @@ class MeoApp(App):
         super().__init__()
         self.source_file = source_file
         self.state = state
-        self.source_content = source_file.read_text()
+
+    @cached_property
+    def source_content(self) -> str:
+        """Source file text, read on first use"""
+        return self.source_file.read_text()
+
+    def _invalidate_source(self) -> None:
+        """Re-read the source file on next use of source_content"""
+        self.__dict__.pop("source_content", None)
 
     def on_mount(self) -> None:
         """Start with selection screen"""
@@ -234,6 +244,8 @@ class MeoApp(App):
 
     def go_to_directions(self) -> None:
         """Switch to directions screen"""
+        from meo.tui.screens.directions import DirectionsScreen
+
         self.pop_screen()
         self.push_screen(DirectionsScreen(self.source_file, self.state))
 
@@ -244,7 +256,10 @@ class MeoApp(App):
 
     def generate_and_exit(self) -> None:
         """Generate output and exit"""
+        from meo.core.output_generator import save_output
+
         output_path = save_output(self.state, self.source_file)
+        self._invalidate_source()
         save_sidecar(self.source_file, self.state)
         self.exit(message=f"Generated: {output_path}")
 
@@ -261,6 +276,9 @@ class MeoApp(App):
         # 2. Save sidecar
         save_sidecar(self.source_file, self.state)
 
+        # Review applies approved edits to the source file
+        self._invalidate_source()
+
         # 3. Push processing screen (handles AI edit and transitions to review)
         self.pop_screen()
         self.push_screen(ProcessingScreen(session, session_path))
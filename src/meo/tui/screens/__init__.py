@@ -1,7 +1,12 @@
 """TUI screens for MEO"""
 
-from meo.tui.screens.file_picker import FilePickerScreen
-from meo.tui.screens.selection import SelectionScreen
-from meo.tui.screens.directions import DirectionsScreen
+from meo.core.lazy_exports import lazy_exports
 
 __all__ = ["FilePickerScreen", "SelectionScreen", "DirectionsScreen"]
+
+# Resolved on first access, so importing one screen doesn't import the others
+__getattr__, __dir__ = lazy_exports(globals(), {
+    "FilePickerScreen": ("meo.tui.screens.file_picker", "FilePickerScreen"),
+    "SelectionScreen": ("meo.tui.screens.selection", "SelectionScreen"),
+    "DirectionsScreen": ("meo.tui.screens.directions", "DirectionsScreen"),
+})
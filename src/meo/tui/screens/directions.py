@@ -14,6 +14,17 @@ from meo.presets import BUILTIN_PRESETS
 from meo.tui.widgets import GenerateConfirmModal
 
 
+# Radio button (value, label) per preset - the presets are fixed
+_PRESET_BUTTONS = [(p.id, f"{p.name} - {p.description}") for p in BUILTIN_PRESETS]
+
+# Button index of each preset ID; the first one wins for the "custom" ID
+# both preset lists share
+_PRESET_INDEX: dict[str, int] = {}
+for _i, _preset in enumerate(BUILTIN_PRESETS):
+    _PRESET_INDEX.setdefault(_preset.id, _i)
+del _i, _preset
+
+
 class DirectionsScreen(Screen):
     """Screen for assigning directions to chunks"""
 
@@ -31,6 +42,8 @@ class DirectionsScreen(Screen):
         self.state = state
         self.chunks = state.get_chunks_needing_direction()
         self.current_index = 0
+        # Formatted text previews by chunk ID (original_text never changes)
+        self._previews: dict[str, str] = {}
 
     def compose(self) -> ComposeResult:
         yield Static("[bold]MEO - Directions[/bold]", classes="title")
@@ -46,7 +59,10 @@ class DirectionsScreen(Screen):
 
             with Vertical(id="direction-panel"):
                 yield Static("[bold]Select Direction[/bold]")
-                yield RadioSet(id="direction-radio")
+                # Buttons are composed with the set, so they exist on mount
+                with RadioSet(id="direction-radio"):
+                    for value, label in _PRESET_BUTTONS:
+                        yield RadioButton(label, value=value)
                 yield Static("\n[bold]Annotation (optional)[/bold]")
                 yield TextArea(id="annotation-input")
 
@@ -59,15 +75,15 @@ class DirectionsScreen(Screen):
 
     def on_mount(self) -> None:
         """Initialize the screen"""
-        self._setup_radio_buttons()
-        self._display_current_chunk()
+        # The widget tree is fixed from here on, so look widgets up once
+        self._header = self.query_one("#chunk-header", Static)
+        self._text = self.query_one("#chunk-text", Static)
+        self._radio = self.query_one("#direction-radio", RadioSet)
+        self._annotation = self.query_one("#annotation-input", TextArea)
+        self._prev_btn = self.query_one("#prev-btn", Button)
+        self._next_btn = self.query_one("#next-btn", Button)
 
-    def _setup_radio_buttons(self) -> None:
-        """Set up the direction radio buttons"""
-        radio_set = self.query_one("#direction-radio", RadioSet)
-
-        for preset in BUILTIN_PRESETS:
-            radio_set.mount(RadioButton(f"{preset.name} - {preset.description}", value=preset.id))
+        self._display_current_chunk()
 
     def _display_current_chunk(self) -> None:
         """Display the current chunk"""
@@ -77,36 +93,42 @@ class DirectionsScreen(Screen):
         chunk = self.chunks[self.current_index]
 
         # Update header
-        header = self.query_one("#chunk-header", Static)
-        header.update(
+        self._header.update(
             f"[bold]Chunk {self.current_index + 1} of {len(self.chunks)}:[/bold] "
             f"{chunk.id} [{chunk.category.value}]"
         )
 
         # Update text preview
-        text_widget = self.query_one("#chunk-text", Static)
-        preview = chunk.original_text
-        if len(preview) > 500:
-            preview = preview[:500] + "\n..."
-        text_widget.update(f"```\n{preview}\n```")
+        self._text.update(self._get_preview(chunk))
 
         # Update direction selection
-        radio_set = self.query_one("#direction-radio", RadioSet)
-        if chunk.direction_preset:
-            for i, btn in enumerate(radio_set.query(RadioButton)):
-                if getattr(btn, "value", None) == chunk.direction_preset:
-                    radio_set.index = i
-                    break
+        index = _PRESET_INDEX.get(chunk.direction_preset)
+        if index is not None:
+            self._radio.index = index
 
         # Update annotation
-        annotation_input = self.query_one("#annotation-input", TextArea)
-        annotation_input.text = chunk.annotation or ""
+        self._annotation.text = chunk.annotation or ""
 
         # Update navigation buttons
-        prev_btn = self.query_one("#prev-btn", Button)
-        next_btn = self.query_one("#next-btn", Button)
-        prev_btn.disabled = self.current_index == 0
-        next_btn.disabled = self.current_index == len(self.chunks) - 1
+        self._prev_btn.disabled = self.current_index == 0
+        self._next_btn.disabled = self.current_index == len(self.chunks) - 1
+
+    def _get_preview(self, chunk: Chunk) -> str:
+        """Get a chunk's text preview, formatting it on first display"""
+        formatted = self._previews.get(chunk.id)
+        if formatted is None:
+            preview = chunk.original_text
+            if len(preview) > 500:
+                preview = preview[:500] + "\n..."
+            formatted = self._previews[chunk.id] = f"```\n{preview}\n```"
+        return formatted
+
+    def _set_direction(self, chunk: Chunk, pressed_index: int) -> None:
+        """Set a chunk's direction from the index of the pressed radio button"""
+        # Buttons are in BUILTIN_PRESETS order. A button's own `value` is its
+        # pressed state once the set is used, so it can't hold the preset ID.
+        if 0 <= pressed_index < len(BUILTIN_PRESETS):
+            chunk.direction_preset = BUILTIN_PRESETS[pressed_index].id
 
     def _save_current_chunk(self) -> None:
         """Save the current direction and annotation to the chunk"""
@@ -116,16 +138,10 @@ class DirectionsScreen(Screen):
         chunk = self.chunks[self.current_index]
 
         # Get selected direction
-        radio_set = self.query_one("#direction-radio", RadioSet)
-        if radio_set.pressed_index is not None:
-            buttons = list(radio_set.query(RadioButton))
-            if radio_set.pressed_index < len(buttons):
-                selected_btn = buttons[radio_set.pressed_index]
-                chunk.direction_preset = getattr(selected_btn, "value", None)
+        self._set_direction(chunk, self._radio.pressed_index)
 
         # Get annotation
-        annotation_input = self.query_one("#annotation-input", TextArea)
-        annotation = annotation_input.text.strip()
+        annotation = self._annotation.text.strip()
         chunk.annotation = annotation if annotation else None
 
     def action_prev_chunk(self) -> None:
@@ -184,4 +200,6 @@ class DirectionsScreen(Screen):
 
     def on_radio_set_changed(self, event: RadioSet.Changed) -> None:
         """Handle direction selection change"""
-        self._save_current_chunk()
+        # Only the direction changed; the annotation is saved on navigation
+        if self.chunks:
+            self._set_direction(self.chunks[self.current_index], event.index)
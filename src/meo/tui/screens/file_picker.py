@@ -1,5 +1,6 @@
 """File picker screen - Select a markdown file to edit"""
 
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -10,32 +11,29 @@ from textual.screen import Screen
 from textual.widgets import Static, Footer, ListView, ListItem, Label
 
 from meo.models.config import MeoConfig
-from meo.core.sidecar import get_sidecar_path
+from meo.core.sidecar import get_legacy_sidecar_path, get_sidecar_path
 
 
 class FileListItem(ListItem):
     """A list item representing a markdown file"""
 
-    def __init__(self, file_path: Path):
+    def __init__(self, file_path: Path, stat: os.stat_result, has_sidecar: bool):
         super().__init__()
         self.file_path = file_path
+        self.has_sidecar = has_sidecar
 
-    def compose(self) -> ComposeResult:
-        # Get file info
-        stat = self.file_path.stat()
+        # Build the label text up front from the listing's stat
         size_kb = stat.st_size / 1024
         modified = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M")
-
-        # Check if sidecar exists
-        sidecar_path = get_sidecar_path(self.file_path)
-        has_sidecar = sidecar_path.exists()
         sidecar_indicator = "[cyan]●[/]" if has_sidecar else " "
-
-        yield Label(
-            f"{sidecar_indicator} [bold]{self.file_path.name}[/bold]\n"
+        self._label_text = (
+            f"{sidecar_indicator} [bold]{file_path.name}[/bold]\n"
             f"  [dim]{size_kb:.1f} KB  •  {modified}[/dim]"
         )
 
+    def compose(self) -> ComposeResult:
+        yield Label(self._label_text)
+
 
 class FilePickerScreen(Screen):
     """Screen for selecting a markdown file to edit"""
@@ -72,12 +70,12 @@ class FilePickerScreen(Screen):
         file_list = self.query_one("#file-list", ListView)
         file_list.focus()
 
-    def _refresh_file_list(self) -> None:
+    def _refresh_file_list(self, rescan: bool = False) -> None:
         """Refresh the file list"""
         file_list = self.query_one("#file-list", ListView)
         file_list.clear()
 
-        files = self.config.get_markdown_files()
+        files = self.config.get_markdown_files(rescan=rescan)
 
         if not files:
             file_list.mount(
@@ -85,12 +83,25 @@ class FilePickerScreen(Screen):
             )
             return
 
+        # One directory scan for every file's stat and sidecar, instead of
+        # a stat and sidecar exists() checks per file
+        with os.scandir(self.config.folder) as it:
+            entries = {e.name: e for e in it}
+
         for file_path in files:
-            file_list.append(FileListItem(file_path))
+            entry = entries.get(file_path.name)
+            if entry is None:
+                continue  # Removed since it was listed
+            has_sidecar = (
+                get_sidecar_path(file_path).name in entries
+                or get_legacy_sidecar_path(file_path).name in entries
+            )
+            file_list.append(FileListItem(file_path, entry.stat(), has_sidecar))
 
     def action_refresh(self) -> None:
         """Refresh the file list"""
-        self._refresh_file_list()
+        # Asked for explicitly, so don't trust the cached listing
+        self._refresh_file_list(rescan=True)
         self.notify("Refreshed file list")
 
     def action_select_file(self) -> None:
@@ -1,12 +1,17 @@
 """Processing screen - shows progress during AI generation"""
 
 import asyncio
+import threading
+from dataclasses import replace
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 from textual.app import ComposeResult
 from textual.binding import Binding
+from textual.message import Message
 from textual.containers import Vertical
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import Static, ProgressBar, TextArea, Footer
 from textual import work
 
@@ -14,6 +19,70 @@ from meo.models.session import Session
 from meo.core.ai_edit_streaming import stream_ai_edit_on_session, StreamProgress
 
 
+# Streamed text is shown at most once per interval (seconds)
+STREAM_FLUSH_INTERVAL = 0.05
+
+# Only the tail of a long output is kept in the stream view (characters)
+MAX_STREAM_CHARS = 16384
+
+# Chunk status line suffix for each progress status
+_STATUS_SUFFIX = {
+    "starting": " [dim](starting...)[/dim]",
+    "streaming": " [cyan](receiving...)[/cyan]",
+    "complete": " [green](complete)[/green]",
+    "error": " [red](error)[/red]",
+}
+
+
+class ProgressQueue:
+    """Progress updates handed from the streaming worker thread to the UI thread.
+
+    A chunk's streaming updates are coalesced until the UI takes them: one
+    queued update collects their deltas. A status change for the chunk ends
+    that update, so each chunk's updates stay in order.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Queued updates, with the deltas collected for streaming ones
+        self._updates: List[Tuple[StreamProgress, Optional[List[str]]]] = []
+        # Position in _updates of each chunk's streaming update still collecting
+        self._streaming: Dict[str, int] = {}
+
+    def put(self, progress: StreamProgress) -> bool:
+        """Queue an update.
+
+        Returns:
+            True if the queue was empty, so the UI thread needs telling
+        """
+        with self._lock:
+            was_empty = not self._updates
+            if progress.status != "streaming":
+                self._streaming.pop(progress.chunk_id, None)
+                self._updates.append((progress, None))
+                return was_empty
+            i = self._streaming.get(progress.chunk_id)
+            if i is None:
+                self._streaming[progress.chunk_id] = len(self._updates)
+                self._updates.append((progress, [progress.delta]))
+            else:
+                deltas = self._updates[i][1]
+                deltas.append(progress.delta)
+                self._updates[i] = (progress, deltas)
+            return was_empty
+
+    def take(self) -> List[StreamProgress]:
+        """Take the queued updates in order, each with all the deltas it collected"""
+        with self._lock:
+            updates, self._updates = self._updates, []
+            self._streaming.clear()
+        return [
+            progress if deltas is None or len(deltas) == 1
+            else replace(progress, delta="".join(deltas))
+            for progress, deltas in updates
+        ]
+
+
 class ProcessingScreen(Screen):
     """Screen showing AI processing progress with streaming output."""
 
@@ -70,6 +139,22 @@ class ProcessingScreen(Screen):
         self.session_path = session_path
         self.total_chunks = len(session.chunks)
         self._cancelled = False
+        # Updates from the worker not yet handed to the UI thread
+        self._progress = ProgressQueue()
+        # Output so far of each running chunk not shown in the stream view
+        self._outputs: Dict[str, List[str]] = {}
+        # Text received for the shown chunk but not shown yet, and the timer
+        # that will show it
+        self._pending: List[str] = []
+        self._flush_timer: Optional[Timer] = None
+        # Chunk whose output is shown, and how many characters the stream
+        # view holds
+        self._stream_chunk_id: Optional[str] = None
+        self._stream_length = 0
+        # Progress bar value and the (chunk index, status) of the chunk
+        # status line as last shown
+        self._progress_value: Optional[float] = None
+        self._status_key: Optional[Tuple[int, str]] = None
 
     def compose(self) -> ComposeResult:
         yield Static("[bold]Processing with Claude AI[/bold]", id="progress-header")
@@ -88,6 +173,10 @@ class ProcessingScreen(Screen):
 
     def on_mount(self) -> None:
         """Start the async processing worker"""
+        # Looked up once; every progress update uses these
+        self._progress_bar = self.query_one("#progress-bar", ProgressBar)
+        self._status = self.query_one("#chunk-status", Static)
+        self._stream_output = self.query_one("#stream-output", TextArea)
         self.run_processing()
 
     @work(thread=True)
@@ -110,45 +199,125 @@ class ProcessingScreen(Screen):
         if not self._cancelled:
             self.app.call_from_thread(self._processing_complete)
 
+    class ProgressPosted(Message):
+        """Progress updates from the worker thread are ready to show"""
+
     def _on_progress(self, progress: StreamProgress) -> None:
         """Handle progress updates from the streaming worker"""
         if self._cancelled:
             return
-        self.app.call_from_thread(self._update_ui, progress)
+
+        # Posting doesn't wait for the UI thread, and one message collects
+        # every update queued before the UI gets to it
+        if self._progress.put(progress):
+            self.post_message(self.ProgressPosted())
+
+    def on_processing_screen_progress_posted(self, message: ProgressPosted) -> None:
+        """Show progress updates posted by the worker"""
+        for progress in self._progress.take():
+            self._update_ui(progress)
 
     def _update_ui(self, progress: StreamProgress) -> None:
         """Update UI elements with progress (called on main thread)"""
-        # Update progress bar
-        progress_bar = self.query_one("#progress-bar", ProgressBar)
-        if progress.status == "complete":
-            progress_bar.progress = progress.chunk_index + 1
-        elif progress.status == "streaming":
+        # Streaming updates are by far the most frequent, so they're handled
+        # first and touch only what changes token to token
+        if progress.status == "streaming":
             # Show partial progress within current chunk
-            progress_bar.progress = progress.chunk_index + 0.5
-        else:
-            progress_bar.progress = progress.chunk_index
+            self._show_progress(progress.completed_chunks + 0.5)
+            self._show_status(progress)
+            if self._stream_chunk_id is None:
+                self._show_chunk(progress.chunk_id)
+            if progress.chunk_id != self._stream_chunk_id:
+                self._outputs.setdefault(progress.chunk_id, []).append(progress.delta)
+                return
+            # Token updates are coalesced so the TextArea re-renders once
+            # per flush interval rather than once per token
+            self._pending.append(progress.delta)
+            if self._flush_timer is None:
+                self._flush_timer = self.set_timer(STREAM_FLUSH_INTERVAL, self._flush_stream)
+            return
 
-        # Update status text
-        status = self.query_one("#chunk-status", Static)
-        status_text = f"Chunk {progress.chunk_index + 1} of {progress.total_chunks}: {progress.chunk_id}"
+        self._show_progress(progress.completed_chunks)
+        self._show_status(progress)
         if progress.status == "starting":
-            status_text += " [dim](starting...)[/dim]"
-        elif progress.status == "streaming":
-            status_text += " [cyan](receiving...)[/cyan]"
-        elif progress.status == "complete":
-            status_text += " [green](complete)[/green]"
-        elif progress.status == "error":
-            status_text += " [red](error)[/red]"
-        status.update(status_text)
-
-        # Update stream output
-        stream_output = self.query_one("#stream-output", TextArea)
-        if progress.status == "starting":
-            stream_output.text = f"--- Processing {progress.chunk_id} ---\n"
-        elif progress.status == "streaming":
-            stream_output.text = f"--- {progress.chunk_id} ---\n{progress.text}"
-            # Auto-scroll to bottom
-            stream_output.scroll_end(animate=False)
+            self._outputs[progress.chunk_id] = []
+            if self._stream_chunk_id is None:
+                self._show_chunk(progress.chunk_id)
+        else:
+            self._chunk_finished(progress.chunk_id)
+
+    def _show_progress(self, value: float) -> None:
+        """Set the progress bar, unless it already shows `value`"""
+        # Every streaming update for a chunk has the same value - only
+        # repaint the bar when it moves
+        if value != self._progress_value:
+            self._progress_value = value
+            self._progress_bar.progress = value
+
+    def _show_status(self, progress: StreamProgress) -> None:
+        """Set the chunk status line, unless it already shows this chunk and status"""
+        key = (progress.chunk_index, progress.status)
+        if key == self._status_key:
+            return
+        self._status_key = key
+        self._status.update(
+            f"Chunk {progress.chunk_index + 1} of {progress.total_chunks}: {progress.chunk_id}"
+            + _STATUS_SUFFIX.get(progress.status, "")
+        )
+
+    def _chunk_finished(self, chunk_id: str) -> None:
+        """Stop following a chunk that has completed or failed"""
+        self._outputs.pop(chunk_id, None)
+        if chunk_id != self._stream_chunk_id:
+            return
+        self._flush_stream()
+        self._stream_chunk_id = None
+        # Chunks run concurrently: the view follows one at a time, moving on
+        # to the earliest started chunk still running. With none left, the
+        # finished output stays up until the next chunk starts.
+        next_id = next(iter(self._outputs), None)
+        if next_id is not None:
+            self._show_chunk(next_id)
+
+    def _show_chunk(self, chunk_id: str) -> None:
+        """Show a chunk's output so far in the stream view, and follow it"""
+        self._stream_chunk_id = chunk_id
+        self._set_stream_text(f"--- {chunk_id} ---\n" + "".join(self._outputs.pop(chunk_id, ())))
+        self._stream_output.scroll_end(animate=False)
+
+    def _stop_flush(self) -> None:
+        """Cancel the scheduled flush of pending streamed text"""
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
+
+    def _flush_stream(self) -> None:
+        """Show the shown chunk's pending streamed text now"""
+        self._stop_flush()
+        if not self._pending:
+            return
+        new_text = "".join(self._pending)
+        self._pending.clear()
+
+        # Only what's new is appended to the view
+        stream_output = self._stream_output
+        stream_output.insert(new_text, stream_output.document.end)
+        self._stream_length += len(new_text)
+        # Drop the oldest text once over the cap, so a long output
+        # doesn't keep growing the document
+        excess = self._stream_length - MAX_STREAM_CHARS
+        if excess > 0:
+            document = stream_output.document
+            stream_output.delete((0, 0), document.get_location_from_index(excess))
+            self._stream_length -= excess
+        # Auto-scroll to bottom
+        stream_output.scroll_end(animate=False)
+
+    def _set_stream_text(self, text: str) -> None:
+        """Replace the stream view's text, keeping at most its tail"""
+        text = text[-MAX_STREAM_CHARS:]
+        self._stream_output.text = text
+        self._stream_length = len(text)
 
     def _processing_complete(self) -> None:
         """Handle processing completion - transition to review screen"""
@@ -1,23 +1,36 @@
 """Refactored Review Screen - Document context with highlighted changes"""
 
+import asyncio
 from enum import Enum
 from pathlib import Path
-from typing import Optional, List
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, replace
 
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import Static, TextArea, Footer
+from textual import work
 
 from meo.models.session import Session
-from meo.core.session import save_session
+from meo.core.session import save_session, save_session_delta
 from meo.core.chunk_parser import parse_chunk_file, ChunkData
-from meo.core.text_replacer import apply_chunk_to_working, apply_chunk_to_file
+from meo.core.text_replacer import apply_chunk_to_working_content, apply_chunk_to_file
 from meo.core.git_ops import commit_chunk_response
 
 
+# Parsed chunks are kept for this many chunks either side of the current one
+CHUNK_CACHE_WINDOW = 3
+
+# The session is saved once review decisions pause for this long (seconds)
+SESSION_SAVE_DELAY = 0.25
+
+# Lines of the working document shown either side of the chunk under review
+CTX_LINES = 100
+
+
 class ReviewChoice(Enum):
     """Current hover/selection state"""
     APPROVE = "approve"
@@ -30,6 +43,13 @@ class EditTarget(Enum):
     SIDEBAR = "sidebar"
 
 
+class DisplayPart(Enum):
+    """Parts of the display that are redrawn separately"""
+    CHUNK = "chunk"  # Chunk info line and both panels
+    CHOICE = "choice"  # Approve/deny selector and both panels
+    STATUS = "status"  # Status bar
+
+
 @dataclass
 class ReviewChunk:
     """Data for a chunk being reviewed"""
@@ -38,6 +58,11 @@ class ReviewChunk:
     error: Optional[str] = None
 
 
+# (main text, sidebar text, main title, sidebar title); a None title is
+# left as is
+PanelContents = Tuple[str, str, Optional[str], Optional[str]]
+
+
 class ReviewScreenV2(Screen):
     """Refactored review screen with document context view.
 
@@ -127,36 +152,110 @@ class ReviewScreenV2(Screen):
         self.session_path = session_path
         self.pending_chunks: List[str] = session.get_pending_chunks()
         self.current_index = 0
-        self.review_chunks: List[ReviewChunk] = []
+        # Chunks still to review, in order. Each is parsed when first needed
+        # rather than all up front, so mounting doesn't wait on every file.
+        self.review_ids: List[str] = list(self.pending_chunks)
+        self._chunk_cache: Dict[str, ReviewChunk] = {}
+        # Chunks with inline edits, which are never evicted from the cache
+        self._edited_chunks: Set[str] = set()
         self.choice = ReviewChoice.APPROVE
         self.edit_target = EditTarget.NONE
+        # Display parts changed since the last redraw
+        self._dirty: Set[DisplayPart] = set()
+        # Kept as one str: each approval writes all of working.md and the
+        # main TextArea takes the whole text, so splicing into a rope or
+        # piece table would still materialize it every time
         self.working_content = ""
-        self._load_all_chunks()
+        # working.md's mtime when working_content was last read or written
+        self._working_mtime: Optional[int] = None
+        # Per chunk: (original text, document up to the highlight, document
+        # after it) - the parts of working_content around the chunk's text
+        self._highlight_cache: Dict[str, Tuple[str, str, str]] = {}
+        # Per choice: the chunk data last rendered for it and the panel
+        # contents rendered from it, so toggling back and forth reuses them
+        self._panel_cache: Dict[ReviewChoice, Tuple[ChunkData, PanelContents]] = {}
+        # Panel contents as last set on the widgets
+        self._last_rendered: Optional[PanelContents] = None
+        # Approved chunks still being applied and committed in the background,
+        # which take the lock in turn so they apply in the order approved
+        self._applying = 0
+        self._apply_lock = asyncio.Lock()
+        # Pending save of review decisions, while more are still coming in
+        self._save_timer: Optional[Timer] = None
         self._load_working_content()
 
-    def _load_all_chunks(self) -> None:
-        """Load all pending chunk data"""
-        for chunk_id in self.pending_chunks:
-            chunk_path = self.session_path / "chunks" / f"{chunk_id}.md"
-            try:
-                if chunk_path.exists():
-                    chunk_data = parse_chunk_file(chunk_path)
-                    self.review_chunks.append(ReviewChunk(chunk_id, chunk_data))
-                else:
-                    self.review_chunks.append(
-                        ReviewChunk(chunk_id, None, f"File not found: {chunk_path}")
-                    )
-            except Exception as e:
-                self.review_chunks.append(ReviewChunk(chunk_id, None, str(e)))
-
-    def _load_working_content(self) -> None:
-        """Load the full working document"""
-        working_file = self.session_path / "working.md"
-        if working_file.exists():
-            self.working_content = working_file.read_text()
+    def _load_chunk(self, chunk_id: str) -> ReviewChunk:
+        """Load one pending chunk's data"""
+        chunk_path = self.session_path / "chunks" / f"{chunk_id}.md"
+        try:
+            if chunk_path.exists():
+                return ReviewChunk(chunk_id, parse_chunk_file(chunk_path))
+            return ReviewChunk(chunk_id, None, f"File not found: {chunk_path}")
+        except Exception as e:
+            return ReviewChunk(chunk_id, None, str(e))
+
+    def _get_chunk(self, chunk_id: str) -> ReviewChunk:
+        """Get a chunk's data, loading it on first use"""
+        chunk = self._chunk_cache.get(chunk_id)
+        if chunk is None:
+            # setdefault: if the prefetch worker got there first, use its copy
+            chunk = self._chunk_cache.setdefault(chunk_id, self._load_chunk(chunk_id))
+            self._evict_chunks()
+        return chunk
+
+    def _evict_chunks(self) -> None:
+        """Drop cached chunks outside the window around the current one"""
+        start = max(0, self.current_index - CHUNK_CACHE_WINDOW)
+        keep = set(self.review_ids[start:self.current_index + CHUNK_CACHE_WINDOW + 1])
+        keep |= self._edited_chunks
+        # list() snapshots the keys: the prefetch worker may add one meanwhile
+        for chunk_id in list(self._chunk_cache):
+            if chunk_id not in keep:
+                self._chunk_cache.pop(chunk_id, None)
+                self._highlight_cache.pop(chunk_id, None)
+
+    def _prefetch_next(self) -> None:
+        """Start loading the chunk after the current one, if not yet loaded"""
+        next_index = self.current_index + 1
+        if next_index >= len(self.review_ids):
+            return
+        chunk_id = self.review_ids[next_index]
+        if chunk_id not in self._chunk_cache:
+            self._prefetch_chunk(chunk_id)
+
+    @work(thread=True)
+    def _prefetch_chunk(self, chunk_id: str) -> None:
+        """Load a chunk in the background so it's ready when reached"""
+        self._chunk_cache.setdefault(chunk_id, self._load_chunk(chunk_id))
+
+    def _load_working_content(self) -> bool:
+        """Load the full working document, unless it's unchanged since last read
+
+        Returns:
+            True if working_content was (re)loaded
+        """
+        mtime = self._working_file_mtime()
+        if mtime is None or mtime == self._working_mtime:
+            return False
+        self._set_working_content((self.session_path / "working.md").read_text())
+        self._working_mtime = mtime
+        return True
+
+    def _working_file_mtime(self) -> Optional[int]:
+        """working.md's mtime in nanoseconds, or None if it can't be read"""
+        try:
+            return (self.session_path / "working.md").stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _set_working_content(self, content: str) -> None:
+        """Replace the working document, dropping what was rendered from it"""
+        self.working_content = content
+        self._highlight_cache.clear()
+        self._panel_cache.clear()
 
     def compose(self) -> ComposeResult:
-        yield Static(id="header")
+        yield Static(f"[bold]MEO Review[/bold]  |  Session: {self.session.id}", id="header")
         yield Static(id="chunk-info")
 
         with Horizontal(id="main-container"):
@@ -183,16 +282,60 @@ class ReviewScreenV2(Screen):
 
     def on_mount(self) -> None:
         """Initialize display"""
-        self._update_display()
+        # The widget tree is fixed from here on, so look widgets up once
+        self._chunk_info = self.query_one("#chunk-info", Static)
+        self._choice_display = self.query_one("#choice-display", Static)
+        self._main_title = self.query_one("#main-title", Static)
+        self._main_text = self.query_one("#main-text", TextArea)
+        self._sidebar_panel = self.query_one("#sidebar-panel", Vertical)
+        self._sidebar_title = self.query_one("#sidebar-title", Static)
+        self._sidebar_text = self.query_one("#sidebar-text", TextArea)
+        self._status_bar = self.query_one("#status-bar", Static)
+
+        self._mark_dirty()
+        self._prefetch_next()
+
+    def on_screen_resume(self) -> None:
+        """Pick up changes made to working.md while another screen was up"""
+        # Applies in flight write working.md themselves
+        if not self._applying and self._load_working_content():
+            self._mark_dirty(DisplayPart.CHUNK)
+
+    def on_unmount(self) -> None:
+        """Save any pending session changes"""
+        if self._save_timer is not None:
+            self._save_session()
+
+    def _schedule_save(self) -> None:
+        """Save review decisions once they pause, rather than after each one"""
+        if self._save_timer is not None:
+            self._save_timer.stop()
+        self._save_timer = self.set_timer(SESSION_SAVE_DELAY, self._save_decisions)
+
+    def _save_decisions(self) -> None:
+        """Save just the applied and skipped chunks of the session"""
+        self._save_timer = None
+        save_session_delta(self.session_path, {
+            "applied_chunks": self.session.applied_chunks,
+            "skipped_chunks": self.session.skipped_chunks,
+        })
+
+    def _save_session(self) -> None:
+        """Save the session now, in place of any pending save"""
+        if self._save_timer is not None:
+            self._save_timer.stop()
+            self._save_timer = None
+        save_session(self.session, self.session_path)
 
     def _get_current_chunk(self) -> Optional[ReviewChunk]:
         """Get the current chunk being reviewed"""
-        if 0 <= self.current_index < len(self.review_chunks):
-            return self.review_chunks[self.current_index]
+        if 0 <= self.current_index < len(self.review_ids):
+            return self._get_chunk(self.review_ids[self.current_index])
         return None
 
     def _build_document_with_highlight(
         self,
+        chunk_id: str,
         original_text: str,
         replacement_text: str,
         show_replacement: bool
@@ -200,147 +343,233 @@ class ReviewScreenV2(Screen):
         """Build full document with highlighted section.
 
         Args:
+            chunk_id: ID of the chunk being highlighted
             original_text: The original chunk text to find
             replacement_text: The AI response text
             show_replacement: If True, show AI text; if False, show original
         """
-        content = self.working_content
         display_text = replacement_text if show_replacement else original_text
 
+        # The text is only searched for once per chunk and working content:
+        # toggling approve/deny just joins the cached parts around it
+        cached = self._highlight_cache.get(chunk_id)
+        if cached is None or cached[0] != original_text:
+            cached = (original_text, *self._split_document(original_text))
+            self._highlight_cache[chunk_id] = cached
+        return cached[1] + display_text + cached[2]
+
+    def _split_document(self, original_text: str) -> Tuple[str, str]:
+        """Split the working document around original_text, with review markers.
+
+        Returns:
+            Tuple of (text before the chunk, text after it). The chunk's
+            display text goes between the two.
+        """
+        content = self.working_content
+
         # Try exact match first
-        if original_text in content:
-            marked_content = content.replace(
-                original_text,
-                f">>> REVIEWING >>>\n{display_text}\n<<< REVIEWING <<<",
-                1  # Only replace first occurrence
+        idx = content.find(original_text)
+        if idx != -1:
+            end = idx + len(original_text)
+            return (
+                self._context_before(content, idx) + ">>> REVIEWING >>>\n",
+                "\n<<< REVIEWING <<<" + self._context_after(content, end),
             )
-            return marked_content
 
         # Try normalized match (strip whitespace)
         normalized_original = original_text.strip()
         normalized_content = content.replace('\r\n', '\n')
-        if normalized_original and normalized_original in normalized_content:
-            marked_content = normalized_content.replace(
-                normalized_original,
-                f">>> REVIEWING >>>\n{display_text}\n<<< REVIEWING <<<",
-                1
+        idx = normalized_content.find(normalized_original) if normalized_original else -1
+        if idx != -1:
+            end = idx + len(normalized_original)
+            return (
+                self._context_before(normalized_content, idx) + ">>> REVIEWING >>>\n",
+                "\n<<< REVIEWING <<<" + self._context_after(normalized_content, end),
             )
-            return marked_content
 
         # Fallback: show document with marker at top indicating chunk not found
-        return f">>> REVIEWING >>> (text location changed)\n{display_text}\n<<< REVIEWING <<<\n\n---\n\n{content}"
+        return (
+            ">>> REVIEWING >>> (text location changed)\n",
+            f"\n<<< REVIEWING <<<\n\n---\n\n{self._context_after(content, 0)}",
+        )
+
+    def _context_before(self, content: str, idx: int) -> str:
+        """The text before content[idx] on its line, and CTX_LINES lines before that.
+
+        The TextArea re-parses all of its text whenever it's set, so only a
+        window of the document around the chunk is shown; a note says how
+        many lines were left out.
+        """
+        # Back to the start of idx's line, then CTX_LINES lines further
+        start = idx
+        for _ in range(CTX_LINES + 1):
+            start = content.rfind('\n', 0, start)
+            if start == -1:
+                return content[:idx]
+        hidden = content.count('\n', 0, start) + 1
+        return f"... [{hidden} lines above] ...\n{content[start + 1:idx]}"
+
+    def _context_after(self, content: str, end: int) -> str:
+        """The text from content[end] to the end of its line, and CTX_LINES lines after that."""
+        stop = end
+        for _ in range(CTX_LINES + 1):
+            newline = content.find('\n', stop)
+            if newline == -1:
+                return content[end:]
+            stop = newline + 1
+        if stop == len(content):
+            return content[end:]
+        hidden = content.count('\n', stop) + (not content.endswith('\n'))
+        return f"{content[end:stop]}... [{hidden} lines below] ..."
 
     def _find_review_marker_line(self, content: str) -> int:
         """Find the line number containing the review marker."""
-        lines = content.split('\n')
-        for i, line in enumerate(lines):
-            if '>>> REVIEWING >>>' in line:
-                return i
-        return 0
-
-    def _scroll_to_marker(self) -> None:
-        """Scroll the main text area to show the review marker at the top."""
+        # Count the newlines before the marker rather than splitting the
+        # whole document into lines
+        idx = content.find('>>> REVIEWING >>>')
+        if idx == -1:
+            return 0
+        return content.count('\n', 0, idx)
+
+    def _scroll_to_marker(self, content: str) -> None:
+        """Scroll the main text area, showing `content`, to put the review marker at the top."""
         def do_scroll():
-            main_text = self.query_one("#main-text", TextArea)
-            marker_line = self._find_review_marker_line(main_text.text)
+            marker_line = self._find_review_marker_line(content)
             # Scroll so the marker line is at the top of the viewport
-            main_text.scroll_to(0, marker_line, animate=False)
+            self._main_text.scroll_to(0, marker_line, animate=False)
 
         # Use call_later to ensure the TextArea has rendered
         self.call_later(do_scroll)
 
-    def _update_display(self) -> None:
-        """Update all display elements based on current state"""
-        chunk = self._get_current_chunk()
+    def _mark_dirty(self, *parts: DisplayPart) -> None:
+        """Schedule a redraw of some parts of the display (all, if none given).
 
-        # Update header
-        header = self.query_one("#header", Static)
-        header.update(f"[bold]MEO Review[/bold]  |  Session: {self.session.id}")
+        Redraws happen once after the next refresh, so a burst of changes
+        (e.g. a held arrow key) is drawn once, and only the parts it touched.
+        """
+        if not self._dirty:
+            self.call_after_refresh(self._flush_display)
+        self._dirty.update(parts or DisplayPart)
+
+    def _flush_display(self) -> None:
+        """Redraw the display parts marked dirty since the last redraw"""
+        dirty, self._dirty = self._dirty, set()
+        chunk = self._get_current_chunk()
 
         # Update chunk info
-        info = self.query_one("#chunk-info", Static)
-        if chunk:
-            total = len(self.review_chunks)
-            current = self.current_index + 1
-            category = chunk.chunk_data.category if chunk.chunk_data else "Unknown"
-            info.update(f"Chunk {current} of {total}  |  {chunk.chunk_id} [{category}]")
-        else:
-            info.update("No chunks to review")
+        if DisplayPart.CHUNK in dirty:
+            if chunk:
+                total = len(self.review_ids)
+                current = self.current_index + 1
+                category = chunk.chunk_data.category if chunk.chunk_data else "Unknown"
+                self._chunk_info.update(
+                    f"Chunk {current} of {total}  |  {chunk.chunk_id} [{category}]"
+                )
+            else:
+                self._chunk_info.update("No chunks to review")
 
         # Update choice selection visual
-        choice_display = self.query_one("#choice-display", Static)
-        if self.choice == ReviewChoice.APPROVE:
-            choice_display.update("[reverse bold green] APPROVE [/]    [dim] DENY [/dim]")
-        else:
-            choice_display.update("[dim] APPROVE [/dim]    [reverse bold red] DENY [/]")
-
-        # Update main and sidebar based on choice
-        main_text = self.query_one("#main-text", TextArea)
-        sidebar_text = self.query_one("#sidebar-text", TextArea)
-        main_title = self.query_one("#main-title", Static)
-        sidebar_title = self.query_one("#sidebar-title", Static)
-
-        if chunk and chunk.chunk_data:
-            original = chunk.chunk_data.original_text
-            ai_response = chunk.chunk_data.ai_response or "[No AI response]"
-
+        if DisplayPart.CHOICE in dirty:
             if self.choice == ReviewChoice.APPROVE:
-                # Main shows AI change in document context
-                # Sidebar shows original (the alternate)
-                main_text.text = self._build_document_with_highlight(
-                    original, ai_response, show_replacement=True
-                )
-                sidebar_text.text = original
-                main_title.update("[bold]DOCUMENT (with AI change)[/bold]")
-                sidebar_title.update("[bold]ORIGINAL[/bold]")
-            else:  # DENY
-                # Main shows original in document context
-                # Sidebar shows AI response (the alternate)
-                main_text.text = self._build_document_with_highlight(
-                    original, ai_response, show_replacement=False
-                )
-                sidebar_text.text = ai_response
-                main_title.update("[bold]DOCUMENT (original)[/bold]")
-                sidebar_title.update("[bold]AI RESPONSE[/bold]")
-        elif chunk and chunk.error:
-            main_text.text = f"Error: {chunk.error}"
-            sidebar_text.text = ""
-        else:
-            main_text.text = "No chunk data"
-            sidebar_text.text = ""
+                self._choice_display.update("[reverse bold green] APPROVE [/]    [dim] DENY [/dim]")
+            else:
+                self._choice_display.update("[dim] APPROVE [/dim]    [reverse bold red] DENY [/]")
 
-        # Scroll to the review marker (use call_later for proper timing)
-        self._scroll_to_marker()
+        if DisplayPart.CHUNK in dirty or DisplayPart.CHOICE in dirty:
+            self._update_panels(chunk)
 
         # Update status bar
-        status = self.query_one("#status-bar", Static)
-        applied = len(self.session.applied_chunks)
-        skipped = len(self.session.skipped_chunks)
-        pending = len(self.review_chunks)
+        if DisplayPart.STATUS in dirty:
+            applied = len(self.session.applied_chunks)
+            skipped = len(self.session.skipped_chunks)
+            pending = len(self.review_ids)
+
+            edit_indicator = ""
+            if self.edit_target != EditTarget.NONE:
+                edit_indicator = "  |  [yellow bold]EDITING - Enter to save, Escape to cancel[/]"
+
+            self._status_bar.update(
+                f"[dim]Applied: {applied}  |  Skipped: {skipped}  |  Pending: {pending}"
+                f"{edit_indicator}[/dim]"
+            )
 
-        edit_indicator = ""
-        if self.edit_target != EditTarget.NONE:
-            edit_indicator = "  |  [yellow bold]EDITING - Enter to save, Escape to cancel[/]"
+    def _update_panels(self, chunk: Optional[ReviewChunk]) -> None:
+        """Update main and sidebar based on chunk and choice"""
+        contents = self._render_panels(chunk)
+        last = self._last_rendered or (None, None, None, None)
+        self._last_rendered = contents
+        main, sidebar, main_title, sidebar_title = contents
+
+        # Setting a TextArea's text re-parses it even when unchanged, so
+        # only changed panels are set. Cached renders are reused, so
+        # unchanged text is usually the same object and compares at once.
+        if main != last[0]:
+            self._main_text.text = main
+            # Scroll to the review marker (use call_later for proper timing)
+            self._scroll_to_marker(main)
+        if sidebar != last[1]:
+            self._sidebar_text.text = sidebar
+        if main_title is not None and main_title != last[2]:
+            self._main_title.update(main_title)
+        if sidebar_title is not None and sidebar_title != last[3]:
+            self._sidebar_title.update(sidebar_title)
+
+    def _render_panels(self, chunk: Optional[ReviewChunk]) -> PanelContents:
+        """Get the panel contents for a chunk and the current choice"""
+        if not chunk or not chunk.chunk_data:
+            if chunk and chunk.error:
+                return f"Error: {chunk.error}", "", None, None
+            return "No chunk data", "", None, None
+
+        # Inline edits replace the chunk data, so a cached render is only
+        # reused for the very same data
+        cached = self._panel_cache.get(self.choice)
+        if cached is not None and cached[0] is chunk.chunk_data:
+            return cached[1]
+
+        original = chunk.chunk_data.original_text
+        ai_response = chunk.chunk_data.ai_response or "[No AI response]"
 
-        status.update(
-            f"[dim]Applied: {applied}  |  Skipped: {skipped}  |  Pending: {pending}{edit_indicator}[/dim]"
-        )
+        if self.choice == ReviewChoice.APPROVE:
+            # Main shows AI change in document context
+            # Sidebar shows original (the alternate)
+            contents = (
+                self._build_document_with_highlight(
+                    chunk.chunk_id, original, ai_response, show_replacement=True
+                ),
+                original,
+                "[bold]DOCUMENT (with AI change)[/bold]",
+                "[bold]ORIGINAL[/bold]",
+            )
+        else:  # DENY
+            # Main shows original in document context
+            # Sidebar shows AI response (the alternate)
+            contents = (
+                self._build_document_with_highlight(
+                    chunk.chunk_id, original, ai_response, show_replacement=False
+                ),
+                ai_response,
+                "[bold]DOCUMENT (original)[/bold]",
+                "[bold]AI RESPONSE[/bold]",
+            )
+        self._panel_cache[self.choice] = (chunk.chunk_data, contents)
+        return contents
 
     # ========== Arrow Key Navigation ==========
 
     def action_select_approve(self) -> None:
         """Select Approve option"""
-        if self.edit_target != EditTarget.NONE:
+        if self.edit_target != EditTarget.NONE or self.choice == ReviewChoice.APPROVE:
             return
         self.choice = ReviewChoice.APPROVE
-        self._update_display()
+        self._mark_dirty(DisplayPart.CHOICE)
 
     def action_select_deny(self) -> None:
         """Select Deny option"""
-        if self.edit_target != EditTarget.NONE:
+        if self.edit_target != EditTarget.NONE or self.choice == ReviewChoice.DENY:
             return
         self.choice = ReviewChoice.DENY
-        self._update_display()
+        self._mark_dirty(DisplayPart.CHOICE)
 
     # ========== Confirm Choice ==========
 
@@ -356,47 +585,93 @@ class ReviewScreenV2(Screen):
             self._deny_chunk()
 
     def _approve_chunk(self) -> None:
-        """Approve and apply the current chunk"""
+        """Approve the current chunk and move on while it's applied"""
         chunk = self._get_current_chunk()
         if not chunk or not chunk.chunk_data or not chunk.chunk_data.has_response:
             self.notify("Cannot approve: no AI response", severity="warning")
             return
 
-        # Apply the change to working.md
-        success = apply_chunk_to_working(
+        # Applying and committing hit the disk and run git, so they happen
+        # off the UI thread; the next chunk is shown straight away
+        self._applying += 1
+        self._apply_chunk(chunk)
+        self._advance_or_complete()
+
+    @work(group="apply")
+    async def _apply_chunk(self, chunk: ReviewChunk) -> None:
+        """Apply an approved chunk, putting it back up for review if it can't be"""
+        async with self._apply_lock:
+            error = await self._write_and_commit(chunk)
+        self._applying -= 1
+
+        if error:
+            self.notify(error, severity="error")
+            self._requeue(chunk)
+            return
+
+        # Update session
+        self.session.mark_chunk_applied(chunk.chunk_id)
+        self._schedule_save()
+
+        self.notify(f"Applied {chunk.chunk_id}")
+        if self.review_ids:
+            # The document shown now includes the change
+            self._mark_dirty(DisplayPart.CHUNK, DisplayPart.STATUS)
+        elif not self._applying:
+            self._show_completion()
+
+    async def _write_and_commit(self, chunk: ReviewChunk) -> Optional[str]:
+        """Apply a chunk to working.md and the source file, and commit it.
+
+        Once working.md has the change the chunk counts as applied, so a
+        source file without the original text or a failed commit is only
+        reported: approving the chunk again couldn't find its text.
+
+        Returns:
+            An error message if the chunk couldn't be applied to working.md
+        """
+        original = chunk.chunk_data.normalized_original
+        ai_response = chunk.chunk_data.ai_response or ""
+
+        # Apply the change to working.md. It's made to the content already
+        # in memory too, so the file needn't be read back afterwards.
+        new_content = await asyncio.to_thread(
+            apply_chunk_to_working_content,
             self.session_path,
-            chunk.chunk_data.original_text,
-            chunk.chunk_data.ai_response or ""
+            self.working_content,
+            original,
+            ai_response,
         )
 
-        if not success:
-            self.notify("Failed to apply: original text not found", severity="error")
-            return
+        if new_content is None:
+            return "Failed to apply: original text not found"
+        self._set_working_content(new_content)
+        self._working_mtime = await asyncio.to_thread(self._working_file_mtime)
 
         # Also apply to original source file
         source_path = Path(self.session.source_file)
-        apply_chunk_to_file(
-            source_path,
-            chunk.chunk_data.original_text,
-            chunk.chunk_data.ai_response or ""
-        )
+        if not await asyncio.to_thread(apply_chunk_to_file, source_path, original, ai_response):
+            self.notify(
+                f"{chunk.chunk_id}: original text not found in {source_path.name}",
+                severity="warning",
+            )
 
         # Commit the change
         try:
-            commit_chunk_response(self.session_path, chunk.chunk_id)
+            await asyncio.to_thread(commit_chunk_response, self.session_path, chunk.chunk_id)
         except Exception as e:
             self.notify(f"Git commit failed: {e}", severity="error")
-            return
-
-        # Update session
-        self.session.mark_chunk_applied(chunk.chunk_id)
-        save_session(self.session, self.session_path)
-
-        # Reload working content
-        self._load_working_content()
+        return None
 
-        self.notify(f"Applied {chunk.chunk_id}")
-        self._advance_or_complete()
+    def _requeue(self, chunk: ReviewChunk) -> None:
+        """Put a chunk back up for review, as the current chunk"""
+        self.current_index = min(self.current_index, len(self.review_ids))
+        self.review_ids.insert(self.current_index, chunk.chunk_id)
+        # Keep its data as it was approved, inline edits included
+        self._chunk_cache[chunk.chunk_id] = chunk
+        self._edited_chunks.add(chunk.chunk_id)
+        self.choice = ReviewChoice.APPROVE
+        self._mark_dirty()
 
     def _deny_chunk(self) -> None:
         """Deny/skip the current chunk"""
@@ -405,24 +680,32 @@ class ReviewScreenV2(Screen):
             return
 
         self.session.mark_chunk_skipped(chunk.chunk_id)
-        save_session(self.session, self.session_path)
+        self._schedule_save()
 
         self.notify(f"Skipped {chunk.chunk_id}")
         self._advance_or_complete()
 
     def _advance_or_complete(self) -> None:
         """Move to next chunk or show completion"""
-        if self.review_chunks:
-            self.review_chunks.pop(self.current_index)
-
-        if self.current_index >= len(self.review_chunks):
-            self.current_index = max(0, len(self.review_chunks) - 1)
-
-        if not self.review_chunks:
-            self._show_completion()
+        if self.review_ids:
+            chunk_id = self.review_ids.pop(self.current_index)
+            self._chunk_cache.pop(chunk_id, None)
+            self._highlight_cache.pop(chunk_id, None)
+            self._edited_chunks.discard(chunk_id)
+
+        if self.current_index >= len(self.review_ids):
+            self.current_index = max(0, len(self.review_ids) - 1)
+
+        if not self.review_ids:
+            # With approvals still being applied, the last of them completes
+            if not self._applying:
+                self._show_completion()
+            else:
+                self._mark_dirty()
         else:
             self.choice = ReviewChoice.APPROVE
-            self._update_display()
+            self._mark_dirty()
+            self._prefetch_next()
 
     def _show_completion(self) -> None:
         """Show completion summary and return to SelectionScreen"""
@@ -433,14 +716,14 @@ class ReviewScreenV2(Screen):
         skipped = len(self.session.skipped_chunks)
 
         self.session.status = "complete"
-        save_session(self.session, self.session_path)
+        self._save_session()
 
         # Get source file path and reload updated content
         source_path = Path(self.session.source_file)
         updated_content = source_path.read_text()
 
         # Reload ProjectState from sidecar and clear reviewed chunks
-        state = load_sidecar(source_path)
+        state = load_sidecar(source_path, trusted=True)
         if state:
             state.chunks = []
             save_sidecar(source_path, state)
@@ -462,49 +745,53 @@ class ReviewScreenV2(Screen):
 
         self.edit_target = EditTarget.SIDEBAR
 
-        sidebar_text = self.query_one("#sidebar-text", TextArea)
+        sidebar_text = self._sidebar_text
         sidebar_text.can_focus = True  # Enable focus for editing
         sidebar_text.read_only = False
         sidebar_text.focus()
 
-        sidebar_panel = self.query_one("#sidebar-panel")
-        sidebar_panel.add_class("editing-mode")
+        self._sidebar_panel.add_class("editing-mode")
 
-        self._update_display()
+        self._mark_dirty(DisplayPart.STATUS)
 
     def _save_edit(self) -> None:
         """Save the current edit"""
         if self.edit_target == EditTarget.SIDEBAR:
-            sidebar_text = self.query_one("#sidebar-text", TextArea)
+            sidebar_text = self._sidebar_text
             edited_content = sidebar_text.text
 
             chunk = self._get_current_chunk()
             if chunk and chunk.chunk_data:
+                self._edited_chunks.add(chunk.chunk_id)
                 if self.choice == ReviewChoice.APPROVE:
                     # Sidebar shows original when Approve is selected
-                    chunk.chunk_data.original_text = edited_content
+                    chunk.chunk_data = replace(chunk.chunk_data, original_text=edited_content)
                 else:
                     # Sidebar shows AI response when Deny is selected
-                    chunk.chunk_data.ai_response = edited_content
+                    chunk.chunk_data = replace(chunk.chunk_data, ai_response=edited_content)
 
             sidebar_text.read_only = True
             sidebar_text.can_focus = False  # Disable focus after editing
-            self.query_one("#sidebar-panel").remove_class("editing-mode")
+            self._sidebar_panel.remove_class("editing-mode")
 
         self.edit_target = EditTarget.NONE
-        self._update_display()
+        # The sidebar may have been typed in: set it again whatever it was
+        self._last_rendered = None
+        self._mark_dirty()
         self.notify("Edit saved")
 
     def _cancel_edit(self) -> None:
         """Cancel the current edit without saving"""
         if self.edit_target == EditTarget.SIDEBAR:
-            sidebar_text = self.query_one("#sidebar-text", TextArea)
+            sidebar_text = self._sidebar_text
             sidebar_text.read_only = True
             sidebar_text.can_focus = False  # Disable focus after editing
-            self.query_one("#sidebar-panel").remove_class("editing-mode")
+            self._sidebar_panel.remove_class("editing-mode")
 
         self.edit_target = EditTarget.NONE
-        self._update_display()
+        # The sidebar may have been typed in: set it again whatever it was
+        self._last_rendered = None
+        self._mark_dirty()
         self.notify("Edit cancelled")
 
     def action_cancel_edit_or_quit(self) -> None:
@@ -516,13 +803,18 @@ class ReviewScreenV2(Screen):
 
     def _quit_review(self) -> None:
         """Quit the review"""
+        if self._applying:
+            self.notify("Still applying approved chunks", severity="warning")
+            return
+
         applied = len(self.session.applied_chunks)
         skipped = len(self.session.skipped_chunks)
-        pending = len(self.review_chunks)
+        pending = len(self.review_ids)
 
         if pending > 0:
             self.session.status = "reviewing"
-            save_session(self.session, self.session_path)
+        if pending > 0 or self._save_timer is not None:
+            self._save_session()
 
         self.app.exit(
             message=f"Review paused. Applied: {applied}, Skipped: {skipped}, Pending: {pending}"
@@ -537,13 +829,14 @@ class ReviewScreenV2(Screen):
         if self.current_index > 0:
             self.current_index -= 1
             self.choice = ReviewChoice.APPROVE
-            self._update_display()
+            self._mark_dirty(DisplayPart.CHUNK, DisplayPart.CHOICE)
 
     def action_next_chunk(self) -> None:
         """Go to next chunk"""
         if self.edit_target != EditTarget.NONE:
             return
-        if self.current_index < len(self.review_chunks) - 1:
+        if self.current_index < len(self.review_ids) - 1:
             self.current_index += 1
             self.choice = ReviewChoice.APPROVE
-            self._update_display()
+            self._mark_dirty(DisplayPart.CHUNK, DisplayPart.CHOICE)
+            self._prefetch_next()
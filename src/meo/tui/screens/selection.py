@@ -1,10 +1,11 @@
 """Selection screen - Mark chunks with inline direction assignment"""
 
 import asyncio
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from enum import Enum
 from pathlib import Path
-from typing import Optional, List, Literal
+from typing import Dict, Optional, List, Literal
 
 from textual.app import ComposeResult
 from textual.binding import Binding
@@ -149,6 +150,9 @@ class SelectionScreen(Screen):
         self.session: Optional[Session] = None
         self.session_path: Optional[Path] = None
         self._processing_cancelled = False
+        # Output so far of each running chunk not shown, and the chunk shown
+        self._processing_outputs: Dict[str, List[str]] = {}
+        self._processing_chunk_id: Optional[str] = None
 
         # Review state
         self.review_chunks: List[ReviewChunk] = []
@@ -377,10 +381,10 @@ class SelectionScreen(Screen):
             return
 
         # Check for overlaps
-        for existing in self.state.chunks:
-            if text_range.overlaps(existing.range):
-                self.notify(f"Overlaps with {existing.id}", severity="error")
-                return
+        overlap = self.state.find_overlap(text_range)
+        if overlap is not None:
+            self.notify(f"Overlaps with {overlap}", severity="error")
+            return
 
         # Create pending chunk
         self.pending_chunk = Chunk(
@@ -451,7 +455,7 @@ class SelectionScreen(Screen):
             self.pending_chunk.annotation = annotation
 
         # Finalize chunk
-        self.state.chunks.append(self.pending_chunk)
+        self.state.add_chunk(self.pending_chunk)
         chunk_id = self.pending_chunk.id
         self.pending_chunk = None
 
@@ -574,6 +578,8 @@ class SelectionScreen(Screen):
 
         # Reset processing state
         self._processing_cancelled = False
+        self._processing_outputs.clear()
+        self._processing_chunk_id = None
 
         # Switch to processing mode
         self.mode = SelectionMode.PROCESSING
@@ -625,12 +631,12 @@ class SelectionScreen(Screen):
 
         # Update progress bar
         progress_bar = self.query_one("#processing-progress", ProgressBar)
-        if progress.status == "complete":
-            progress_bar.progress = progress.chunk_index + 1
+        if progress.status in ("complete", "error"):
+            progress_bar.progress = progress.completed_chunks
         elif progress.status == "streaming":
-            progress_bar.progress = progress.chunk_index + 0.5
+            progress_bar.progress = progress.completed_chunks + 0.5
         else:
-            progress_bar.progress = progress.chunk_index
+            progress_bar.progress = progress.completed_chunks
 
         # Update status text
         status = self.query_one("#processing-status", Static)
@@ -647,11 +653,40 @@ class SelectionScreen(Screen):
 
         # Update stream output
         stream_output = self.query_one("#processing-stream", TextArea)
+        # Chunks run concurrently: one is shown at a time, until it finishes
+        outputs = self._processing_outputs
+        shown = self._processing_chunk_id
         if progress.status == "starting":
-            stream_output.text = f"--- Processing {progress.chunk_id} ---\n"
+            outputs[progress.chunk_id] = []
+            if shown is None:
+                self._show_processing_output(progress.chunk_id)
         elif progress.status == "streaming":
-            stream_output.text = f"--- {progress.chunk_id} ---\n{progress.text}"
-            stream_output.scroll_end(animate=False)
+            # Updates carry only the new text: it's appended while the
+            # chunk is shown
+            if shown is None:
+                outputs.setdefault(progress.chunk_id, []).append(progress.delta)
+                self._show_processing_output(progress.chunk_id)
+            elif progress.chunk_id == shown:
+                stream_output.insert(progress.delta, stream_output.document.end)
+                stream_output.scroll_end(animate=False)
+            else:
+                outputs.setdefault(progress.chunk_id, []).append(progress.delta)
+        else:
+            outputs.pop(progress.chunk_id, None)
+            if progress.chunk_id == shown:
+                # Move on to the earliest started chunk still running, if any
+                self._processing_chunk_id = None
+                next_id = next(iter(outputs), None)
+                if next_id is not None:
+                    self._show_processing_output(next_id)
+
+    def _show_processing_output(self, chunk_id: str) -> None:
+        """Show a chunk's output so far in the processing stream view"""
+        stream_output = self.query_one("#processing-stream", TextArea)
+        self._processing_chunk_id = chunk_id
+        output = "".join(self._processing_outputs.pop(chunk_id))
+        stream_output.text = f"--- {chunk_id} ---\n" + output
+        stream_output.scroll_end(animate=False)
 
     def _processing_complete(self) -> None:
         """Transition from processing to review mode"""
@@ -703,7 +738,7 @@ class SelectionScreen(Screen):
         if 0 <= selected_index < len(self.state.chunks):
             chunk = self.state.chunks[selected_index]
             chunk_id = chunk.id
-            self.state.chunks.pop(selected_index)
+            self.state.remove_chunk(chunk_id)
             self._refresh_chunk_list()
             self.notify(f"Deleted {chunk_id}")
 
@@ -721,27 +756,31 @@ class SelectionScreen(Screen):
 
     def _load_review_data(self) -> None:
         """Load all pending chunks for review"""
-        self.review_chunks = []
         pending_ids = self.session.get_pending_chunks()
 
-        for chunk_id in pending_ids:
-            chunk_path = self.session_path / "chunks" / f"{chunk_id}.md"
-            try:
-                if chunk_path.exists():
-                    chunk_data = parse_chunk_file(chunk_path)
-                    self.review_chunks.append(ReviewChunk(chunk_id, chunk_data))
-                else:
-                    self.review_chunks.append(
-                        ReviewChunk(chunk_id, None, f"File not found: {chunk_path}")
-                    )
-            except Exception as e:
-                self.review_chunks.append(ReviewChunk(chunk_id, None, str(e)))
+        # Review counts cover every chunk, so all are loaded up front. The
+        # files are independent, so their reads are overlapped on a thread
+        # pool; map() keeps them in review order.
+        self.review_chunks = []
+        if pending_ids:
+            with ThreadPoolExecutor(max_workers=min(8, len(pending_ids))) as executor:
+                self.review_chunks = list(executor.map(self._load_review_chunk, pending_ids))
 
         # Load working content for document context
         working_file = self.session_path / "working.md"
         if working_file.exists():
             self.working_content = working_file.read_text()
 
+    def _load_review_chunk(self, chunk_id: str) -> ReviewChunk:
+        """Load one pending chunk for review"""
+        chunk_path = self.session_path / "chunks" / f"{chunk_id}.md"
+        try:
+            if chunk_path.exists():
+                return ReviewChunk(chunk_id, parse_chunk_file(chunk_path))
+            return ReviewChunk(chunk_id, None, f"File not found: {chunk_path}")
+        except Exception as e:
+            return ReviewChunk(chunk_id, None, str(e))
+
     def _get_current_review_chunk(self) -> Optional[ReviewChunk]:
         """Get the current chunk being reviewed"""
         if 0 <= self.review_index < len(self.review_chunks):
@@ -758,36 +797,38 @@ class SelectionScreen(Screen):
         content = self.working_content
         display_text = replacement_text if show_replacement else original_text
 
-        # Try exact match first
-        if original_text in content:
-            return content.replace(
-                original_text,
-                f">>> REVIEWING >>>\n{display_text}\n<<< REVIEWING <<<",
-                1
+        # Try exact match first - one find(), then join the text around it
+        idx = content.find(original_text)
+        if idx != -1:
+            end = idx + len(original_text)
+            return (
+                f"{content[:idx]}>>> REVIEWING >>>\n{display_text}\n"
+                f"<<< REVIEWING <<<{content[end:]}"
             )
 
         # Try normalized match
         normalized_original = original_text.strip()
         normalized_content = content.replace('\r\n', '\n')
-        if normalized_original and normalized_original in normalized_content:
-            return normalized_content.replace(
-                normalized_original,
-                f">>> REVIEWING >>>\n{display_text}\n<<< REVIEWING <<<",
-                1
+        idx = normalized_content.find(normalized_original) if normalized_original else -1
+        if idx != -1:
+            end = idx + len(normalized_original)
+            return (
+                f"{normalized_content[:idx]}>>> REVIEWING >>>\n{display_text}\n"
+                f"<<< REVIEWING <<<{normalized_content[end:]}"
             )
 
         # Fallback
         return f">>> REVIEWING >>> (location changed)\n{display_text}\n<<< REVIEWING <<<\n\n---\n\n{content}"
 
-    def _scroll_editor_to_marker(self) -> None:
-        """Scroll editor to show the review marker at top of viewport"""
+    def _scroll_editor_to_marker(self, text: str) -> None:
+        """Scroll editor, showing `text`, to put the review marker at top of viewport"""
         def do_scroll():
-            editor = self.query_one("#editor", TextArea)
-            lines = editor.text.split('\n')
-            for i, line in enumerate(lines):
-                if '>>> REVIEWING >>>' in line:
-                    editor.scroll_to(0, i, animate=False)
-                    return
+            # Count the newlines before the marker rather than splitting
+            # the whole document into lines
+            idx = text.find('>>> REVIEWING >>>')
+            if idx != -1:
+                editor = self.query_one("#editor", TextArea)
+                editor.scroll_to(0, text.count('\n', 0, idx), animate=False)
         # Use set_timer to ensure scroll happens after text rendering
         self.set_timer(0.05, do_scroll)
 
@@ -829,21 +870,26 @@ class SelectionScreen(Screen):
 
             if self.review_choice == ReviewChoice.APPROVE:
                 # Main shows AI change in markers, sidebar shows original
-                editor.text = self._build_document_with_highlight(original, ai_response, show_replacement=True)
+                document = self._build_document_with_highlight(
+                    original, ai_response, show_replacement=True
+                )
                 sidebar_text.text = original
             else:
                 # Main shows original in markers, sidebar shows AI response
-                editor.text = self._build_document_with_highlight(original, ai_response, show_replacement=False)
+                document = self._build_document_with_highlight(
+                    original, ai_response, show_replacement=False
+                )
                 sidebar_text.text = ai_response
         elif chunk and chunk.error:
-            editor.text = f"Error loading chunk: {chunk.error}"
+            document = f"Error loading chunk: {chunk.error}"
             sidebar_text.text = ""
         else:
-            editor.text = "No chunk data"
+            document = "No chunk data"
             sidebar_text.text = ""
+        editor.text = document
 
         # Scroll to review marker
-        self._scroll_editor_to_marker()
+        self._scroll_editor_to_marker(document)
 
     def _approve_current_chunk(self) -> None:
         """Approve and apply the current chunk"""
@@ -862,7 +908,7 @@ class SelectionScreen(Screen):
         # Apply to working.md
         success = apply_chunk_to_working(
             self.session_path,
-            chunk.chunk_data.original_text,
+            chunk.chunk_data.normalized_original,
             chunk.chunk_data.ai_response or ""
         )
 
@@ -873,7 +919,7 @@ class SelectionScreen(Screen):
         # Apply to source file
         apply_chunk_to_file(
             self.source_file,
-            chunk.chunk_data.original_text,
+            chunk.chunk_data.normalized_original,
             chunk.chunk_data.ai_response or ""
         )
 
@@ -950,7 +996,7 @@ class SelectionScreen(Screen):
         self.content = self.source_file.read_text()
 
         # Clear chunks from sidecar
-        state = load_sidecar(self.source_file)
+        state = load_sidecar(self.source_file, trusted=True)
         if state:
             state.chunks = []
             save_sidecar(self.source_file, state)
@@ -1017,10 +1063,10 @@ class SelectionScreen(Screen):
         if chunk and chunk.chunk_data:
             if self.review_choice == ReviewChoice.APPROVE:
                 # Sidebar shows original when Approve selected
-                chunk.chunk_data.original_text = edited_content
+                chunk.chunk_data = replace(chunk.chunk_data, original_text=edited_content)
             else:
                 # Sidebar shows AI response when Deny selected
-                chunk.chunk_data.ai_response = edited_content
+                chunk.chunk_data = replace(chunk.chunk_data, ai_response=edited_content)
 
         sidebar_text.read_only = True
         sidebar_text.can_focus = False
@@ -0,0 +1,28 @@
+"""Shared test fixtures"""
+
+import pytest
+
+from meo.models.chunk import Chunk, ChunkCategory, Location, TextRange
+
+
+@pytest.fixture
+def in_tmp_cwd(tmp_path, monkeypatch):
+    """Run the test with an empty temporary working directory"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _make_chunk(chunk_id: str, row: int, category: ChunkCategory, text: str, **kwargs) -> Chunk:
+    return Chunk(
+        id=chunk_id,
+        range=TextRange(start=Location(row=row, col=0), end=Location(row=row, col=len(text))),
+        category=category,
+        original_text=text,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def make_chunk():
+    """Build a one-line Chunk: make_chunk(chunk_id, row, category, text, **fields)"""
+    return _make_chunk
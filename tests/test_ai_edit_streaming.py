@@ -0,0 +1,93 @@
+"""Tests for streaming AI edit helpers"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+from meo.core import ai_edit_streaming
+from meo.core.ai_edit_streaming import (
+    has_response,
+    _has_response_fast,
+    list_chunk_files,
+    scan_pending,
+    stream_ai_edit_on_chunk,
+)
+
+
+PENDING = (
+    "## Text to Edit\n\n```\nBefore\n---\nAfter\n```\n\n"
+    "## Your Response\n\nWrite ONLY the edited text below.\n\n---\n"
+)
+
+
+def test_has_response_pending_chunk():
+    """Test that a horizontal rule in the text to edit isn't a response marker"""
+    assert not has_response(PENDING)
+    assert not _has_response_fast(PENDING.encode())
+
+
+def test_has_response_answered_chunk():
+    """Test that text after the response marker counts as a response"""
+    answered = PENDING + "\nEdited text\n"
+    assert has_response(answered)
+    assert _has_response_fast(answered.encode())
+
+
+def test_has_response_with_heading_in_response():
+    """Test that a response heading inside the response doesn't hide the response"""
+    answered = PENDING + "\n## Your Response\n\nEdited text\n"
+    assert has_response(answered)
+    assert _has_response_fast(answered.encode())
+
+
+def test_list_chunk_files_numeric_order(tmp_path):
+    """Test that chunk files are ordered by chunk number, not lexically"""
+    for name in ["chunk_10.md", "chunk_2.md", "chunk_1000.md", "chunk_101.md", "notes.txt"]:
+        (tmp_path / name).write_text("")
+
+    names = [p.name for p in list_chunk_files(tmp_path)]
+    assert names == ["chunk_2.md", "chunk_10.md", "chunk_101.md", "chunk_1000.md"]
+
+
+def test_has_response_after_long_whitespace():
+    """Test that a response preceded by lots of whitespace is still found"""
+    answered = PENDING + " \n" * 500 + "Edited text\n"
+    assert has_response(answered)
+    assert _has_response_fast(answered.encode())
+    assert not has_response(PENDING + " \n" * 500)
+
+
+def test_scan_pending(tmp_path):
+    """Test that scan_pending() skips answered and keeps empty/pending chunks"""
+    (tmp_path / "chunk_001.md").write_text(PENDING + "\nEdited text\n")
+    (tmp_path / "chunk_002.md").write_text(PENDING)
+    (tmp_path / "chunk_003.md").write_text("")
+
+    names = [p.name for p in scan_pending(tmp_path)]
+    assert names == ["chunk_002.md", "chunk_003.md"]
+
+
+def test_stream_ai_edit_on_chunk_kills_claude_on_cancel(tmp_path, monkeypatch):
+    """Test that cancelling a chunk kills its Claude process"""
+    pid_file = tmp_path / "claude.pid"
+    script = (
+        f"import os, time; open({str(pid_file)!r}, 'w').write(str(os.getpid())); time.sleep(60)"
+    )
+    monkeypatch.setattr(ai_edit_streaming, "CLAUDE_COMMAND", (sys.executable, "-c", script))
+    chunk_path = tmp_path / "chunk_001.md"
+    chunk_path.write_text(PENDING)
+
+    async def run() -> int:
+        task = asyncio.ensure_future(stream_ai_edit_on_chunk(chunk_path, lambda text: None))
+        while not pid_file.exists() or not pid_file.read_text():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return int(pid_file.read_text())
+
+    pid = asyncio.run(run())
+    with pytest.raises(ProcessLookupError):
+        os.kill(pid, 0)
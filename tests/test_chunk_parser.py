@@ -0,0 +1,95 @@
+"""Tests for chunk file parsing"""
+
+from dataclasses import replace
+
+from meo.core.chunk_parser import parse_chunk_file
+
+
+CHUNK = """# Edit Task: chunk_001
+
+**Category:** Replace
+
+## Instructions
+
+**Direction:** Tighter
+
+Rewrite to be more concise and direct.
+
+## Text to Edit
+
+```
+First line
+Second line
+```
+
+## Your Response
+
+Write ONLY the edited text below. Do not include explanations or the original text.
+
+---
+"""
+
+
+def test_parse_chunk_file_pending(tmp_path):
+    """Test parsing a chunk file that has no response yet"""
+    chunk_path = tmp_path / "chunk_001.md"
+    chunk_path.write_text(CHUNK)
+
+    data = parse_chunk_file(chunk_path)
+    assert data.chunk_id == "chunk_001"
+    assert data.category == "Replace"
+    assert data.direction == "Tighter"
+    assert data.original_text == "First line\nSecond line"
+    assert data.ai_response is None
+    assert not data.has_response
+
+
+def test_parse_chunk_file_with_response(tmp_path):
+    """Test parsing a chunk file with a multi-line unicode response"""
+    chunk_path = tmp_path / "chunk_002.md"
+    chunk_path.write_text(CHUNK + "\nEdited ✓ line\n\nSecond — paragraph\n\n")
+
+    data = parse_chunk_file(chunk_path)
+    assert data.ai_response == "Edited ✓ line\n\nSecond — paragraph"
+    assert data.has_response
+
+
+def test_parse_chunk_file_missing_sections(tmp_path):
+    """Test the fallbacks when metadata and sections are missing"""
+    chunk_path = tmp_path / "chunk_003.md"
+    chunk_path.write_text("# Edit Task: chunk_003\n")
+
+    data = parse_chunk_file(chunk_path)
+    assert data.category == "Unknown"
+    assert data.direction is None
+    assert data.original_text == ""
+    assert data.ai_response is None
+
+
+def test_parse_chunk_file_ignores_markers_in_text(tmp_path):
+    """Test that marker lines inside the text to edit aren't taken as metadata"""
+    text = "**Direction:** Not this\n## Your Response\n---\nNor this"
+    chunk_path = tmp_path / "chunk_004.md"
+    chunk_path.write_text(CHUNK.replace("**Direction:** Tighter\n", "").replace(
+        "First line\nSecond line", text
+    ))
+
+    data = parse_chunk_file(chunk_path)
+    assert data.direction is None
+    assert data.original_text == text
+    assert data.ai_response is None
+
+
+def test_parse_chunk_file_normalized_original(tmp_path):
+    """Test that the LF-normalized original is computed once and reused"""
+    chunk_path = tmp_path / "chunk_005.md"
+    chunk_path.write_bytes(CHUNK.replace("First line\nSecond line", "First\r\nSecond").encode())
+
+    data = parse_chunk_file(chunk_path)
+    assert data.original_text == "First\r\nSecond"
+    assert data.normalized_original == "First\nSecond"
+    assert data.normalized_original is data.normalized_original
+
+    # An edited copy doesn't inherit the cached value
+    edited = replace(data, original_text="Edited\r\ntext")
+    assert edited.normalized_original == "Edited\ntext"
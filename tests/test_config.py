@@ -0,0 +1,67 @@
+"""Tests for config loading and saving"""
+
+import pytest
+
+import meo.core.config as config_module
+from meo.core.config import (
+    ConfigInvalidError,
+    ConfigNotFoundError,
+    create_config,
+    load_config,
+)
+
+
+def test_load_config_missing(in_tmp_cwd):
+    """Test load_config() without a config file"""
+    with pytest.raises(ConfigNotFoundError):
+        load_config()
+
+
+def test_load_config_reuses_parsed_config(in_tmp_cwd, monkeypatch):
+    """Test that an unchanged config file is only parsed once"""
+    # Written directly rather than saved, so the first load has to parse it
+    (in_tmp_cwd / ".meo").mkdir()
+    (in_tmp_cwd / ".meo" / "config.yaml").write_text(f"folder: {in_tmp_cwd}\n")
+    parsed = []
+    parse = config_module._parse_config_file
+
+    def counting_parse(path):
+        parsed.append(path)
+        return parse(path)
+
+    monkeypatch.setattr(config_module, "_parse_config_file", counting_parse)
+
+    first = load_config()
+    assert first.folder == str(in_tmp_cwd)
+    # Each load gets its own copy, so a caller's changes don't leak into the next
+    first.folder = "/elsewhere"
+    assert load_config().folder == str(in_tmp_cwd)
+    assert len(parsed) == 1
+
+
+def test_load_config_sees_rewrites(in_tmp_cwd):
+    """Test that saving or editing the config invalidates the cached result"""
+    create_config(str(in_tmp_cwd))
+    load_config()
+
+    other = in_tmp_cwd / "other"
+    other.mkdir()
+    create_config(str(other))
+    assert load_config().folder == str(other)
+
+    (in_tmp_cwd / ".meo" / "config.yaml").write_text("folder: relative/path\n")
+    with pytest.raises(ConfigInvalidError):
+        load_config()
+
+
+def test_load_config_after_save_skips_parse(in_tmp_cwd, monkeypatch):
+    """Test that a just-saved config is served without parsing the file again"""
+    config = create_config(str(in_tmp_cwd))
+
+    def fail(path):
+        raise AssertionError("config file was re-parsed")
+
+    monkeypatch.setattr(config_module, "_parse_config_file", fail)
+    loaded = load_config()
+    assert loaded == config
+    assert loaded is not config  # Later edits to `config` don't leak into the cache
@@ -0,0 +1,72 @@
+"""Tests for session git operations"""
+
+import pytest
+
+from meo.core.git_ops import (
+    commit_chunk_response,
+    get_commit_count,
+    get_original_vs_working_diff,
+    init_session_repo,
+    run_git,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_git_identity(tmp_path, monkeypatch):
+    """Hide any global git config so the session repo must supply its own identity"""
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(tmp_path / "no-gitconfig"))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    for var in ("GIT_AUTHOR_NAME", "GIT_AUTHOR_EMAIL", "GIT_COMMITTER_NAME", "GIT_COMMITTER_EMAIL"):
+        monkeypatch.delenv(var, raising=False)
+
+
+def test_init_session_repo_and_commit(tmp_path):
+    """Test that a session repo can be created and committed to"""
+    source = tmp_path / "doc.md"
+    source.write_bytes("# Title\n\nCafé\n".encode())
+    session_path = tmp_path / "session"
+
+    init_session_repo(session_path, source)
+    assert (session_path / "original.md").read_bytes() == source.read_bytes()
+
+    (session_path / "working.md").write_text("# Title\n\nEdited\n")
+    commit_chunk_response(session_path, "chunk_001")
+
+    assert get_commit_count(session_path) == 2
+    author = run_git(session_path, "log", "-1", "--format=%an <%ae>").stdout.strip()
+    assert author == "MEO <meo@local>"
+
+
+def test_commit_chunk_response_only_commits_working(tmp_path):
+    """Test that a chunk commit picks up working.md and nothing else"""
+    source = tmp_path / "doc.md"
+    source.write_text("original\n")
+    session_path = tmp_path / "session"
+    init_session_repo(session_path, source)
+
+    (session_path / "working.md").write_text("edited\n")
+    (session_path / "chunks" / "chunk_001.md").write_text("chunk\n")
+    commit_chunk_response(session_path, "chunk_001")
+
+    changed = run_git(session_path, "show", "--name-only", "--format=", "HEAD").stdout.split()
+    assert changed == ["working.md"]
+
+
+def test_get_original_vs_working_diff(tmp_path):
+    """Test the unified diff between the original and working copies"""
+    (tmp_path / "original.md").write_text("one\ntwo\n")
+    (tmp_path / "working.md").write_text("one\n2\n")
+
+    assert get_original_vs_working_diff(tmp_path) == (
+        "--- original.md\n+++ working.md\n@@ -1,2 +1,2 @@\n one\n-two\n+2\n"
+    )
+    (tmp_path / "working.md").write_text("one\ntwo\n")
+    assert get_original_vs_working_diff(tmp_path) == ""
+
+    # A last line without a newline is marked, as diff -u does
+    (tmp_path / "original.md").write_text("a\nb")
+    (tmp_path / "working.md").write_text("a\nc")
+    assert get_original_vs_working_diff(tmp_path) == (
+        "--- original.md\n+++ working.md\n@@ -1,2 +1,2 @@\n a\n"
+        "-b\n\\ No newline at end of file\n+c\n\\ No newline at end of file\n"
+    )
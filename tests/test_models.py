@@ -1,8 +1,15 @@
 """Tests for MEO models"""
 
+import os
+
 import pytest
+from pydantic import ValidationError
+
 from meo.models.chunk import Chunk, ChunkCategory, Location, TextRange
+from meo.models.config import MeoConfig
+from meo.models.direction import DirectionPreset
 from meo.models.project import ProjectState
+from meo.models.session import Session
 
 
 def test_text_range_contains():
@@ -40,6 +47,18 @@ def test_text_range_overlaps():
     assert not range1.overlaps(range3)  # Non-overlapping
 
 
+def test_text_range_is_immutable():
+    """Test that ranges can't change under their cached bounds"""
+    range_ = TextRange(start=Location(row=1, col=5), end=Location(row=3, col=10))
+    assert range_.bounds == ((1, 5), (3, 10))
+
+    with pytest.raises(ValidationError):
+        range_.start = Location(row=0, col=0)
+    with pytest.raises(ValidationError):
+        range_.end.row = 0
+    assert hash(range_) == hash(TextRange.model_validate(range_.model_dump()))
+
+
 def test_chunk_needs_direction():
     """Test Chunk.needs_direction property"""
     chunk_replace = Chunk(
@@ -63,6 +82,8 @@ def test_project_state_next_chunk_id():
     """Test ProjectState.next_chunk_id()"""
     state = ProjectState(source_file="test.md")
 
+    assert state.next_chunk_id() == "chunk_001"
+    # Asking doesn't use the ID up, e.g. for a selection that's then cancelled
     assert state.next_chunk_id() == "chunk_001"
 
     state.chunks.append(
@@ -75,3 +96,119 @@ def test_project_state_next_chunk_id():
     )
 
     assert state.next_chunk_id() == "chunk_002"
+
+    # Removed chunks' IDs aren't handed out again
+    state.add_chunk(_chunk("chunk_002", (1, 0), (1, 1)))
+    assert state.remove_chunk("chunk_002")
+    assert state.next_chunk_id() == "chunk_003"
+
+    # Loaded chunks seed the counter
+    loaded = ProjectState.model_validate({"source_file": "test.md", "chunks": [
+        _chunk("chunk_041", (0, 0), (0, 1)).model_dump()
+    ]})
+    assert loaded.next_chunk_id() == "chunk_042"
+
+
+def _chunk(chunk_id, start, end):
+    return Chunk(
+        id=chunk_id,
+        range=TextRange(
+            start=Location(row=start[0], col=start[1]), end=Location(row=end[0], col=end[1])
+        ),
+        category=ChunkCategory.REPLACE,
+        original_text="test",
+    )
+
+
+def test_project_state_add_chunk_overlaps():
+    """Test ProjectState.add_chunk() rejects only overlapping ranges"""
+    state = ProjectState(source_file="test.md")
+    state.add_chunk(_chunk("chunk_001", (2, 0), (2, 10)))
+    state.add_chunk(_chunk("chunk_002", (0, 0), (1, 5)))
+    state.add_chunk(_chunk("chunk_003", (2, 11), (3, 0)))
+
+    with pytest.raises(ValueError, match="chunk_001"):
+        state.add_chunk(_chunk("chunk_004", (1, 6), (2, 0)))
+    with pytest.raises(ValueError, match="chunk_003"):
+        state.add_chunk(_chunk("chunk_004", (3, 0), (4, 0)))
+    assert state.find_overlap(_chunk("x", (1, 6), (1, 9)).range) is None
+
+    assert state.remove_chunk("chunk_001")
+    state.add_chunk(_chunk("chunk_004", (1, 6), (2, 0)))
+
+    # Chunks changed directly are picked up too, even with the same length
+    state.chunks = [_chunk(f"chunk_00{n}", (n, 0), (n, 9)) for n in (5, 6, 7)]
+    state.add_chunk(_chunk("chunk_008", (2, 0), (2, 10)))
+    with pytest.raises(ValueError, match="chunk_005"):
+        state.add_chunk(_chunk("chunk_009", (5, 5), (5, 6)))
+    state.chunks = []
+    assert state.find_overlap(_chunk("x", (0, 0), (9, 0)).range) is None
+
+
+def test_project_state_chunks_needing_direction():
+    """Test that the cached chunks needing direction follow chunk changes"""
+    state = ProjectState(source_file="test.md")
+    state.add_chunk(_chunk("chunk_001", (0, 0), (0, 5)))
+    lock = _chunk("chunk_002", (1, 0), (1, 5))
+    lock.category = ChunkCategory.LOCK
+    state.add_chunk(lock)
+    assert [c.id for c in state.get_chunks_needing_direction()] == ["chunk_001"]
+
+    state.add_chunk(_chunk("chunk_003", (2, 0), (2, 5)))
+    assert [c.id for c in state.get_chunks_needing_direction()] == ["chunk_001", "chunk_003"]
+    state.remove_chunk("chunk_001")
+    assert [c.id for c in state.get_chunks_needing_direction()] == ["chunk_003"]
+    state.chunks = [lock]
+    assert state.get_chunks_needing_direction() == []
+
+
+def test_config_has_markdown_files(tmp_path):
+    """Test MeoConfig.has_markdown_files()"""
+    config = MeoConfig(folder=str(tmp_path))
+    assert not config.has_markdown_files()
+
+    (tmp_path / "notes.txt").write_text("")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "nested.md").write_text("")
+    assert not config.has_markdown_files()  # non-recursive, like get_markdown_files
+
+    (tmp_path / "doc.md").write_text("")
+    assert config.has_markdown_files()
+
+
+def test_config_get_markdown_files(tmp_path):
+    """Test MeoConfig.get_markdown_files() sees files added after a listing"""
+    config = MeoConfig(folder=str(tmp_path))
+    (tmp_path / "b.md").write_text("")
+    (tmp_path / "notes.txt").write_text("")
+    (tmp_path / "dir.md").mkdir()
+    assert config.get_markdown_files() == [tmp_path / "b.md"]
+
+    (tmp_path / "a.md").write_text("")
+    assert config.get_markdown_files() == [tmp_path / "a.md", tmp_path / "b.md"]
+
+    # A forced rescan sees changes the folder mtime doesn't show
+    mtime_ns = tmp_path.stat().st_mtime_ns
+    (tmp_path / "c.md").write_text("")
+    os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
+    assert len(config.get_markdown_files()) == 2
+    assert len(config.get_markdown_files(rescan=True)) == 3
+    assert MeoConfig(folder=str(tmp_path / "missing")).get_markdown_files() == []
+
+
+def test_direction_preset_render():
+    """Test DirectionPreset.render() with and without an annotation"""
+    preset = DirectionPreset(id="p", name="P", description="", prompt_template="Do it.")
+    assert preset.render() == "Do it."
+    assert preset.render("") == "Do it."
+    assert preset.render("Briefly") == "Do it.\n\n**User's additional guidance:** Briefly"
+
+
+def test_session_pending_chunks():
+    """Test that pending chunks keep execution order and exclude reviewed ones"""
+    session = Session(id="s", source_file="/tmp/s.md", chunks=["c1", "c2", "c3", "c4"])
+    session.mark_chunk_applied("c3")
+    session.mark_chunk_skipped("c1")
+
+    assert session.get_pending_chunks() == ["c2", "c4"]
+    assert not session.is_complete()
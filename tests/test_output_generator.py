@@ -0,0 +1,30 @@
+"""Tests for AI-consumable output generation"""
+
+from meo.core.output_generator import generate_output
+from meo.models.chunk import ChunkCategory
+from meo.models.project import ProjectState
+
+
+def test_generate_output_tasks(make_chunk):
+    """Test the per-category task sections, in execution order"""
+    state = ProjectState(source_file="doc.md", chunks=[
+        make_chunk("chunk_001", 0, ChunkCategory.REPLACE, "Uses {braces}",
+                   direction_preset="tighter", execution_order=2),
+        make_chunk("chunk_002", 2, ChunkCategory.TWEAK, "Plain", execution_order=1),
+        make_chunk("chunk_003", 4, ChunkCategory.LOCK, "Locked"),
+    ])
+
+    output = generate_output(state)
+    assert "**Total Tasks:** 2\n" in output
+    assert output.index("## Task 1: chunk_002") < output.index("## Task 2: chunk_001")
+    assert (
+        "## Task 1: chunk_002\n\n**Category:** Tweak\n\n### Context Visibility\n"
+    ) in output
+    assert (
+        "### Text to Tweak\n```\nPlain\n```\n\n"
+        "### Instructions\nMake minor adjustments to improve this text.\n\n---\n\n"
+    ) in output
+    assert "**Category:** Replace\n**Direction:** Tighter\n\n" in output
+    assert "### Text to Replace\n```\nUses {braces}\n```\n" in output
+    assert "Locked" not in output
+    assert output.endswith("### Response: chunk_001\n[edited text here]\n\n```")
@@ -0,0 +1,205 @@
+"""Tests for the processing screen's progress handling"""
+
+import asyncio
+import threading
+from pathlib import Path
+
+from textual.app import App
+
+from meo.core.ai_edit_streaming import StreamProgress
+from meo.models.session import Session
+from meo.tui.screens.processing import MAX_STREAM_CHARS, ProcessingScreen, ProgressQueue
+
+
+class _Screen(ProcessingScreen):
+    """ProcessingScreen without the Claude worker; updates are fed in by the test"""
+
+    def run_processing(self) -> None:
+        pass
+
+
+def _progress(chunk_id: str, status: str, delta: str = "", completed: int = 0) -> StreamProgress:
+    return StreamProgress(
+        chunk_index=int(chunk_id[-1]) - 1,
+        total_chunks=3,
+        chunk_id=chunk_id,
+        status=status,
+        text="",
+        completed_chunks=completed,
+        delta=delta,
+    )
+
+
+def _run_on_screen(check) -> None:
+    """Mount a processing screen and call (or await) check(screen) on it"""
+    screen = _Screen(Session(id="s", source_file="/tmp/s.md", chunks=["c1", "c2", "c3"]), Path("."))
+
+    class _App(App):
+        def on_mount(self) -> None:
+            self.push_screen(screen)
+
+    async def run() -> None:
+        async with _App().run_test() as pilot:
+            await pilot.pause()
+            result = check(screen)
+            if asyncio.iscoroutine(result):
+                await result
+
+    asyncio.run(run())
+
+
+def _feed(screen: ProcessingScreen, *updates: StreamProgress) -> None:
+    for progress in updates:
+        screen._update_ui(progress)
+    screen._flush_stream()
+
+
+def test_stream_view_follows_one_chunk_at_a_time():
+    """Test that concurrent chunks don't take over the view until the shown one finishes"""
+    def check(screen):
+        view = screen._stream_output
+        _feed(
+            screen,
+            _progress("chunk_1", "starting"),
+            _progress("chunk_2", "starting"),
+            _progress("chunk_1", "streaming", "A1 "),
+            _progress("chunk_2", "streaming", "B1 "),
+            _progress("chunk_1", "streaming", "A2 "),
+        )
+        assert view.text == "--- chunk_1 ---\nA1 A2 "
+
+        # chunk_2's output so far is shown once chunk_1 is done
+        _feed(screen, _progress("chunk_2", "streaming", "B2 "), _progress("chunk_1", "complete"))
+        assert view.text == "--- chunk_2 ---\nB1 B2 "
+        _feed(screen, _progress("chunk_2", "streaming", "B3"))
+        assert view.text == "--- chunk_2 ---\nB1 B2 B3"
+
+        # The last output stays up until another chunk starts
+        _feed(screen, _progress("chunk_2", "complete"))
+        assert view.text == "--- chunk_2 ---\nB1 B2 B3"
+        _feed(screen, _progress("chunk_3", "starting"))
+        assert view.text == "--- chunk_3 ---\n"
+
+    _run_on_screen(check)
+
+
+def test_progress_queue_coalesces_streaming_updates():
+    """Test that a chunk's streaming updates are kept as its latest one, with all their text"""
+    queue = ProgressQueue()
+    assert queue.put(_progress("chunk_1", "streaming", "a", completed=0))
+    assert not queue.put(_progress("chunk_1", "streaming", "b", completed=1))
+    assert not queue.put(_progress("chunk_1", "streaming", "c", completed=2))
+
+    (update,) = queue.take()
+    assert update.delta == "abc"
+    assert update.completed_chunks == 2
+    assert queue.take() == []
+    # Once taken, the next update needs telling the UI about again
+    assert queue.put(_progress("chunk_1", "streaming", "d"))
+
+
+def test_progress_queue_orders_pending_text_before_status_change():
+    """Test that text queued for a chunk comes before its status change, and later text after it"""
+    queue = ProgressQueue()
+    for progress in [
+        _progress("chunk_1", "streaming", "a"),
+        _progress("chunk_2", "starting"),
+        _progress("chunk_1", "streaming", "b"),
+        _progress("chunk_1", "complete"),
+        _progress("chunk_2", "streaming", "x"),
+        _progress("chunk_1", "streaming", "late"),
+    ]:
+        queue.put(progress)
+
+    updates = [(p.chunk_id, p.status, p.delta) for p in queue.take()]
+    assert updates == [
+        ("chunk_1", "streaming", "ab"),
+        ("chunk_2", "starting", ""),
+        ("chunk_1", "complete", ""),
+        ("chunk_2", "streaming", "x"),
+        ("chunk_1", "streaming", "late"),
+    ]
+
+
+def test_progress_queue_from_threads():
+    """Test that no text is lost when several worker threads put updates at once"""
+    queue = ProgressQueue()
+    taken = []
+
+    def worker(chunk_id: str) -> None:
+        for i in range(500):
+            queue.put(_progress(chunk_id, "streaming", f"{i},"))
+            if i % 50 == 0:
+                taken.extend(queue.take())
+
+    threads = [threading.Thread(target=worker, args=(f"chunk_{n}",)) for n in (1, 2, 3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    taken.extend(queue.take())
+
+    expected = "".join(f"{i}," for i in range(500))
+    for n in (1, 2, 3):
+        assert "".join(p.delta for p in taken if p.chunk_id == f"chunk_{n}") == expected
+
+
+def test_progress_posted_from_worker_thread():
+    """Test that updates posted from another thread all reach the view, in order"""
+    async def check(screen):
+        def worker():
+            screen._on_progress(_progress("chunk_1", "starting"))
+            for i in range(200):
+                screen._on_progress(_progress("chunk_1", "streaming", f"{i} "))
+            screen._on_progress(_progress("chunk_1", "complete"))
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        while thread.is_alive():
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.1)
+        expected = "".join(f"{i} " for i in range(200))
+        assert screen._stream_output.text == "--- chunk_1 ---\n" + expected
+
+    _run_on_screen(check)
+
+
+def test_stream_view_appends_until_chunk_changes():
+    """Test that new text is appended to the view, which is only replaced for another chunk"""
+    def check(screen):
+        replaced = []
+        set_stream_text = screen._set_stream_text
+        screen._set_stream_text = lambda text: (replaced.append(text), set_stream_text(text))
+
+        _feed(screen, _progress("chunk_1", "starting"))
+        for delta in ["one ", "two ", "three"]:
+            _feed(screen, _progress("chunk_1", "streaming", delta))
+        assert screen._stream_output.text == "--- chunk_1 ---\none two three"
+        assert replaced == ["--- chunk_1 ---\n"]
+
+        _feed(screen, _progress("chunk_1", "complete"), _progress("chunk_2", "starting"))
+        assert replaced == ["--- chunk_1 ---\n", "--- chunk_2 ---\n"]
+
+    _run_on_screen(check)
+
+
+def test_stream_view_keeps_only_the_tail():
+    """Test that the view is capped at MAX_STREAM_CHARS, dropping the oldest text"""
+    def check(screen):
+        line = "x" * 99 + "\n"
+        _feed(screen, _progress("chunk_1", "starting"))
+        for i in range(300):
+            _feed(screen, _progress("chunk_1", "streaming", f"{i:03}" + line))
+
+        text = screen._stream_output.text
+        assert len(text) == MAX_STREAM_CHARS
+        assert text.endswith("299" + line)
+        assert screen._stream_length == MAX_STREAM_CHARS
+
+        # Switching chunks keeps only the tail of the output so far too
+        big = "y" * (MAX_STREAM_CHARS + 10)
+        _feed(screen, _progress("chunk_2", "starting"), _progress("chunk_2", "streaming", big))
+        _feed(screen, _progress("chunk_1", "complete"))
+        assert screen._stream_output.text == big[-MAX_STREAM_CHARS:]
+
+    _run_on_screen(check)
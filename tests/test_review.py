@@ -0,0 +1,54 @@
+"""Tests for approving chunks on the review screen"""
+
+import asyncio
+
+from textual.app import App
+
+import meo.tui.screens.review_v2 as review_v2
+from meo.core.session import create_session, get_session_path
+from meo.core.sidecar import create_new_project
+from meo.models.chunk import ChunkCategory
+from meo.tui.screens.review_v2 import ReviewScreenV2
+
+
+def test_approve_keeps_chunk_applied_when_commit_fails(in_tmp_cwd, make_chunk, monkeypatch):
+    """Test that a failed git commit is reported without putting the chunk back up"""
+    source = in_tmp_cwd / "doc.md"
+    source.write_text("# Title\n\nFirst paragraph.\n\nSecond paragraph.\n")
+    state = create_new_project(source)
+    state.add_chunk(make_chunk("chunk_001", 2, ChunkCategory.REPLACE, "First paragraph.",
+                               direction_preset="tighter"))
+    state.add_chunk(make_chunk("chunk_002", 4, ChunkCategory.REPLACE, "Second paragraph.",
+                               direction_preset="tighter"))
+    session = create_session(source, state)
+    session_path = get_session_path(session.id)
+    chunk_file = session_path / "chunks" / "chunk_001.md"
+    chunk_file.write_text(chunk_file.read_text() + "\nFirst, shorter.\n")
+
+    def fail_commit(*args):
+        raise RuntimeError("index.lock exists")
+
+    monkeypatch.setattr(review_v2, "commit_chunk_response", fail_commit)
+    screen = ReviewScreenV2(session, session_path)
+    notes = []
+    monkeypatch.setattr(screen, "notify", lambda message, **kwargs: notes.append(message))
+
+    class _App(App):
+        def on_mount(self) -> None:
+            self.push_screen(screen)
+
+    async def run() -> None:
+        async with _App().run_test() as pilot:
+            await pilot.pause()
+            await pilot.press("enter")
+            await pilot.app.workers.wait_for_complete()
+            await pilot.pause()
+
+    asyncio.run(run())
+
+    assert "Git commit failed: index.lock exists" in notes
+    assert screen.review_ids == ["chunk_002"]
+    assert session.applied_chunks == ["chunk_001"]
+    expected = "# Title\n\nFirst, shorter.\n\nSecond paragraph.\n"
+    assert (session_path / "working.md").read_text() == expected
+    assert source.read_text() == expected
@@ -0,0 +1,141 @@
+"""Tests for editing sessions"""
+
+import yaml
+
+from meo.core.chunk_parser import parse_chunk_file
+from meo.core.session import (
+    LEGACY_SESSION_FILE,
+    LockedChunks,
+    MANIFEST_FILE,
+    SESSION_FILE,
+    generate_atomic_file,
+    get_session_path,
+    get_sessions_dir,
+    list_session_summaries,
+    list_sessions,
+    load_session,
+    save_session,
+    save_session_delta,
+)
+from meo.models.chunk import ChunkCategory, LockType
+from meo.models.project import ProjectState
+from meo.models.session import Session
+
+
+def _write_session(session_id: str, **kwargs) -> Session:
+    session = Session(id=session_id, source_file="/docs/doc.md", chunks=["c1", "c2"], **kwargs)
+    session_path = get_session_path(session_id)
+    session_path.mkdir(parents=True)
+    save_session(session, session_path)
+    return session
+
+
+def test_list_session_summaries_uses_latest_save(in_tmp_cwd):
+    """Test that the last save of a session wins and the manifest is compacted"""
+    session = _write_session("doc_1")
+    session.status = "editing"
+    session.applied_chunks = ["c1"]
+    save_session(session, get_session_path("doc_1"))
+
+    (summary,) = list_session_summaries()
+    assert (summary.id, summary.status, summary.applied, summary.total) == (
+        "doc_1", "editing", 1, 2
+    )
+    manifest = get_sessions_dir() / MANIFEST_FILE
+    assert len(manifest.read_text().splitlines()) == 1
+
+
+def test_save_session_adds_manifest_line_only_on_change(in_tmp_cwd):
+    """Test that saves leaving a session's summary unchanged don't grow the manifest"""
+    session = _write_session("doc_1")
+    session_path = get_session_path("doc_1")
+    manifest = get_sessions_dir() / MANIFEST_FILE
+
+    save_session(session, session_path)
+    save_session_delta(session_path, {"status": session.status})
+    assert len(manifest.read_text().splitlines()) == 1
+
+    save_session_delta(session_path, {"applied_chunks": ["c1"]})
+    assert len(manifest.read_text().splitlines()) == 2
+
+
+def test_save_session_delta(in_tmp_cwd):
+    """Test that a delta save updates only the patched fields, and the manifest"""
+    session = _write_session("doc_1", status="reviewing")
+    session_path = get_session_path("doc_1")
+
+    save_session_delta(session_path, {"applied_chunks": ["c2"], "skipped_chunks": ["c1"]})
+
+    for trusted in (True, False):
+        loaded = load_session("doc_1", trusted=trusted)
+        assert (loaded.applied_chunks, loaded.skipped_chunks) == (["c2"], ["c1"])
+        assert (loaded.status, loaded.created_at) == ("reviewing", session.created_at)
+    (summary,) = list_session_summaries()
+    assert (summary.applied, summary.skipped) == (1, 1)
+
+
+def test_list_session_summaries_rebuilds_manifest(in_tmp_cwd):
+    """Test that sessions missing from the manifest are loaded from disk"""
+    _write_session("doc_1")
+    _write_session("doc_2", status="complete")
+    (get_sessions_dir() / MANIFEST_FILE).write_text('{"id": "gone", "torn\n')
+
+    summaries = {s.id: s for s in list_session_summaries()}
+    assert sorted(summaries) == ["doc_1", "doc_2"]
+    assert summaries["doc_2"].status == "complete"
+
+
+def test_load_session_migrates_yaml(in_tmp_cwd):
+    """Test that YAML session metadata is loaded and rewritten as JSON"""
+    session = Session(id="doc_1", source_file="/docs/doc.md", chunks=["c1"], status="editing")
+    session_path = get_session_path("doc_1")
+    session_path.mkdir(parents=True)
+    (session_path / LEGACY_SESSION_FILE).write_text(yaml.safe_dump(session.model_dump(mode="json")))
+
+    assert list_sessions() == ["doc_1"]
+    assert load_session("doc_1") == session
+    assert not (session_path / LEGACY_SESSION_FILE).exists()
+    assert load_session("doc_1") == session
+    assert (session_path / SESSION_FILE).exists()
+
+
+def test_generate_atomic_file_round_trip(tmp_path, make_chunk):
+    """Test that a generated chunk file parses back to its chunk's details"""
+    target = make_chunk(
+        "chunk_002", 2, ChunkCategory.REPLACE, "Edit {me}", direction_preset="tighter"
+    )
+    state = ProjectState(source_file="doc.md", chunks=[
+        make_chunk("chunk_001", 0, ChunkCategory.LOCK, "Before", lock_type=LockType.EXAMPLE),
+        target,
+        make_chunk("chunk_003", 4, ChunkCategory.LOCK, "After", annotation="facts"),
+    ])
+
+    (tmp_path / "chunks").mkdir()
+    content = generate_atomic_file(target, tmp_path, state).read_text()
+    assert content.index("Before") < content.index("YOUR TEXT TO EDIT") < content.index("After")
+    assert "### chunk_003 [Context]\n**User's guidance:** facts\n" in content
+
+    data = parse_chunk_file(tmp_path / "chunks" / "chunk_002.md")
+    assert (data.category, data.direction) == ("Replace", "Tighter")
+    assert data.original_text == "Edit {me}"
+    assert not data.has_response
+
+
+def test_locked_chunks_split(make_chunk):
+    """Test splitting locked chunks around a row, excluding ones sharing it"""
+    state = ProjectState(source_file="doc.md", chunks=[
+        make_chunk(f"chunk_{row:03d}", row, ChunkCategory.LOCK, "x") for row in (7, 1, 5, 3)
+    ])
+    locked = LockedChunks.from_state(state)
+
+    before, after = locked.split(5)
+    assert [c.id for c in before] == ["chunk_001", "chunk_003"]
+    assert [c.id for c in after] == ["chunk_007"]
+
+
+def test_list_session_summaries_skips_incomplete_sessions(in_tmp_cwd):
+    """Test that a session directory without metadata yet isn't summarized"""
+    _write_session("doc_1")
+    get_session_path("doc_2").mkdir()
+
+    assert [s.id for s in list_session_summaries()] == ["doc_1"]
@@ -0,0 +1,133 @@
+"""Tests for sidecar persistence"""
+
+import hashlib
+import os
+
+import pytest
+import yaml
+
+import meo.core.sidecar as sidecar_module
+from meo.core.sidecar import (
+    HASH_ALGO,
+    check_source_changed,
+    compute_file_hash,
+    create_new_project,
+    get_legacy_sidecar_path,
+    get_sidecar_path,
+    load_sidecar,
+    save_sidecar,
+)
+from meo.models.chunk import Chunk, ChunkCategory, Location, LockType, TextRange
+from meo.models.project import ProjectState
+
+
+def test_compute_file_hash_matches_hashlib(tmp_path):
+    """Test compute_file_hash() for the default and legacy algorithms"""
+    source = tmp_path / "doc.md"
+    source.write_bytes(b"# Title\n\nSome text\n")
+
+    expected = hashlib.blake2b(source.read_bytes(), digest_size=16).hexdigest()
+    assert compute_file_hash(source) == expected
+    assert compute_file_hash(source, "md5") == hashlib.md5(source.read_bytes()).hexdigest()
+
+
+def test_check_source_changed(tmp_path):
+    """Test check_source_changed() detects edits"""
+    source = tmp_path / "doc.md"
+    source.write_text("original\n")
+    state = create_new_project(source)
+
+    assert not check_source_changed(source, state)
+    source.write_text("edited\n")
+    assert check_source_changed(source, state)
+
+
+def test_load_sidecar_upgrades_legacy_hash(tmp_path):
+    """Test that an MD5 sidecar is rehashed when the source is unchanged"""
+    source = tmp_path / "doc.md"
+    source.write_text("original\n")
+    legacy = ProjectState(
+        source_file=str(source),
+        source_hash=hashlib.md5(source.read_bytes()).hexdigest(),
+    )
+    save_sidecar(source, legacy)
+
+    state = load_sidecar(source)
+    assert state.hash_algo == HASH_ALGO
+    assert state.source_hash == compute_file_hash(source)
+    assert not check_source_changed(source, state)
+
+
+def test_load_sidecar_keeps_stale_legacy_hash(tmp_path):
+    """Test that an MD5 sidecar for an edited source still reports the change"""
+    source = tmp_path / "doc.md"
+    source.write_text("original\n")
+    legacy = ProjectState(
+        source_file=str(source),
+        source_hash=hashlib.md5(source.read_bytes()).hexdigest(),
+    )
+    save_sidecar(source, legacy)
+    source.write_text("edited\n")
+
+    state = load_sidecar(source)
+    assert state.hash_algo == "md5"
+    assert check_source_changed(source, state)
+
+
+def test_load_sidecar_migrates_yaml(tmp_path):
+    """Test that a YAML sidecar is loaded and rewritten as JSON"""
+    source = tmp_path / "doc.md"
+    source.write_text("original\n")
+    state = create_new_project(source)
+    legacy_path = get_legacy_sidecar_path(source)
+    legacy_path.write_text(yaml.safe_dump(state.model_dump(mode="json")))
+
+    loaded = load_sidecar(source)
+    assert loaded.source_hash == state.source_hash
+    assert not legacy_path.exists()
+    assert get_sidecar_path(source).exists()
+    assert load_sidecar(source) == loaded
+
+
+def test_load_sidecar_trusted(tmp_path):
+    """Test that a trusted reload matches a validated one, unless the file was edited"""
+    source = tmp_path / "doc.md"
+    source.write_text("original\n")
+    state = create_new_project(source)
+    state.chunks = [Chunk(
+        id="chunk_001",
+        range=TextRange(start=Location(row=0, col=0), end=Location(row=0, col=8)),
+        category=ChunkCategory.LOCK,
+        original_text="original",
+        lock_type=LockType.EXAMPLE,
+    )]
+    save_sidecar(source, state)
+
+    trusted = load_sidecar(source, trusted=True)
+    assert trusted == load_sidecar(source)
+    assert trusted.chunks[0].category is ChunkCategory.LOCK
+
+    sidecar_path = get_sidecar_path(source)
+    sidecar_path.write_text(sidecar_path.read_text().replace('"row": 0', '"row": "zero"', 1))
+    with pytest.raises(ValueError):
+        load_sidecar(source, trusted=True)
+
+
+def test_check_source_changed_skips_hash_when_untouched(tmp_path, monkeypatch):
+    """Test that an untouched source isn't rehashed and a touched one is"""
+    source = tmp_path / "doc.md"
+    source.write_text("original\n")
+    state = create_new_project(source)
+
+    def fail(*args):
+        raise AssertionError("source was rehashed")
+
+    with monkeypatch.context() as m:
+        m.setattr(sidecar_module, "compute_file_hash", fail)
+        assert not check_source_changed(source, state)
+
+    # Same content, new mtime: hashed once, then the new stat is remembered
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert not check_source_changed(source, state)
+    assert state.source_mtime_ns == source.stat().st_mtime_ns
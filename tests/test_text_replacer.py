@@ -0,0 +1,130 @@
+"""Tests for applying AI responses to working files"""
+
+import meo.core.text_replacer as text_replacer
+from meo.core.text_replacer import (
+    apply_chunk_to_file,
+    apply_chunk_to_working,
+    apply_chunk_to_working_content,
+    apply_chunks_to_file,
+    find_and_replace_text,
+    normalize_newlines,
+    validate_text_exists,
+)
+
+
+def test_find_and_replace_first_occurrence():
+    """Test that only the first occurrence is replaced"""
+    assert find_and_replace_text("a b a b", "a", "x") == ("x b a b", True)
+    assert find_and_replace_text("abc", "zzz", "x") == ("abc", False)
+    assert find_and_replace_text("abc", "", "x") == ("abc", False)
+
+
+def test_find_and_replace_crlf():
+    """Test that CRLF content and needles match their LF forms"""
+    assert find_and_replace_text("one\r\ntwo\r\nthree", "two\nthree", "2") == ("one\n2", True)
+    assert find_and_replace_text("one\ntwo\n", "one\r\ntwo", "1") == ("1\n", True)
+    assert validate_text_exists("one\r\ntwo", "one\ntwo")
+
+
+def test_find_and_replace_strip_fallback():
+    """Test the fallback for originals captured with extra whitespace"""
+    assert find_and_replace_text("# Title\nBody text.\n", "\n Body text.  \n\n", " New.\n") == (
+        "# Title\nNew.\n",
+        True,
+    )
+
+
+def test_apply_chunk_to_file(tmp_path):
+    """Test applying a replacement to a file, and leaving it alone on a miss"""
+    path = tmp_path / "working.md"
+    path.write_text("Intro\n\nOld paragraph — é\n\nOutro\n")
+
+    assert apply_chunk_to_file(path, "Old paragraph — é", "New paragraph ✓")
+    assert path.read_text() == "Intro\n\nNew paragraph ✓\n\nOutro\n"
+    assert not (tmp_path / "working.md.tmp").exists()
+    assert not apply_chunk_to_file(path, "Old paragraph — é", "Again")
+    assert path.read_text() == "Intro\n\nNew paragraph ✓\n\nOutro\n"
+    assert not apply_chunk_to_file(tmp_path / "missing.md", "a", "b")
+
+
+def test_apply_chunk_to_large_file(tmp_path, monkeypatch):
+    """Test that the mmap path for large files matches the text path"""
+    monkeypatch.setattr(text_replacer, "MMAP_THRESHOLD", 0)
+    path = tmp_path / "working.md"
+    path.write_text("Intro — é\n\nOld paragraph\n\nOld paragraph\n")
+
+    assert apply_chunk_to_file(path, "Old paragraph", "New ✓")
+    assert path.read_text() == "Intro — é\n\nNew ✓\n\nOld paragraph\n"
+    assert not (tmp_path / "working.md.tmp").exists()
+
+    # Whitespace fallback and CRLF files still go through the text path
+    assert apply_chunk_to_file(path, "\nOld paragraph\n\n", "Fallback")
+    assert path.read_text() == "Intro — é\n\nNew ✓\n\nFallback\n"
+    path.write_bytes(b"one\r\ntwo\r\n")
+    assert apply_chunk_to_file(path, "one\ntwo", "1")
+    assert path.read_text() == "1\n"
+
+
+def test_apply_chunk_to_file_keeps_links(tmp_path, monkeypatch):
+    """Test that the source file is written in place, through symlinks and hard links"""
+    for threshold in (text_replacer.MMAP_THRESHOLD, 0):
+        monkeypatch.setattr(text_replacer, "MMAP_THRESHOLD", threshold)
+        real = tmp_path / f"real{threshold}.md"
+        real.write_text("Keep this.\n\nOld paragraph\n\nAnd this.\n")
+        hard = tmp_path / f"hard{threshold}.md"
+        hard.hardlink_to(real)
+        link = tmp_path / f"link{threshold}.md"
+        link.symlink_to(real)
+
+        assert apply_chunk_to_file(link, "Old paragraph", "A longer new paragraph")
+        assert link.is_symlink()
+        assert hard.read_text() == "Keep this.\n\nA longer new paragraph\n\nAnd this.\n"
+        assert apply_chunks_to_file(link, [("A longer new paragraph", "Short")]) == [True]
+        assert link.is_symlink()
+        assert hard.read_text() == "Keep this.\n\nShort\n\nAnd this.\n"
+
+
+def test_apply_chunk_to_working_content_matches_file(tmp_path):
+    """Test that applying to in-memory content leaves working.md as applying to the file does"""
+    for text in ("Intro\nOld — é\nOutro\n", "Intro\r\nOld — é\r\nOutro\r\n"):
+        for original in ("Old — é", "\nOld — é  \n", "Missing"):
+            expected_dir = tmp_path / "expected"
+            actual_dir = tmp_path / "actual"
+            for d in (expected_dir, actual_dir):
+                d.mkdir(exist_ok=True)
+                (d / "working.md").write_bytes(text.encode("utf-8"))
+
+            applied = apply_chunk_to_working(expected_dir, original, "New ✓")
+            content = (actual_dir / "working.md").read_text(encoding="utf-8")
+            new_content = apply_chunk_to_working_content(actual_dir, content, original, "New ✓")
+
+            assert (new_content is not None) == applied
+            expected = (expected_dir / "working.md").read_bytes()
+            assert (actual_dir / "working.md").read_bytes() == expected
+            if applied:
+                assert (expected_dir / "working.md").read_text(encoding="utf-8") == new_content
+
+
+def test_apply_chunks_to_file_matches_sequential(tmp_path):
+    """Test that a batch gives the same result as applying one at a time"""
+    text = "# T\r\n\r\nSame\r\n\r\nOther — é\r\n\r\nSame\r\n\r\nLast\r\n"
+    replacements = [
+        ("Other — é", "B"), ("Same", "A1"), ("Same", "A2"), ("\nLast\n", " C "), ("Gone", "x")
+    ]
+
+    batch = tmp_path / "batch.md"
+    batch.write_bytes(text.encode("utf-8"))
+    one_by_one = tmp_path / "one_by_one.md"
+    one_by_one.write_bytes(text.encode("utf-8"))
+
+    expected = [apply_chunk_to_file(one_by_one, o, r) for o, r in replacements]
+    assert apply_chunks_to_file(batch, replacements) == expected == [True, True, True, True, False]
+    assert batch.read_bytes() == one_by_one.read_bytes()
+    assert apply_chunks_to_file(tmp_path / "missing.md", replacements[:1]) == [False]
+
+
+def test_normalize_newlines_without_cr_is_not_copied():
+    """Test that LF-only text is returned as is"""
+    text = "one\ntwo\n" * 100
+    assert normalize_newlines(text) is text
+    assert normalize_newlines("one\r\ntwo\r\n") == "one\ntwo\n"